@@ -4,15 +4,35 @@ import re
 import time
 import random
 import io
+import asyncio
+import concurrent.futures
+import threading
+import aiohttp
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
 import requests
-import tempfile
-import whisper
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
+from pydub import AudioSegment
 from dotenv import load_dotenv
 import platform
-from PIL import Image
 import json
 import logging
+import atexit
+import glob
+import multiprocessing
+import sqlite3
+import hashlib
+from urllib.parse import urljoin, urldefrag
+from html.parser import HTMLParser
+
+try:
+	from vosk import Model as VoskModel, KaldiRecognizer, SetLogLevel
+except ImportError:
+	VoskModel = None
 
 # Load environment variables
 load_dotenv()
@@ -29,113 +49,249 @@ BASE_URL = "https://www.canlii.org"
 START_URL = "https://www.canlii.org/ca"
 SECTION_TITLE = "Boards and Tribunals"
 WAIT_MS = 2000
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:135.0) Gecko/20100101 Firefox/135.0"  # Browser context and direct downloads share it
 
 # Bedrock CAPTCHA solver configuration
 BEDROCK_MODEL_ID = "qwen.qwen3-vl-235b-a22b"  # Qwen model for vision tasks
 BEDROCK_REGION = os.getenv("AWS_REGION", "us-east-1")
 MAX_CAPTCHA_ATTEMPTS = 50  # Maximum attempts to solve CAPTCHA
+CAPTCHA_BACKOFF_BASE = 0.5  # Seconds; backoff ceiling doubles after each failed attempt
+CAPTCHA_BACKOFF_CAP = 30  # Seconds; longest backoff between CAPTCHA attempts
+BEDROCK_CAPTCHA_PROMPT = (
+	"Read the captcha text in this image. Only output the exact characters you see, "
+	"nothing else. The captcha contains alphanumeric characters. Do not include any spaces or special characters."
+)
 S3_BUCKET_NAME = "can-judgements"
-TRACKING_FILE = "boards_tracking.json"
+TRACKING_DB = "boards_tracking.db"  # SQLite in WAL mode, shared safely by all worker processes
+LEGACY_TRACKING_FILE = "boards_tracking.json"  # Old single-JSON format, imported on load
+LEGACY_TRACKING_LOG = "boards_tracking.jsonl"  # Old append-only log, imported on load
+LEGACY_TRACKING_SHARDS = "boards_tracking.worker*.jsonl"  # Old per-worker logs, imported on load
+SCRAPER_WORKERS = int(os.getenv("SCRAPER_WORKERS", "1"))  # Browser processes the tribunal list is split across
+S3_MAX_POOL_CONNECTIONS = 32  # Shared S3 client connection pool size
+PDF_DOWNLOAD_CONCURRENCY = int(os.getenv("PDF_DOWNLOAD_CONCURRENCY", "8"))  # Maximum PDFs downloaded at the same time
+PDF_DNS_CACHE_TTL = 300  # Seconds the download connector reuses resolved addresses
+PDF_DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(sock_connect=30, sock_read=60)  # Per-read, so long streamed uploads aren't cut off
+DECISION_BATCH_SIZE = 25  # Decisions collected before each concurrent download batch
+UPLOAD_WORKERS = 8  # Background threads uploading downloaded PDFs to S3
+DECISION_FETCH_WORKERS = 4  # Decision pages fetched over plain HTTP at the same time (kept low to stay under rate limits)
+MAX_PENDING_UPLOADS = 64  # Queued PDFs (downloading or uploading) before the browser waits for them
+HTTP_POOL_SIZE = 32  # Keep-alive connections kept per host by the shared requests session
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)  # Transient responses worth retrying
+HTTP_MAX_RETRIES = 5
+HTTP_RETRY_BACKOFF = 0.3  # Seconds, doubled on each retry
 
 # Access restriction cooldown settings
 ACCESS_RESTRICTED_WAIT_MIN = 10  # Minimum wait time in minutes
 ACCESS_RESTRICTED_WAIT_MAX = 20  # Maximum wait time in minutes
 
+# Precompiled patterns and tables used on every decision / CAPTCHA attempt
+_FILENAME_TABLE = str.maketrans('<>:"/\\|?*', '_' * 9)  # Characters S3/filesystems dislike, mapped in one C-level pass
+_TOKEN_RE = re.compile(r'[a-z]+|[0-9]+')
+_ALNUM_RE = re.compile(r'[^A-Za-z0-9]')
+
+# Access restriction phrases, matched in the browser against the page's lowercased visible text
+ACCESS_RESTRICTED_PHRASES = (
+	"access denied",
+	"access restricted",
+	"temporarily blocked",
+	"temporarily restricted",
+	"too many requests",
+	"rate limit",
+	"blocked due to",
+	"ip has been blocked",
+	"ip address has been",
+	"automated access",
+	"unusual activity",
+	"suspicious activity",
+	"please try again later",
+	"come back later",
+)
+
+# Whether the CanLII CAPTCHA image exists but is hidden (audio mode), and whether the toggle exists
+_CANLII_VISUAL_STATE_JS = """() => {
+	const image = document.querySelector('#captchaTag');
+	return {
+		imageHidden: !!image && image.getClientRects().length === 0,
+		hasToggle: !!document.querySelector('#toggleAudio'),
+	};
+}"""
+
+# null when the DataDome audio button is missing, else whether audio mode is already toggled on
+_AUDIO_BUTTON_STATE_JS = """() => {
+	const button = document.querySelector('#captcha__audio__button');
+	if (!button) return null;
+	return (button.className || '').includes('toggled') || button.getAttribute('aria-expanded') === 'true';
+}"""
+
+# Fills the six DataDome audio inputs (only when all six exist) and returns how many were found
+_FILL_AUDIO_DIGITS_JS = """(digits) => {
+	const inputs = document.querySelectorAll('.audio-captcha-inputs');
+	if (inputs.length !== digits.length) return inputs.length;
+	const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+	inputs.forEach((input, i) => {
+		setValue.call(input, digits[i]);
+		input.dispatchEvent(new Event('input', {bubbles: true}));
+		input.dispatchEvent(new Event('change', {bubbles: true}));
+	});
+	return inputs.length;
+}"""
+
+# Everything is_datadome_access_restricted needs from a frame, read in one evaluate call
+_DATADOME_STATE_JS = """() => {
+	const text = sel => { const el = document.querySelector(sel); return el ? el.innerText.toLowerCase() : null; };
+	return {
+		title: text('.captcha__human__title'),
+		warning: text('.captcha__robot__warning'),
+		container: !!document.querySelector('#captcha-container, .captcha-container'),
+		audio: !!document.querySelector('#captcha__audio__button'),
+		slider: !!document.querySelector('.sliderContainer'),
+		anySlider: !!document.querySelector('.sliderContainer, #captcha__slider'),
+	};
+}"""
+
+# CAPTCHA indicators, checked in the browser with one evaluate call per frame
+CANLII_CAPTCHA_SELECTORS = ["#captchaForm", "#captchaTag", "#captchaTest"]
+CANLII_CAPTCHA_TEXTS = ["dear user", "please proceed with our captcha test", "happy searching!"]
+DATADOME_SELECTORS = [
+	"#captcha-container",
+	"#ddv1-captcha-container",
+	"#captcha__frame",
+	"#captcha__audio__button",
+	".captcha__human",
+	".captcha__human__title",
+	"[data-dd-captcha-container]",
+	".sliderContainer",
+]
+DATADOME_TEXTS = ["verification required", "slide right to secure your access"]
+DATADOME_FRAME_HOST = "captcha-delivery.com"  # DataDome serves its CAPTCHA iframe from this host
+
+# is_captcha_page result is reused for the same URL within this many seconds
+CAPTCHA_CHECK_TTL = 1.0
+_CAPTCHA_CHECK_CACHE = (None, 0.0, False)  # (url, monotonic time, result)
+
+# Any of these being attached means a CAPTCHA page loaded instead of the content we wanted
+CAPTCHA_READY_SELECTOR = ", ".join(CANLII_CAPTCHA_SELECTORS + [f"iframe[src*='{DATADOME_FRAME_HOST}']"])
+NAVIGATION_SELECTOR_TIMEOUT = 15000  # ms to wait for the needed element before falling back to domcontentloaded
+
+# Resources the scraper never reads, aborted at the route layer
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+BLOCKED_URL_PARTS = ("google-analytics", "googletagmanager", "doubleclick", "hotjar")
+# CAPTCHA assets must always load (the CanLII image is screenshotted, DataDome renders its own widget)
+ALLOWED_URL_PARTS = ("captcha", "datadome")
+
+# Returns the first matching selector / "text=..." indicator, or null if none match
+_INDICATOR_PROBE_JS = """([selectors, texts]) => {
+	const hit = selectors.find(s => document.querySelector(s));
+	if (hit) return hit;
+	const body = ((document.body && document.body.innerText) || '').toLowerCase();
+	const text = texts.find(t => body.includes(t));
+	return text ? 'text=' + text : null;
+}"""
+
+# Title and PDF link of a decision page, read together in one evaluate call
+_DECISION_INFO_JS = """() => {
+	const title = document.querySelector('h1.main-title');
+	const pdfLink = document.querySelector('#pdf-link');
+	return {
+		title: title ? title.innerText.trim() || null : null,
+		pdfHref: pdfLink ? pdfLink.getAttribute('href') : null,
+	};
+}"""
+
+# Whisper model is loaded lazily on the first audio CAPTCHA and reused afterwards
+WHISPER_MODEL_SIZE = os.getenv("WHISPER_MODEL_SIZE", "tiny.en")  # English-only tiny is plenty for six spoken digits; "base.en" if accuracy drops
+WHISPER_DIGIT_PROMPT = "0 1 2 3 4 5 6 7 8 9"  # Biases decoding toward digit tokens
+_WHISPER_MODEL = None
+
+# AWS clients are built once and shared for the whole run
+_S3_CLIENT = None
+_BEDROCK_CLIENT = None
+S3_TRANSFER_CONFIG = TransferConfig(
+	multipart_threshold=8 * 1024 * 1024,
+	multipart_chunksize=8 * 1024 * 1024,
+	max_concurrency=10,
+	use_threads=True
+)
+S3_USE_ACCELERATE = os.getenv("S3_USE_ACCELERATE", "").lower() in ("1", "true", "yes")  # Needs Transfer Acceleration enabled on the bucket
+_EXISTING_S3_KEYS = None  # Keys already in the bucket, listed once at startup
+
+# Downloads and uploads run in the background while the browser moves on to the next decisions
+_UPLOAD_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=UPLOAD_WORKERS)
+_PENDING_UPLOADS = []  # (doc_info, future) pairs not yet recorded in tracking
+_DECISION_FETCH_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=DECISION_FETCH_WORKERS)
+
+# Shared requests session so audio fetches reuse TCP/TLS connections
+_HTTP_SESSION = None
+
+# Background event loop for async work, and the aiohttp session that lives on it
+_ASYNC_LOOP = None
+_AIOHTTP_SESSION = None
+_DOWNLOAD_SEMAPHORE = None  # Caps concurrent PDF downloads across all queued batches
+
+# Tracking database connection, opened on first use (one per process)
+_TRACKING_DB = None
+
+# Vosk digit recognizer (fast path); Whisper is only used when Vosk is unavailable
+VOSK_MODEL_PATH = os.getenv("VOSK_MODEL_PATH", "vosk-model-small-en-us-0.15")
+AUDIO_SAMPLE_RATE = 16000  # Vosk and Whisper both take 16kHz mono audio
+DIGIT_WORDS = {
+	"zero": "0", "one": "1", "two": "2", "three": "3", "four": "4",
+	"five": "5", "six": "6", "seven": "7", "eight": "8", "nine": "9",
+}
+VOSK_DIGIT_GRAMMAR = json.dumps([" ".join(DIGIT_WORDS), "[unk]"])
+_VOSK_MODEL = None
+_VOSK_UNAVAILABLE = False
+_MODEL_LOCK = threading.Lock()  # Guards the lazy Whisper/Vosk loads against concurrent first use
+_TRANSCRIBE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=1)  # Transcription overlaps browser work
+
 
 def is_access_restricted_page(page):
 	"""Check if the page shows an access restricted/IP blocked message"""
 	try:
-		access_restricted_indicators = [
-			"text=Access Denied",
-			"text=access denied",
-			"text=Access Restricted",
-			"text=access restricted",
-			"text=temporarily blocked",
-			"text=temporarily restricted",
-			"text=Too many requests",
-			"text=too many requests",
-			"text=rate limit",
-			"text=Rate Limit",
-			"text=blocked due to",
-			"text=IP has been blocked",
-			"text=IP address has been",
-			"text=automated access",
-			"text=unusual activity",
-			"text=suspicious activity",
-			"text=Please try again later",
-			"text=come back later",
-		]
-		
-		for indicator in access_restricted_indicators:
-			try:
-				if page.locator(indicator).count() > 0:
-					logger.warning(f"🚫 Access restriction detected via: {indicator}")
-					return True
-			except:
-				continue
-		
-		# Also check page content for common blocking messages
-		try:
-			body_text = page.locator("body").inner_text().lower()
-			blocking_phrases = [
-				"access denied",
-				"access restricted", 
-				"temporarily blocked",
-				"too many requests",
-				"rate limit exceeded",
-				"ip has been blocked",
-				"ip address has been blocked",
-				"automated access detected",
-				"unusual activity detected",
-			]
-			for phrase in blocking_phrases:
-				if phrase in body_text:
-					logger.warning(f"🚫 Access restriction detected in body: '{phrase}'")
-					return True
-		except:
-			pass
+		# Scan the body text in the browser so only the matching phrase comes back
+		indicator = page.evaluate(_INDICATOR_PROBE_JS, [[], list(ACCESS_RESTRICTED_PHRASES)])
+		if indicator:
+			logger.warning(f"🚫 Access restriction detected via: {indicator}")
+			return True
 		
 		return False
 	except:
 		return False
 
 
+def _candidate_captcha_frames(frames):
+	"""Drop frames that can't hold a CAPTCHA and put DataDome's own iframes first (all local, no round trip)"""
+	candidates = [
+		frame for frame in frames
+		if not frame.is_detached() and frame.url not in ("", "about:blank")
+	]
+	return sorted(candidates, key=lambda frame: DATADOME_FRAME_HOST not in frame.url)
+
+
 def is_datadome_access_restricted(page):
 	"""Check if DataDome is showing access restricted message (not a solvable CAPTCHA)"""
 	try:
-		for frame in page.frames:
+		for frame in _candidate_captcha_frames(page.frames):
 			try:
+				state = frame.evaluate(_DATADOME_STATE_JS)
 				# Check for "Access is temporarily restricted" message
-				human_title = frame.locator(".captcha__human__title")
-				if human_title.count() > 0:
-					title_text = human_title.inner_text().lower()
-					if "temporarily restricted" in title_text or "access" in title_text:
-						logger.warning("🚫 DataDome ACCESS RESTRICTED detected in frame")
-						return True
+				title_text = state["title"]
+				if title_text is not None and ("temporarily restricted" in title_text or "access" in title_text):
+					logger.warning("🚫 DataDome ACCESS RESTRICTED detected in frame")
+					return True
 				# Also check robot warning for unusual activity
-				robot_warning = frame.locator(".captcha__robot__warning")
-				if robot_warning.count() > 0:
-					warning_text = robot_warning.inner_text().lower()
-					if "unusual activity" in warning_text or "automated" in warning_text:
-						# check if there are solvable elements
-						audio_btn = frame.locator("#captcha__audio__button")
-						slider = frame.locator(".sliderContainer, #captcha__slider")
-						
-						if audio_btn.count() == 0 and slider.count() == 0:
-							logger.warning("🚫 DataDome unusual activity warning detected (no solvable elements)")
-							return True
-						# If we have solvable elements, ignore the warning text
+				warning_text = state["warning"]
+				if warning_text is not None and ("unusual activity" in warning_text or "automated" in warning_text):
+					# If we have solvable elements, ignore the warning text
+					if not state["audio"] and not state["anySlider"]:
+						logger.warning("🚫 DataDome unusual activity warning detected (no solvable elements)")
+						return True
 
 				# Check if DataDome CAPTCHA container exists but audio button is missing
 				# This indicates an unsolvable access restriction page
-				captcha_container = frame.locator("#captcha-container, .captcha-container")
-				audio_button = frame.locator("#captcha__audio__button")
-				slider_container = frame.locator(".sliderContainer")
-				if captcha_container.count() > 0:
-					# If container exists but no audio button AND no slider, it's access restricted
-					if audio_button.count() == 0 and slider_container.count() == 0:
-						print(f"    \U0001F6AB DataDome CAPTCHA container found but no solvable elements - ACCESS RESTRICTED")
-						return True
+				if state["container"] and not state["audio"] and not state["slider"]:
+					logger.warning("🚫 DataDome CAPTCHA container found but no solvable elements - ACCESS RESTRICTED")
+					return True
 			except:
 				continue
 		return False
@@ -159,10 +315,9 @@ def wait_for_ip_cooldown(page, reason="access restriction"):
 	
 	# Wait with countdown updates every minute
 	for remaining_minutes in range(wait_minutes, 0, -1):
-		print(f"    ⏳ {remaining_minutes} minute(s) remaining...")
-		# Wait 1 minute (60 seconds)
-		for _ in range(12):  # 12 * 5 seconds = 60 seconds
-			page.wait_for_timeout(5000)
+		logger.info(f"⏳ {remaining_minutes} minute(s) remaining...")
+		# Wait 1 minute in a single call (keeps the page's event loop serviced)
+		page.wait_for_timeout(60000)
 	
 	logger.info("\n" + "="*60)
 	logger.info("✅ IP COOLDOWN COMPLETE - Resuming operations")
@@ -194,6 +349,18 @@ def get_firefox_user_prefs():
 	}
 
 
+def block_unneeded_resources(route):
+	"""Abort images, fonts, media, stylesheets and trackers, letting CAPTCHA assets through"""
+	request = route.request
+	url = request.url.lower()
+	if any(part in url for part in ALLOWED_URL_PARTS):
+		route.continue_()
+	elif request.resource_type in BLOCKED_RESOURCE_TYPES or any(part in url for part in BLOCKED_URL_PARTS):
+		route.abort()
+	else:
+		route.continue_()
+
+
 def get_stealth_scripts():
 	"""Get list of JavaScripts to inject for evasion"""
 	return [
@@ -233,31 +400,56 @@ def get_stealth_scripts():
 	]
 
 
+# All stealth snippets in one init script, each isolated so one failure can't stop the rest
+_STEALTH_BUNDLE = "\n".join(
+	f"(() => {{ try {{ {script} }} catch (e) {{}} }})();" for script in get_stealth_scripts()
+)
+
+
+def get_stealth_script():
+	"""Get the bundled stealth JavaScript, injected with a single add_init_script call"""
+	return _STEALTH_BUNDLE
+
+
+def reset_captcha_check_cache():
+	"""Forget the last CAPTCHA check; called after navigations and solve attempts"""
+	global _CAPTCHA_CHECK_CACHE
+	_CAPTCHA_CHECK_CACHE = (None, 0.0, False)
+
+
 def is_captcha_page(page):
 	"""Check if the current page is a CAPTCHA page (CanLII or DataDome) or access restricted"""
+	global _CAPTCHA_CHECK_CACHE
+	url = page.url
+	now = time.monotonic()
+	cached_url, checked_at, cached_result = _CAPTCHA_CHECK_CACHE
+	if url == cached_url and now - checked_at < CAPTCHA_CHECK_TTL:
+		return cached_result
+	
+	result = _check_captcha_page(page, url)
+	_CAPTCHA_CHECK_CACHE = (url, now, result)
+	return result
+
+
+def _check_captcha_page(page, url):
+	"""Run the CAPTCHA checks cheapest first"""
 	try:
-		# Check for access restriction first
-		if is_access_restricted_page(page):
+		# URL is known locally, no round trip needed
+		if "captcha" in url.lower():
 			return True
 		
-		# Check for CanLII CAPTCHA elements
-		captcha_indicators = [
-			"text=Dear User",
-			"text=please proceed with our captcha test",
-			"#captchaForm",
-			"#captchaTag",
-			"text=Happy Searching!",
-			"#captchaTest"
-		]
-		
-		for indicator in captcha_indicators:
-			if page.locator(indicator).count() > 0:
-				return True
+		# Check for CanLII CAPTCHA elements and text in a single round trip
+		if page.evaluate(_INDICATOR_PROBE_JS, [CANLII_CAPTCHA_SELECTORS, CANLII_CAPTCHA_TEXTS]):
+			return True
 		
 		# Check for DataDome CAPTCHA
 		if is_datadome_captcha(page):
 			return True
 		
+		# Access restriction scans the whole body text, so it goes last
+		if is_access_restricted_page(page):
+			return True
+		
 		return False
 	except:
 		return False
@@ -266,36 +458,37 @@ def is_captcha_page(page):
 def is_datadome_captcha(page, silent=False):
 	"""Check if the current page has a DataDome CAPTCHA, checking all frames"""
 	try:
-		datadome_indicators = [
-			"#captcha-container",
-			"#ddv1-captcha-container",
-			"#captcha__frame",
-			"#captcha__audio__button",
-			".captcha__human",
-			".captcha__human__title",
-			"[data-dd-captcha-container]",
-			"text=Verification Required",
-			"text=Slide right to secure your access",
-			".sliderContainer",
-		]
-		
-		# Check main page and all frames (with limit to prevent hanging)
-		frames_to_check = page.frames[:10]  # Limit to first 10 frames
-		for frame in frames_to_check:
-			for indicator in datadome_indicators:
-				try:
-					if frame.locator(indicator).count() > 0:
-						if not silent:
-							logger.info(f"🔴 DataDome detected via: {indicator}")
-						return frame
-				except:
-					continue
+		# Check main page and all frames (with limit to prevent hanging), one evaluate per frame
+		for frame in _candidate_captcha_frames(page.frames[:10]):  # Limit to first 10 frames
+			try:
+				indicator = frame.evaluate(_INDICATOR_PROBE_JS, [DATADOME_SELECTORS, DATADOME_TEXTS])
+				if indicator:
+					if not silent:
+						logger.info(f"🔴 DataDome detected via: {indicator}")
+					return frame
+			except:
+				continue
 		
 		return None
 	except:
 		return None
 
 
+def get_http_session():
+	"""Get the shared requests session, creating it on first use"""
+	global _HTTP_SESSION
+	if _HTTP_SESSION is None:
+		_HTTP_SESSION = requests.Session()
+		adapter = HTTPAdapter(
+			pool_connections=HTTP_POOL_SIZE,
+			pool_maxsize=HTTP_POOL_SIZE,
+			max_retries=Retry(total=HTTP_MAX_RETRIES, backoff_factor=HTTP_RETRY_BACKOFF, status_forcelist=HTTP_RETRY_STATUSES)
+		)
+		_HTTP_SESSION.mount("https://", adapter)
+		_HTTP_SESSION.mount("http://", adapter)
+	return _HTTP_SESSION
+
+
 def solve_datadome_audio_captcha(page):
 	"""Solve DataDome audio CAPTCHA by transcribing numbers"""
 	logger.info("\n🎧 Attempting to solve DataDome audio CAPTCHA...")
@@ -317,17 +510,9 @@ def solve_datadome_audio_captcha(page):
 		
 		# Click on audio button to switch to audio mode
 		audio_button = captcha_frame.locator("#captcha__audio__button")
-		if audio_button.count() > 0:
-			# Check if already active
-			is_active = False
-			try:
-				if "toggled" in audio_button.get_attribute("class", ""):
-					is_active = True
-				if audio_button.get_attribute("aria-expanded") == "true":
-					is_active = True
-			except:
-				pass
-			
+		# One round trip: None if the button is missing, otherwise whether audio mode is already active
+		is_active = captcha_frame.evaluate(_AUDIO_BUTTON_STATE_JS)
+		if is_active is not None:
 			if is_active:
 				logger.info("Audio mode already active, skipping click...")
 			else:
@@ -359,7 +544,7 @@ def solve_datadome_audio_captcha(page):
 		
 		# Download the audio file
 		try:
-			response = requests.get(audio_url, timeout=30)
+			response = get_http_session().get(audio_url, timeout=30)
 			if response.status_code != 200:
 				logger.error(f"⚠️  Failed to download audio: {response.status_code}")
 				return False
@@ -369,8 +554,13 @@ def solve_datadome_audio_captcha(page):
 			logger.error(f"⚠️  Error downloading audio: {e}")
 			return False
 		
-		# Transcribe using AWS Transcribe
-		numbers = transcribe_audio_captcha(audio_data)
+		# Transcribe in the background while the browser makes sure the input fields are ready
+		transcription = _TRANSCRIBE_EXECUTOR.submit(transcribe_audio_captcha, audio_data)
+		try:
+			captcha_frame.wait_for_selector(".audio-captcha-inputs", state="attached", timeout=5000)
+		except:
+			pass
+		numbers = transcription.result()
 		
 		if not numbers or len(numbers) != 6:
 			logger.warning(f"⚠️  Failed to get 6 digits, got: {numbers}")
@@ -378,24 +568,20 @@ def solve_datadome_audio_captcha(page):
 		
 		logger.info(f"🔢 Transcribed numbers: {numbers}")
 		
-		# Fill in the 6 input fields
-		inputs = captcha_frame.locator(".audio-captcha-inputs").all()
-		if len(inputs) != 6:
+		# Fill in the 6 input fields in one round trip
+		input_count = captcha_frame.evaluate(_FILL_AUDIO_DIGITS_JS, list(numbers))
+		if input_count != 6:
 			try:
 				# Sometimes inputs load slowly
 				page.wait_for_timeout(1000)
-				inputs = captcha_frame.locator(".audio-captcha-inputs").all()
+				input_count = captcha_frame.evaluate(_FILL_AUDIO_DIGITS_JS, list(numbers))
 			except:
 				pass
 				
-			if len(inputs) != 6:
-				logger.warning(f"⚠️  Expected 6 inputs, found {len(inputs)}")
+			if input_count != 6:
+				logger.warning(f"⚠️  Expected 6 inputs, found {input_count}")
 				return False
 		
-		for i, digit in enumerate(numbers):
-			inputs[i].fill(str(digit))
-			page.wait_for_timeout(100)
-		
 		logger.info("✅ Filled in all digits, submitting...")
 		
 		# Click verify button
@@ -487,35 +673,31 @@ def solve_canlii_audio_captcha(page):
 			logger.warning("⚠️  Audio tag not found")
 			return False
 			
-		# Wait specifically for src attribute
+		# Wait specifically for src attribute - resolves as soon as it is set
 		logger.info("Waiting for audio source...")
 		try:
-			# simple wait logic or loop
-			for _ in range(10):
-				src = audio_tag.get_attribute("src")
-				if src:
-					break
-				page.wait_for_timeout(500)
+			audio_src = page.wait_for_function(
+				"() => { const el = document.getElementById('audioCaptchaTag'); return el && el.getAttribute('src'); }",
+				timeout=5000
+			).json_value()
 		except:
-			pass
+			audio_src = None
 			
-		audio_src = audio_tag.get_attribute("src")
 		if not audio_src:
 			logger.warning("⚠️  Audio source not found")
 			return False
 			
-		full_audio_url = BASE_URL + audio_src if audio_src.startswith("/") else audio_src
+		full_audio_url = urljoin(BASE_URL, audio_src)
 		logger.info(f"📥 Downloading audio from: {full_audio_url[:50]}...")
 		
 		# Download audio with headers to avoid 403
 		cookies = get_cookies_dict(page)
-		user_agent = page.evaluate("navigator.userAgent")
 		headers = {
-			"User-Agent": user_agent,
+			"User-Agent": USER_AGENT,
 			"Referer": page.url
 		}
 		
-		response = requests.get(full_audio_url, headers=headers, cookies=cookies, timeout=30)
+		response = get_http_session().get(full_audio_url, headers=headers, cookies=cookies, timeout=30)
 		
 		if response.status_code != 200:
 			logger.error(f"⚠️  Failed to download audio: {response.status_code}")
@@ -564,48 +746,127 @@ def solve_canlii_audio_captcha(page):
 		return False
 
 
-def transcribe_audio_captcha(audio_data):
-	"""Transcribe audio CAPTCHA using local Whisper model"""
-	temp_path = None
+def _get_whisper_model():
+	"""Load the Whisper model once and reuse it for every CAPTCHA"""
+	global _WHISPER_MODEL
+	if _WHISPER_MODEL is None:
+		with _MODEL_LOCK:
+			if _WHISPER_MODEL is None:
+				# Imported lazily so runs that never see an audio CAPTCHA (or use Vosk) never load CTranslate2
+				import ctranslate2
+				from faster_whisper import WhisperModel
+				
+				# Run on the GPU in float16 when CUDA is available, otherwise int8 on CPU
+				if ctranslate2.get_cuda_device_count() > 0:
+					device, compute_type = "cuda", "float16"
+				else:
+					device, compute_type = "cpu", "int8"
+				
+				logger.info(f"⏳ Loading Whisper model ({WHISPER_MODEL_SIZE}, {device}/{compute_type})...")
+				# Load the model (this will download it on first run - approx 75MB)
+				_WHISPER_MODEL = WhisperModel(
+					WHISPER_MODEL_SIZE,
+					device=device,
+					compute_type=compute_type,
+					cpu_threads=os.cpu_count() or 4,
+				)
+	return _WHISPER_MODEL
+
+
+def _get_vosk_model():
+	"""Load the Vosk model once, or return None if it is not installed"""
+	global _VOSK_MODEL, _VOSK_UNAVAILABLE
+	if _VOSK_MODEL is None and not _VOSK_UNAVAILABLE:
+		with _MODEL_LOCK:
+			if _VOSK_MODEL is None and not _VOSK_UNAVAILABLE:
+				if VoskModel is None or not os.path.isdir(VOSK_MODEL_PATH):
+					logger.info(f"Vosk model not available at '{VOSK_MODEL_PATH}', using Whisper for audio CAPTCHAs")
+					_VOSK_UNAVAILABLE = True
+					return None
+				SetLogLevel(-1)
+				_VOSK_MODEL = VoskModel(VOSK_MODEL_PATH)
+	return _VOSK_MODEL
+
+
+def _decode_audio_pcm16k(audio_data):
+	"""Decode CAPTCHA audio into 16kHz mono 16-bit PCM"""
+	# ffmpeg resamples and downmixes while decoding, so the conversions below are no-ops
+	segment = AudioSegment.from_file(
+		io.BytesIO(audio_data),
+		parameters=["-ar", str(AUDIO_SAMPLE_RATE), "-ac", "1"]
+	)
+	return segment.set_frame_rate(AUDIO_SAMPLE_RATE).set_channels(1).set_sample_width(2).raw_data
+
+
+def transcribe_digits_with_vosk(audio_data):
+	"""Transcribe spoken digits with a grammar-restricted Vosk recognizer"""
+	model = _get_vosk_model()
+	if model is None:
+		return None
+	
 	try:
-		# Save audio to temp file
-		with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-			f.write(audio_data)
-			temp_path = f.name
+		recognizer = KaldiRecognizer(model, AUDIO_SAMPLE_RATE, VOSK_DIGIT_GRAMMAR)
+		pcm = _decode_audio_pcm16k(audio_data)
+		
+		# Collect every finished utterance, digits may be split by pauses
+		words = []
+		for offset in range(0, len(pcm), 8000):
+			if recognizer.AcceptWaveform(pcm[offset:offset + 8000]):
+				words.extend(json.loads(recognizer.Result()).get("text", "").split())
+		words.extend(json.loads(recognizer.FinalResult()).get("text", "").split())
 		
-		print("    ⏳ Loading Whisper model (base)...")
-		# Load the model (this will download it on first run - approx 140MB)
-		model = whisper.load_model("base")
+		return "".join(DIGIT_WORDS[w] for w in words if w in DIGIT_WORDS)
+	except Exception as e:
+		logger.warning(f"⚠️  Vosk transcription error: {e}")
+		return None
+
+
+def _digits_from_transcript(transcript):
+	"""Turn a transcript like 'four 2 nine' into '429'"""
+	tokens = _TOKEN_RE.findall(transcript.lower())
+	return "".join(DIGIT_WORDS.get(tok, tok if tok.isdigit() else "") for tok in tokens)
+
+
+def transcribe_audio_captcha(audio_data):
+	"""Transcribe audio CAPTCHA using Vosk, falling back to the local Whisper model"""
+	numbers = transcribe_digits_with_vosk(audio_data)
+	if numbers:
+		return numbers
+	
+	try:
+		# Decode once in-process; faster-whisper accepts a 16kHz float32 array directly
+		pcm = _decode_audio_pcm16k(audio_data)
+		audio = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
 		
-		# Suppress FP16 warning on CPU
-		import warnings
-		warnings.filterwarnings("ignore", message="FP16 is not supported on CPU")
+		model = _get_whisper_model()
 		
 		logger.info("Transcribing audio...")
-		result = model.transcribe(temp_path)
-		transcript = result["text"]
-		
-		# Extract only digits
-		numbers = re.sub(r'[^0-9]', '', transcript)
+		segments, _ = model.transcribe(
+			audio,
+			language="en",
+			task="transcribe",
+			beam_size=1,
+			temperature=0,
+			without_timestamps=True,
+			initial_prompt=WHISPER_DIGIT_PROMPT,
+			vad_filter=False,
+		)
+		transcript = "".join(seg.text for seg in segments)
 		
-		# Clean up
-		if temp_path and os.path.exists(temp_path):
-			os.unlink(temp_path)
-			
-		return numbers
+		# Extract only digits (Whisper sometimes spells them out)
+		return _digits_from_transcript(transcript)
 			
 	except Exception as e:
 		logger.error(f"⚠️  Transcription error: {e}")
-		if temp_path and os.path.exists(temp_path):
-			try:
-				os.unlink(temp_path)
-			except:
-				pass
 		return None
 
 
 def initialize_bedrock_client():
-	"""Initialize AWS Bedrock client for CAPTCHA solving"""
+	"""Initialize AWS Bedrock client for CAPTCHA solving (created once, then reused)"""
+	global _BEDROCK_CLIENT
+	if _BEDROCK_CLIENT is not None:
+		return _BEDROCK_CLIENT
+	
 	try:
 		aws_key = os.getenv("AWS_ACCESS_KEY_ID")
 		aws_secret = os.getenv("AWS_SECRET_ACCESS_KEY")
@@ -614,18 +875,33 @@ def initialize_bedrock_client():
 			logger.warning("⚠️  AWS credentials not found for Bedrock")
 			return None
 		
-		bedrock_client = boto3.client(
+		_BEDROCK_CLIENT = boto3.client(
 			"bedrock-runtime",
 			region_name=BEDROCK_REGION,
 			aws_access_key_id=aws_key,
 			aws_secret_access_key=aws_secret,
+			# Fail fast and keep the connection warm; the CAPTCHA loop does its own retrying
+			config=Config(connect_timeout=5, read_timeout=30, tcp_keepalive=True, retries={'max_attempts': 2})
 		)
-		return bedrock_client
+		return _BEDROCK_CLIENT
 	except Exception as e:
 		logger.error(f"⚠️  Failed to initialize Bedrock client: {e}")
 		return None
 
 
+def detect_image_format(image_bytes):
+	"""Identify a CAPTCHA image format from its leading bytes"""
+	if image_bytes.startswith(b"\x89PNG\r\n\x1a\n"):
+		return "png"
+	if image_bytes.startswith(b"\xff\xd8\xff"):
+		return "jpeg"
+	if image_bytes.startswith(b"GIF8"):
+		return "gif"
+	if image_bytes[:4] == b"RIFF" and image_bytes[8:12] == b"WEBP":
+		return "webp"
+	return "png"
+
+
 def solve_captcha_with_bedrock(image_bytes):
 	"""Solve CAPTCHA using AWS Bedrock vision model"""
 	bedrock_client = initialize_bedrock_client()
@@ -633,23 +909,15 @@ def solve_captcha_with_bedrock(image_bytes):
 		return ""
 	
 	try:
-		# Determine image format
-		image = Image.open(io.BytesIO(image_bytes))
-		image_format = (image.format or "PNG").lower()
-		if image_format == "jpg":
-			image_format = "jpeg"
+		# Determine image format from its magic bytes (no need to decode the pixels)
+		image_format = detect_image_format(image_bytes)
 		
 		messages = [
 			{
 				"role": "user",
 				"content": [
 					{"image": {"format": image_format, "source": {"bytes": image_bytes}}},
-					{
-						"text": (
-							"Read the captcha text in this image. Only output the exact characters you see, "
-							"nothing else. The captcha contains alphanumeric characters. Do not include any spaces or special characters."
-						)
-					},
+					{"text": BEDROCK_CAPTCHA_PROMPT},
 				],
 			}
 		]
@@ -670,16 +938,31 @@ def solve_captcha_with_bedrock(image_bytes):
 			except Exception:
 				out = ""
 		
-		# Clean the response - keep only alphanumeric characters
-		captcha_text = re.sub(r"[^A-Za-z0-9]", "", str(out))
-		return captcha_text.strip()
+		# Clean the response - keep only alphanumeric characters (this also drops whitespace)
+		return _ALNUM_RE.sub("", str(out))
 	except Exception as e:
 		logger.error(f"⚠️  Bedrock CAPTCHA solving failed: {e}")
 		return ""
 
 
+def captcha_retry_backoff(page, failures):
+	"""Full-jitter exponential backoff between CAPTCHA attempts so retries don't look scripted"""
+	delay = random.uniform(0, min(CAPTCHA_BACKOFF_CAP, CAPTCHA_BACKOFF_BASE * (2 ** failures)))
+	logger.info(f"⏳ Backing off {delay:.1f}s before next CAPTCHA attempt...")
+	page.wait_for_timeout(delay * 1000)
+
+
 def solve_captcha_automatically(page):
 	"""Attempt to automatically solve the CAPTCHA on the page"""
+	try:
+		return _solve_captcha_automatically(page)
+	finally:
+		# An in-place solve keeps the URL, so the memoized "CAPTCHA present" answer must go
+		reset_captcha_check_cache()
+
+
+def _solve_captcha_automatically(page):
+	"""Try the DataDome and CanLII solvers in turn"""
 	logger.info("\n🤖 Attempting automatic CAPTCHA solving...")
 
 	# Remove cookie consent blocker if present
@@ -712,6 +995,8 @@ def solve_captcha_automatically(page):
 		
 		logger.info("📌 Detected DataDome CAPTCHA (slider/audio type)")
 		for attempt in range(1, MAX_CAPTCHA_ATTEMPTS + 1):
+			if attempt > 1:
+				captcha_retry_backoff(page, attempt - 1)
 			logger.info(f"DataDome attempt {attempt}/{MAX_CAPTCHA_ATTEMPTS}...")
 			if solve_datadome_audio_captcha(page):
 				return True
@@ -735,6 +1020,8 @@ def solve_captcha_automatically(page):
 	
 	# Fall back to CanLII CAPTCHA
 	for attempt in range(1, MAX_CAPTCHA_ATTEMPTS + 1):
+		if attempt > 1:
+			captcha_retry_backoff(page, attempt - 1)
 		logger.info(f"Attempt {attempt}/{MAX_CAPTCHA_ATTEMPTS}...")
 		
 		# Try Audio First
@@ -744,23 +1031,18 @@ def solve_captcha_automatically(page):
 		logger.warning("⚠️  Audio solve failed/skipped, trying Visual/Bedrock...")
 		
 		try:
-			# Ensure we are in Visual mode (Audio mode hides the image)
-			captcha_img = page.locator("#captchaTag")
-			if captcha_img.count() > 0 and not captcha_img.is_visible():
+			# Ensure we are in Visual mode (Audio mode hides the image) - one round trip for both elements
+			visual_state = page.evaluate(_CANLII_VISUAL_STATE_JS)
+			if visual_state["imageHidden"]:
 				logger.info("Image hidden, toggling back to Visual mode...")
-				toggle_btn = page.locator("#toggleAudio")
-				if toggle_btn.count() > 0:
-					toggle_btn.click(force=True)
+				if visual_state["hasToggle"]:
+					page.locator("#toggleAudio").click(force=True)
 					page.wait_for_timeout(1500)
 			
-			# Wait for captcha image to load
+			# Wait for captcha image to load (a timeout falls through to the reload below)
 			page.wait_for_selector("#captchaTag", state="visible", timeout=5000)
 			captcha_img = page.locator("#captchaTag")
 			
-			if captcha_img.count() == 0 or not captcha_img.is_visible():
-				logger.warning("⚠️  CAPTCHA image not found or not visible")
-				continue
-			
 			# Take screenshot of the CAPTCHA image
 			image_bytes = captcha_img.screenshot()
 			
@@ -842,7 +1124,7 @@ def handle_captcha_interruption(page):
 			
 			# If still restricted after waiting, wait again
 			if is_datadome_access_restricted(page):
-				print("   ⚠️  Still access restricted after first cooldown, waiting again...")
+				logger.warning("⚠️  Still access restricted after first cooldown, waiting again...")
 				wait_for_ip_cooldown(page, reason="DataDome still restricted after first cooldown")
 				page.goto(START_URL, wait_until="commit")
 				page.wait_for_load_state("domcontentloaded")
@@ -851,85 +1133,85 @@ def handle_captcha_interruption(page):
 			if is_captcha_page(page) and not is_datadome_access_restricted(page):
 				logger.info("Found solvable CAPTCHA after cooldown. Solving...")
 				if solve_captcha_automatically(page):
-					print("   ✅ CAPTCHA solved after cooldown!")
+					logger.info("✅ CAPTCHA solved after cooldown!")
 					page.wait_for_timeout(2000)
 					return True
 				else:
-					print("   ⚠️  Auto-solve failed. Waiting for manual input...")
+					logger.warning("⚠️  Auto-solve failed. Waiting for manual input...")
 					while is_captcha_page(page):
 						page.wait_for_timeout(5000)
-					print("   ✅ Manual solve detected!")
+					logger.info("✅ Manual solve detected!")
 					return True
 			else:
-				print("   ✅ Access restored after cooldown!")
+				logger.info("✅ Access restored after cooldown!")
 				return True
 		
 		# Check for regular access restriction (main page body)
 		if is_access_restricted_page(page):
-			print("   🚫 Access restriction detected - IP may be blocked due to high download volume")
+			logger.warning("🚫 Access restriction detected - IP may be blocked due to high download volume")
 			wait_for_ip_cooldown(page, reason="Access restriction detected during scraping")
 			
 			# After waiting, go to homepage and check again
-			print(f"   Navigating to homepage ({START_URL}) after cooldown...")
+			logger.info(f"Navigating to homepage ({START_URL}) after cooldown...")
 			page.goto(START_URL, wait_until="commit")
 			page.wait_for_load_state("domcontentloaded")
 			
 			# If still restricted after waiting, wait again
 			if is_access_restricted_page(page):
-				print("   ⚠️  Still restricted after first cooldown, waiting again...")
+				logger.warning("⚠️  Still restricted after first cooldown, waiting again...")
 				wait_for_ip_cooldown(page, reason="Access still restricted after first cooldown")
 				page.goto(START_URL, wait_until="commit")
 				page.wait_for_load_state("domcontentloaded")
 			
 			# Now check for remaining CAPTCHA
 			if is_captcha_page(page) and not is_access_restricted_page(page):
-				print("   Found regular CAPTCHA after cooldown. Solving...")
+				logger.info("Found regular CAPTCHA after cooldown. Solving...")
 				if solve_captcha_automatically(page):
-					print("   ✅ CAPTCHA solved after cooldown!")
+					logger.info("✅ CAPTCHA solved after cooldown!")
 					page.wait_for_timeout(2000)
 					return True
 				else:
-					print("   ⚠️  Auto-solve failed. Waiting for manual input...")
+					logger.warning("⚠️  Auto-solve failed. Waiting for manual input...")
 					while is_captcha_page(page):
 						page.wait_for_timeout(5000)
-					print("   ✅ Manual solve detected!")
+					logger.info("✅ Manual solve detected!")
 					return True
 			else:
-				print("   ✅ Access restored after cooldown!")
+				logger.info("✅ Access restored after cooldown!")
 				return True
 		
 		# 1. Go to homepage (safest place to solve)
-		print(f"   Navigating to homepage ({START_URL}) to solve...")
+		logger.info(f"Navigating to homepage ({START_URL}) to solve...")
 		page.goto(START_URL, wait_until="commit")
 		page.wait_for_load_state("domcontentloaded")
 		
 		# Check if homepage also shows access restriction
 		if is_access_restricted_page(page):
-			print("   🚫 Homepage also shows access restriction")
+			logger.warning("🚫 Homepage also shows access restriction")
 			wait_for_ip_cooldown(page, reason="Access restriction on homepage")
 			page.goto(START_URL, wait_until="commit")
 			page.wait_for_load_state("domcontentloaded")
 		
 		# 2. Solve it
 		if is_captcha_page(page):
-			print("   Found CAPTCHA on homepage. Solving...")
+			logger.info("Found CAPTCHA on homepage. Solving...")
 			if solve_captcha_automatically(page):
-				print("   ✅ Recovery CAPTCHA solved!")
+				logger.info("✅ Recovery CAPTCHA solved!")
 				page.wait_for_timeout(2000)
 				return True
 			else:
-				print("   ⚠️  Auto-solve failed during recovery. Waiting for manual input...")
+				logger.warning("⚠️  Auto-solve failed during recovery. Waiting for manual input...")
 				# Wait manually
 				while is_captcha_page(page):
 					page.wait_for_timeout(5000)
-				print("   ✅ Manual solve detected!")
+				logger.info("✅ Manual solve detected!")
 				return True
 		else:
-			print("   ❓ No CAPTCHA found on homepage? Maybe it cleared itself.")
+			logger.info("❓ No CAPTCHA found on homepage? Maybe it cleared itself.")
 			return True
 			
 	except Exception as e:
-		print(f"   ❌ Recovery failed: {e}")
+		logger.error(f"❌ Recovery failed: {e}")
 		return False
 
 
@@ -939,122 +1221,441 @@ def collect_links(page, section_title):
 	return [href for href in hrefs if href]
 
 
-def download_pdf(url, output_path, cookies, user_agent):
-	"""Download PDF file using requests with cookies"""
-	try:
-		headers = {
-			"User-Agent": user_agent,
-			"Referer": "https://www.canlii.org/"
-		}
-		response = requests.get(url, headers=headers, cookies=cookies, timeout=60, stream=True)
-		if response.status_code == 200:
-			os.makedirs(os.path.dirname(output_path), exist_ok=True)
-			with open(output_path, 'wb') as f:
-				for chunk in response.iter_content(chunk_size=8192):
-					f.write(chunk)
-			print(f"    ✅ Downloaded: {output_path}")
-			return True
-		else:
-			print(f"    ❌ Failed to download {url}: Status {response.status_code}")
+def _get_async_loop():
+	"""Start the background event loop on first use (Playwright's sync API owns the main thread's loop)"""
+	global _ASYNC_LOOP
+	if _ASYNC_LOOP is None:
+		_ASYNC_LOOP = asyncio.new_event_loop()
+		threading.Thread(target=_ASYNC_LOOP.run_forever, daemon=True).start()
+	return _ASYNC_LOOP
+
+
+def run_async(coro):
+	"""Run a coroutine to completion on the shared background event loop"""
+	return asyncio.run_coroutine_threadsafe(coro, _get_async_loop()).result()
+
+
+async def _get_aiohttp_session():
+	"""Get the shared aiohttp session so PDF downloads keep their connections across batches"""
+	global _AIOHTTP_SESSION
+	if _AIOHTTP_SESSION is None or _AIOHTTP_SESSION.closed:
+		_AIOHTTP_SESSION = aiohttp.ClientSession(
+			connector=aiohttp.TCPConnector(limit=PDF_DOWNLOAD_CONCURRENCY, ttl_dns_cache=PDF_DNS_CACHE_TTL, keepalive_timeout=60)
+		)
+	return _AIOHTTP_SESSION
+
+
+async def _close_aiohttp_session():
+	"""Close the shared aiohttp session"""
+	if _AIOHTTP_SESSION is not None and not _AIOHTTP_SESSION.closed:
+		await _AIOHTTP_SESSION.close()
+
+
+async def _read_up_to(content, size):
+	"""Read exactly `size` bytes from an aiohttp stream (fewer only at end of body)"""
+	if size is None or size < 0:
+		return await content.read()
+	chunks = []
+	remaining = size
+	while remaining > 0:
+		chunk = await content.read(remaining)
+		if not chunk:
+			break
+		chunks.append(chunk)
+		remaining -= len(chunk)
+	return b"".join(chunks)
+
+
+class ResponseStream:
+	"""Blocking file-like view of an aiohttp response body, read by boto3 from an upload thread"""
+	
+	def __init__(self, response, loop):
+		self._response = response
+		self._loop = loop
+	
+	def read(self, size=-1):
+		return asyncio.run_coroutine_threadsafe(_read_up_to(self._response.content, size), self._loop).result()
+
+
+async def download_and_upload_async(doc_info, headers, cookies):
+	"""Download one PDF and upload it to S3 (nothing touches local disk), returning whether it ended up in S3"""
+	global _DOWNLOAD_SEMAPHORE
+	if _DOWNLOAD_SEMAPHORE is None:
+		_DOWNLOAD_SEMAPHORE = asyncio.Semaphore(PDF_DOWNLOAD_CONCURRENCY)
+	session = await _get_aiohttp_session()
+	loop = asyncio.get_running_loop()
+	
+	async with _DOWNLOAD_SEMAPHORE:
+		try:
+			for retry in range(HTTP_MAX_RETRIES + 1):
+				try:
+					async with session.get(doc_info["pdf_url"], headers=headers, cookies=cookies, timeout=PDF_DOWNLOAD_TIMEOUT) as response:
+						if response.status in HTTP_RETRY_STATUSES and retry < HTTP_MAX_RETRIES:
+							await asyncio.sleep(HTTP_RETRY_BACKOFF * (2 ** retry))
+							continue
+						if response.status != 200:
+							logger.warning(f"❌ Failed to download {doc_info['pdf_url']}: Status {response.status}")
+							return False
+						if (response.content_length or 0) >= S3_TRANSFER_CONFIG.multipart_threshold:
+							# Large PDF: stream from the socket straight into the multipart upload
+							return await loop.run_in_executor(_UPLOAD_POOL, upload_to_s3, ResponseStream(response, loop), doc_info["s3_key"])
+						pdf_bytes = await response.read()
+						break
+				except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+					# Connection resets and timeouts are transient too - same backoff as retryable statuses
+					if retry >= HTTP_MAX_RETRIES:
+						raise
+					logger.warning(f"⚠️  Download attempt {retry + 1} failed ({e!r}), retrying...")
+					await asyncio.sleep(HTTP_RETRY_BACKOFF * (2 ** retry))
+			logger.info(f"✅ Downloaded: {doc_info['s3_key']}")
+		except Exception as e:
+			logger.error(f"❌ Download error: {e}")
 			return False
-	except Exception as e:
-		logger.error(f"❌ Download error: {e}")
-		return False
+	
+	return await loop.run_in_executor(_UPLOAD_POOL, upload_to_s3, pdf_bytes, doc_info["s3_key"])
+
+
+def absolutize(href):
+	"""Resolve a CanLII link against BASE_URL, without its #fragment, so each page has one canonical URL"""
+	return urldefrag(urljoin(BASE_URL, href))[0]
 
 
 def sanitize_filename(filename):
 	"""Remove invalid characters from filename"""
-	return re.sub(r'[<>:"/\\|?*]', '_', filename)
+	return filename.translate(_FILENAME_TABLE)
 
 
-def file_exists_in_s3(s3_key):
-	"""Check if a file already exists in S3 bucket"""
-	try:
-		s3_client = boto3.client(
+def make_s3_key(decision_url, title):
+	"""Build the S3 key for a decision: a short hash of its URL as prefix, so concurrent uploads spread across partitions"""
+	prefix = hashlib.blake2b(decision_url.encode(), digest_size=1).hexdigest()  # 2 hex chars = 256 prefixes
+	return f"{prefix}/{sanitize_filename(title)[:200]}.pdf"
+
+
+def legacy_s3_key(title):
+	"""S3 key used before prefixes were added (bucket root)"""
+	return f"{sanitize_filename(title)[:200]}.pdf"
+
+
+def get_s3_client():
+	"""Get the shared S3 client, creating it on first use"""
+	global _S3_CLIENT
+	if _S3_CLIENT is None:
+		_S3_CLIENT = boto3.client(
 			's3',
 			aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
 			aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-			region_name=os.getenv('AWS_REGION', 'us-east-1')
+			region_name=os.getenv('AWS_REGION', 'us-east-1'),
+			config=Config(
+				max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+				retries={'max_attempts': 10, 'mode': 'adaptive'},
+				s3={'use_accelerate_endpoint': S3_USE_ACCELERATE}
+			)
 		)
-		
-		# Check if object exists
-		s3_client.head_object(Bucket=S3_BUCKET_NAME, Key=s3_key)
+	return _S3_CLIENT
+
+
+def load_existing_s3_keys():
+	"""List every key in the bucket once so existence checks don't need a request per file"""
+	global _EXISTING_S3_KEYS
+	try:
+		keys = set()
+		paginator = get_s3_client().get_paginator('list_objects_v2')
+		for result_page in paginator.paginate(Bucket=S3_BUCKET_NAME):
+			keys.update(obj['Key'] for obj in result_page.get('Contents', []))
+		_EXISTING_S3_KEYS = keys
+		logger.info(f"Found {len(keys)} files already in s3://{S3_BUCKET_NAME}/")
+	except Exception as e:
+		logger.warning(f"⚠️  Could not list S3 bucket, falling back to per-file checks: {e}")
+		_EXISTING_S3_KEYS = None
+
+
+def s3_object_exists(s3_key):
+	"""Check if a file already exists in S3 bucket"""
+	try:
+		get_s3_client().head_object(Bucket=S3_BUCKET_NAME, Key=s3_key)
 		return True
 	except Exception:
 		return False
 
 
-def upload_to_s3(local_file_path, s3_key):
-	"""Upload a file to S3 bucket"""
+def upload_to_s3(body, s3_key):
+	"""Upload a PDF (bytes, or a readable stream for large files) to S3 bucket, never overwriting an existing object"""
 	try:
-		# Check if file already exists in S3
-		if file_exists_in_s3(s3_key):
+		# Known from the startup listing - no request needed
+		if _EXISTING_S3_KEYS is not None and s3_key in _EXISTING_S3_KEYS:
 			logger.info(f"⏭️  Already in S3: s3://{S3_BUCKET_NAME}/{s3_key}")
-			return True  # Return True so local file gets deleted
-		
-		s3_client = boto3.client(
-			's3',
-			aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-			aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-			region_name=os.getenv('AWS_REGION', 'us-east-1')
-		)
+			return True  # Return True so the document gets marked as processed
 		
-		# Upload the file
-		s3_client.upload_file(local_file_path, S3_BUCKET_NAME, s3_key)
+		if isinstance(body, bytes) and len(body) < S3_TRANSFER_CONFIG.multipart_threshold:
+			# Single conditional PUT: S3 itself rejects the write if the key already exists
+			get_s3_client().put_object(Bucket=S3_BUCKET_NAME, Key=s3_key, Body=body, IfNoneMatch="*")
+		else:
+			# Multipart uploads can't be made conditional here, so check for the key first
+			if s3_object_exists(s3_key):
+				logger.info(f"⏭️  Already in S3: s3://{S3_BUCKET_NAME}/{s3_key}")
+				return True
+			fileobj = io.BytesIO(body) if isinstance(body, bytes) else body
+			get_s3_client().upload_fileobj(fileobj, S3_BUCKET_NAME, s3_key, Config=S3_TRANSFER_CONFIG)
+		if _EXISTING_S3_KEYS is not None:
+			_EXISTING_S3_KEYS.add(s3_key)
 		logger.info(f"✓ Uploaded to S3: s3://{S3_BUCKET_NAME}/{s3_key}")
 		return True
+	except ClientError as e:
+		if e.response.get("Error", {}).get("Code") == "PreconditionFailed":
+			logger.info(f"⏭️  Already in S3: s3://{S3_BUCKET_NAME}/{s3_key}")
+			return True
+		logger.error(f"✗ S3 upload failed: {e}")
+		return False
 	except Exception as e:
 		logger.error(f"✗ S3 upload failed: {e}")
 		return False
 
 
-def delete_local_file(file_path):
-	"""Delete a local file after successful upload"""
-	try:
-		if os.path.exists(file_path):
-			os.remove(file_path)
-			logger.info(f"🗑️  Deleted local file: {os.path.basename(file_path)}")
-			return True
-	except Exception as e:
-		logger.warning(f"⚠️  Could not delete local file: {e}")
-		return False
+def get_tracking_db():
+	"""Open the tracking database once per process"""
+	global _TRACKING_DB
+	if _TRACKING_DB is None:
+		# Generous busy timeout: other worker processes may be committing at the same moment
+		_TRACKING_DB = sqlite3.connect(TRACKING_DB, timeout=30)
+		_TRACKING_DB.execute("PRAGMA journal_mode=WAL")
+		_TRACKING_DB.execute("PRAGMA synchronous=NORMAL")
+		_TRACKING_DB.execute("""
+			CREATE TABLE IF NOT EXISTS processed (
+				url TEXT PRIMARY KEY,
+				title TEXT,
+				pdf_url TEXT,
+				s3_key TEXT,
+				downloaded_at TEXT
+			)
+		""")
+		_TRACKING_DB.execute("""
+			CREATE TABLE IF NOT EXISTS imported_files (
+				path TEXT PRIMARY KEY,
+				size INTEGER,
+				mtime REAL
+			)
+		""")
+		_TRACKING_DB.commit()
+		atexit.register(close_tracking_db)
+	return _TRACKING_DB
 
 
-def load_tracking_data():
-	"""Load tracking data from JSON file"""
-	if os.path.exists(TRACKING_FILE):
+def close_tracking_db():
+	"""Checkpoint and close the tracking database, leaving a self-contained .db file"""
+	global _TRACKING_DB
+	if _TRACKING_DB is not None:
 		try:
-			with open(TRACKING_FILE, 'r', encoding='utf-8') as f:
-				data = json.load(f)
-				return data
+			# Fold the WAL back into the main file so copying boards_tracking.db alone is a complete record
+			_TRACKING_DB.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+			_TRACKING_DB.close()
 		except Exception as e:
-			print(f"Warning: Could not load tracking file: {e}")
-			return {"processed_documents": []}
-	return {"processed_documents": []}
+			logger.error(f"Warning: Could not close tracking database: {e}")
+		_TRACKING_DB = None
 
 
-def save_tracking_data(tracking_data):
-	"""Save tracking data to JSON file"""
+def _insert_processed(db, documents):
+	"""Insert processed documents, ignoring URLs that are already tracked"""
+	db.executemany(
+		"INSERT OR IGNORE INTO processed (url, title, pdf_url, s3_key, downloaded_at) VALUES (?, ?, ?, ?, ?)",
+		[
+			(doc.get("url"), doc.get("title"), doc.get("pdf_url"), doc.get("s3_key"), doc.get("downloaded_at"))
+			for doc in documents if doc.get("url")
+		]
+	)
+
+
+def _read_legacy_tracking(path):
+	"""Read the documents from an old JSON or JSONL tracking file"""
+	with open(path, 'r', encoding='utf-8') as f:
+		if path.endswith(".json"):
+			return json.load(f).get("processed_documents", [])
+		documents = []
+		for line in f:
+			line = line.strip()
+			if not line:
+				continue
+			try:
+				documents.append(json.loads(line))
+			except json.JSONDecodeError:
+				continue  # Partially written line from an interrupted run
+		return documents
+
+
+def import_legacy_tracking(db):
+	"""Import old JSON/JSONL tracking files into the database (files are left untouched, each imported once)"""
+	paths = [LEGACY_TRACKING_FILE, LEGACY_TRACKING_LOG] + sorted(glob.glob(LEGACY_TRACKING_SHARDS))
+	for path in paths:
+		if not os.path.exists(path):
+			continue
+		stat = os.stat(path)
+		seen = db.execute("SELECT size, mtime FROM imported_files WHERE path = ?", (path,)).fetchone()
+		if seen == (stat.st_size, stat.st_mtime):
+			continue
+		try:
+			documents = _read_legacy_tracking(path)
+			_insert_processed(db, documents)
+			db.execute("INSERT OR REPLACE INTO imported_files (path, size, mtime) VALUES (?, ?, ?)", (path, stat.st_size, stat.st_mtime))
+			db.commit()
+			logger.info(f"Imported {len(documents)} tracking entries from {path}")
+		except Exception as e:
+			db.rollback()
+			logger.warning(f"Could not import tracking file {path}: {e}")
+
+
+def load_tracking_data(import_legacy=True):
+	"""Load processed URLs and S3 keys from the tracking database"""
+	db = get_tracking_db()
+	if import_legacy:
+		import_legacy_tracking(db)
+	
+	rows = db.execute("SELECT url, s3_key FROM processed").fetchall()
+	# In-memory indexes of processed URLs and S3 keys, so the hot path rarely touches the database
+	return {
+		"_url_set": {url for url, _ in rows},
+		"_key_set": {s3_key for _, s3_key in rows if s3_key},
+	}
+
+
+def save_tracking_data(doc_info):
+	"""Record a single processed document in the tracking database"""
 	try:
-		with open(TRACKING_FILE, 'w', encoding='utf-8') as f:
-			json.dump(tracking_data, f, indent=2, ensure_ascii=False)
+		db = get_tracking_db()
+		_insert_processed(db, [doc_info])
+		# Commit right away so the write lock is never held while other workers wait (cheap in WAL mode)
+		db.commit()
 	except Exception as e:
-		logger.error(f"Warning: Could not save tracking file: {e}")
+		logger.error(f"Warning: Could not save tracking data: {e}")
 
 
 def is_already_processed(tracking_data, document_key):
-	"""Check if a document has already been processed"""
-	existing_keys = [d.get("url") for d in tracking_data.get("processed_documents", [])]
-	return document_key in existing_keys
+	"""Check if a document has already been processed (here or by another worker process)"""
+	if document_key in tracking_data["_url_set"]:
+		return True
+	row = get_tracking_db().execute("SELECT 1 FROM processed WHERE url = ? LIMIT 1", (document_key,)).fetchone()
+	if row:
+		tracking_data["_url_set"].add(document_key)
+		return True
+	return False
 
 
 def mark_as_processed(tracking_data, doc_info):
 	"""Mark a document as processed with detailed info and save"""
 	if not is_already_processed(tracking_data, doc_info.get("url")):
-		if "processed_documents" not in tracking_data:
-			tracking_data["processed_documents"] = []
-		tracking_data["processed_documents"].append(doc_info)
-		save_tracking_data(tracking_data)
+		tracking_data["_url_set"].add(doc_info.get("url"))
+		if doc_info.get("s3_key"):
+			tracking_data["_key_set"].add(doc_info["s3_key"])
+		save_tracking_data(doc_info)
+
+
+class DecisionListingParser(HTMLParser):
+	"""Collect the decision links (href, text) from the #decisionsListing table of a year page"""
+	def __init__(self):
+		super().__init__()
+		self.rows = []
+		self.found_listing = False
+		self._listing_tag = None
+		self._listing_depth = 0
+		self._link = None
+	
+	def handle_starttag(self, tag, attrs):
+		attrs = dict(attrs)
+		if self._listing_tag is None:
+			if attrs.get("id") == "decisionsListing":
+				self.found_listing = True
+				self._listing_tag = tag
+				self._listing_depth = 1
+			return
+		if tag == self._listing_tag:
+			self._listing_depth += 1
+		elif tag == "a" and "canlii" in (attrs.get("class") or "").split() and attrs.get("href"):
+			self._link = {"href": attrs["href"], "text": ""}
+	
+	def handle_endtag(self, tag):
+		if self._listing_tag is None:
+			return
+		if tag == "a" and self._link:
+			self._link["text"] = self._link["text"].strip()
+			self.rows.append(self._link)
+			self._link = None
+		elif tag == self._listing_tag:
+			self._listing_depth -= 1
+			if self._listing_depth == 0:
+				self._listing_tag = None
+	
+	def handle_data(self, data):
+		if self._link:
+			self._link["text"] += data
+
+
+class DecisionPageParser(HTMLParser):
+	"""Collect the title (h1.main-title) and PDF link (#pdf-link) of a decision page"""
+	def __init__(self):
+		super().__init__()
+		self.title = None
+		self.pdf_href = None
+		self._in_title = False
+	
+	def handle_starttag(self, tag, attrs):
+		attrs = dict(attrs)
+		if tag == "h1" and self.title is None and "main-title" in (attrs.get("class") or "").split():
+			self._in_title = True
+			self.title = ""
+		elif attrs.get("id") == "pdf-link" and self.pdf_href is None:
+			self.pdf_href = attrs.get("href")
+	
+	def handle_endtag(self, tag):
+		if tag == "h1" and self._in_title:
+			self._in_title = False
+			self.title = " ".join(self.title.split()) or None
+	
+	def handle_data(self, data):
+		if self._in_title:
+			self.title += data
+
+
+def _fetch_page_fast(url, cookies):
+	"""GET a CanLII page over plain HTTP; None when blocked or answered with a CAPTCHA"""
+	response = get_http_session().get(
+		url,
+		headers={"User-Agent": USER_AGENT, "Referer": "https://www.canlii.org/"},
+		cookies=cookies,
+		timeout=30
+	)
+	if response.status_code != 200 or DATADOME_FRAME_HOST in response.text:
+		return None
+	return response.text
+
+
+def fetch_decision_info_fast(decision_url, cookies):
+	"""Read a decision's title and PDF link over plain HTTP; None when the browser is needed"""
+	try:
+		html = _fetch_page_fast(decision_url, cookies)
+		if html is None:
+			return None
+		parser = DecisionPageParser()
+		parser.feed(html)
+		if not parser.pdf_href:
+			return None
+		return {"title": parser.title, "pdfHref": parser.pdf_href}
+	except Exception as e:
+		logger.debug(f"Static fetch failed for {decision_url}: {e}")
+		return None
+
+
+def fetch_year_decisions_fast(year_url, cookies):
+	"""Read a year page's decision links over plain HTTP; None when the browser is needed (CAPTCHA, blocked, no listing)"""
+	try:
+		html = _fetch_page_fast(year_url, cookies)
+		if html is None:
+			return None
+		parser = DecisionListingParser()
+		parser.feed(html)
+		if not parser.found_listing or not parser.rows:
+			return None
+		return parser.rows
+	except Exception as e:
+		logger.debug(f"Static fetch failed for {year_url}: {e}")
+		return None
 
 
 def get_cookies_dict(page):
@@ -1066,110 +1667,166 @@ def get_cookies_dict(page):
 	return cookie_dict
 
 
-def process_decision_page(page, decision_url, save_dir, tracking_data):
-	"""Process individual decision page and download PDF"""
+def goto_and_wait_for(page, url, selector):
+	"""Navigate and return as soon as the needed element (or a CAPTCHA) is attached to the DOM"""
+	page.goto(url, wait_until="commit")
+	try:
+		page.wait_for_selector(f"{selector}, {CAPTCHA_READY_SELECTOR}", state="attached", timeout=NAVIGATION_SELECTOR_TIMEOUT)
+	except:
+		# Element never showed up (e.g. access restricted page) - let the normal checks inspect the page
+		page.wait_for_load_state("domcontentloaded")
+
+
+def extract_decision_info(page, decision_url, tracking_data, data=None):
+	"""Build a decision's doc info (no download) from prefetched HTTP data, visiting it in the browser when that is missing"""
 	try:
 		if is_already_processed(tracking_data, decision_url):
 			logger.info(f"⏭️  Skipping (already processed): {decision_url.split('/')[-1]}")
-			return
+			return None
 
-		# print(f"  Processing decision: {decision_url}")
-		page.goto(decision_url, wait_until="domcontentloaded")
-		
-		# Check for CAPTCHA
-		if is_captcha_page(page):
-			if handle_captcha_interruption(page):
-				page.goto(decision_url, wait_until="domcontentloaded")
-			else:
-				return
+		if data is None:
+			# print(f"  Processing decision: {decision_url}")
+			goto_and_wait_for(page, decision_url, "#pdf-link, h1.main-title")
+			
+			# Check for CAPTCHA
+			if is_captcha_page(page):
+				if handle_captcha_interruption(page):
+					goto_and_wait_for(page, decision_url, "#pdf-link, h1.main-title")
+				else:
+					return None
+			
+			# Read title and PDF link in a single round trip
+			data = page.evaluate(_DECISION_INFO_JS)
+		doc_title = data["title"] or decision_url.split("/")[-1]
+
+		s3_key = make_s3_key(decision_url, doc_title)
+
+		pdf_href = data["pdfHref"]
+		if pdf_href:
+			full_pdf_url = absolutize(pdf_href)
+			return {
+				"url": decision_url,
+				"title": doc_title,
+				"pdf_url": full_pdf_url,
+				"s3_key": s3_key,
+			}
 		
-		# Extract title for filename
-		title_el = page.locator("h1.main-title")
-		if title_el.count() > 0:
-			doc_title = title_el.inner_text().strip()
-		else:
-			doc_title = decision_url.split("/")[-1]
-
-		# Sanitize title
-		safe_title = sanitize_filename(doc_title)[:200]
-		s3_key = f"{safe_title}.pdf"
-
-		# Find PDF link
-		pdf_link_loc = page.locator("#pdf-link")
-		if pdf_link_loc.count() > 0:
-			pdf_href = pdf_link_loc.get_attribute("href")
-			if pdf_href:
-				full_pdf_url = BASE_URL + pdf_href if pdf_href.startswith("/") else pdf_href
-				output_path = os.path.join(save_dir, s3_key)
-				
-				# Download
-				cookies = get_cookies_dict(page)
-				user_agent = page.evaluate("navigator.userAgent")
-				if download_pdf(full_pdf_url, output_path, cookies, user_agent):
-					# Upload to S3
-					if upload_to_s3(output_path, s3_key):
-						delete_local_file(output_path)
-						
-						# Mark as processed
-						mark_as_processed(tracking_data, {
-							"url": decision_url,
-							"title": doc_title,
-							"pdf_url": full_pdf_url,
-							"s3_key": s3_key,
-							"downloaded_at": time.strftime("%Y-%m-%d %H:%M:%S")
-						})
-		else:
-			pass # Silent skip if no PDF
+		return None # Silent skip if no PDF
 			
 	except Exception as e:
-		print(f"    Error processing decision: {e}")
+		logger.error(f"    Error processing decision: {e}")
+		return None
+
+
+def collect_finished_uploads(tracking_data, wait=False):
+	"""Track every finished background upload; block first when asked to (or when too many are queued)"""
+	global _PENDING_UPLOADS
+	futures = [future for _, future in _PENDING_UPLOADS]
+	if wait:
+		concurrent.futures.wait(futures)
+	elif len(futures) >= MAX_PENDING_UPLOADS:
+		concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+	
+	still_pending = []
+	for doc_info, future in _PENDING_UPLOADS:
+		if not future.done():
+			still_pending.append((doc_info, future))
+		elif future.result():
+			# Mark as processed
+			mark_as_processed(tracking_data, {
+				**doc_info,
+				"downloaded_at": time.strftime("%Y-%m-%d %H:%M:%S")
+			})
+	_PENDING_UPLOADS = still_pending
+
+
+def download_decisions(page, decisions, tracking_data):
+	"""Queue a batch of decision PDFs for background download and S3 upload, without waiting for them"""
+	if not decisions:
+		return
+	
+	headers = {
+		"User-Agent": USER_AGENT,
+		"Referer": "https://www.canlii.org/"
+	}
+	cookies = get_cookies_dict(page)
+	logger.info(f"📥 Queued {len(decisions)} PDFs for download ({PDF_DOWNLOAD_CONCURRENCY} at a time)...")
+	loop = _get_async_loop()
+	for doc_info in decisions:
+		# Uploaded before keys got a prefix: the root key built from the same page title is already in the bucket
+		legacy_key = legacy_s3_key(doc_info["title"])
+		if _EXISTING_S3_KEYS is not None and legacy_key in _EXISTING_S3_KEYS:
+			logger.info(f"⏭️  Already in S3: s3://{S3_BUCKET_NAME}/{legacy_key}")
+			mark_as_processed(tracking_data, {
+				**doc_info,
+				"s3_key": legacy_key,
+				"downloaded_at": time.strftime("%Y-%m-%d %H:%M:%S")
+			})
+			continue
+		future = asyncio.run_coroutine_threadsafe(download_and_upload_async(doc_info, headers, cookies), loop)
+		_PENDING_UPLOADS.append((doc_info, future))
+	
+	collect_finished_uploads(tracking_data)
 
 
 def process_year_page(page, year_url, board_name, year, tracking_data):
 	"""Process a specific year page for a board/tribunal"""
 	try:
-		full_year_url = BASE_URL + year_url if year_url.startswith("/") else year_url
-		logger.info(f"Visiting Year: {year}")
-		page.goto(full_year_url, wait_until="domcontentloaded")
+		full_year_url = absolutize(year_url)
+		logger.info(f"Visiting {board_name} year: {year}")
 		
-		# Check CAPTCHA
-		if is_captcha_page(page):
-			if handle_captcha_interruption(page):
-				page.goto(full_year_url, wait_until="domcontentloaded")
-			else:
-				return
+		# Try the listing over plain HTTP first; the browser only visits the year page when that fails
+		rows = fetch_year_decisions_fast(full_year_url, get_cookies_dict(page))
+		if rows is None:
+			goto_and_wait_for(page, full_year_url, "#decisionsListing")
+			
+			# Check CAPTCHA
+			if is_captcha_page(page):
+				if handle_captcha_interruption(page):
+					goto_and_wait_for(page, full_year_url, "#decisionsListing")
+				else:
+					return
 
-		# Process rows
-		try:
-			page.wait_for_selector("#decisionsListing", timeout=10000)
-		except:
-			logger.warning(f"⚠️ No decisions table found for {year}")
-			return
+			# Process rows
+			try:
+				page.wait_for_selector("#decisionsListing", timeout=10000)
+			except:
+				logger.warning(f"⚠️ No decisions table found for {year}")
+				return
 
-		rows = page.locator("#decisionsListing tr").all()
+			# Collect decision links and titles in a single round trip
+			rows = page.evaluate("""() => Array.from(document.querySelectorAll('#decisionsListing tr a.canlii'))
+				.map(a => ({href: a.getAttribute('href'), text: a.textContent.trim()}))
+				.filter(r => r.href)""")
 		logger.info(f"Found {len(rows)} decisions")
 		
-		# Collect decision URLs first
-		decision_links = []
+		# Filter out already processed links before navigating. Only the URL is trusted here: the S3 key is built
+		# from the decision page's own title, which the listing text often doesn't match (upload_to_s3 still
+		# skips keys already in S3 once the real key is known)
+		unprocessed_links = []
 		for row in rows:
-			link_loc = row.locator("a.canlii")
-			if link_loc.count() > 0:
-				href = link_loc.get_attribute("href")
-				if href:
-					decision_links.append(BASE_URL + href if href.startswith("/") else href)
-		
-		save_dir = os.path.join("downloads", board_name, year)
-		
-		# Filter out already processed links to resume directly
-		unprocessed_links = [url for url in decision_links if not is_already_processed(tracking_data, url)]
-		
-		if len(unprocessed_links) < len(decision_links):
-			logger.info(f"⏭️  Skipping {len(decision_links) - len(unprocessed_links)} previously processed documents")
-		
-		for idx, url in enumerate(unprocessed_links):
-			logger.info(f"[{idx+1}/{len(unprocessed_links)}] Processing decision...")
-			process_decision_page(page, url, save_dir, tracking_data)
-			page.wait_for_timeout(500) # Small delay
+			url = absolutize(row["href"])
+			if not is_already_processed(tracking_data, url):
+				unprocessed_links.append(url)
+		
+		if len(unprocessed_links) < len(rows):
+			logger.info(f"⏭️  Skipping {len(rows) - len(unprocessed_links)} previously processed documents")
+		
+		# Fetch each batch's PDF links over HTTP in parallel, fall back to the browser one by one, then download the batch
+		for start in range(0, len(unprocessed_links), DECISION_BATCH_SIZE):
+			chunk = unprocessed_links[start:start + DECISION_BATCH_SIZE]
+			# Cookies are re-read per batch so a CAPTCHA solved in the browser carries over to plain HTTP
+			cookies = get_cookies_dict(page)
+			prefetched = list(_DECISION_FETCH_POOL.map(fetch_decision_info_fast, chunk, [cookies] * len(chunk)))
+			batch = []
+			for offset, (url, data) in enumerate(zip(chunk, prefetched)):
+				logger.info(f"[{start+offset+1}/{len(unprocessed_links)}] Processing decision...")
+				doc_info = extract_decision_info(page, url, tracking_data, data)
+				if doc_info:
+					batch.append(doc_info)
+				if data is None:
+					page.wait_for_timeout(500) # Small delay after browser visits
+			download_decisions(page, batch, tracking_data)
 			
 	except Exception as e:
 		logger.error(f"Error processing year {year}: {e}")
@@ -1179,44 +1836,39 @@ def process_tribunal(page, tribunal_url, tracking_data):
 	"""Process a board/tribunal main page"""
 	try:
 		logger.info(f"\nProcessing Tribunal: {tribunal_url}")
-		page.goto(tribunal_url, wait_until="domcontentloaded")
+		goto_and_wait_for(page, tribunal_url, "a:has-text('more, by year')")
 		
 		if is_captcha_page(page):
 			if handle_captcha_interruption(page):
-				page.goto(tribunal_url, wait_until="domcontentloaded")
+				goto_and_wait_for(page, tribunal_url, "a:has-text('more, by year')")
 			else:
 				return
 		
-		page.wait_for_timeout(1000)
-		
-		# Find 'more, by year'
-		more_link = page.locator("a", has_text="more, by year")
-		if more_link.count() > 0:
-			more_href = more_link.get_attribute("href")
-			full_more_url = BASE_URL + more_href if more_href.startswith("/") else more_href
-			print(f"  Found 'more, by year' link")
+		# Find 'more, by year' and read its href in a single round trip
+		more_href = page.evaluate("""() => {
+			const link = Array.from(document.querySelectorAll('a'))
+				.find(a => a.textContent.toLowerCase().includes('more, by year'));
+			return link ? link.getAttribute('href') : null;
+		}""")
+		if more_href:
+			full_more_url = absolutize(more_href)
+			logger.info("  Found 'more, by year' link")
 			
 			# Go to nav page
-			page.goto(full_more_url, wait_until="domcontentloaded")
+			goto_and_wait_for(page, full_more_url, "#navYearsSelector")
 			
 			# Wait for selector
 			try:
 				page.wait_for_selector("#navYearsSelector", timeout=10000)
 			except:
-				print("    ⚠️ Years selector not found")
+				logger.warning("    ⚠️ Years selector not found")
 				return
 			
-			# Get years
-			options = page.locator("#navYearsSelector option").all()
-			print(f"  Found {len(options)} years available")
-			
-			# Collect year data
-			years_data = []
-			for opt in options:
-				val = opt.get_attribute("value")
-				text = opt.inner_text().strip()
-				if val:
-					years_data.append((text, val))
+			# Get years as (text, value) pairs in a single round trip
+			years_data = page.evaluate("""() => Array.from(document.querySelectorAll('#navYearsSelector option'))
+				.map(o => [o.textContent.trim(), o.getAttribute('value')])
+				.filter(o => o[1])""")
+			logger.info(f"  Found {len(years_data)} years available")
 			
 			board_name = tribunal_url.rstrip("/").split("/")[-1]
 			
@@ -1225,112 +1877,152 @@ def process_tribunal(page, tribunal_url, tracking_data):
 				process_year_page(page, year_val, board_name, year_text, tracking_data)
 				
 		else:
-			print("  ⚠️ 'more, by year' link not found")
+			logger.warning("  ⚠️ 'more, by year' link not found")
 			
 	except Exception as e:
-		print(f" Error processing tribunal: {e}")
+		logger.error(f" Error processing tribunal: {e}")
 
 
-def main():
-	# Load tracking data
-	tracking_data = load_tracking_data()
-	logger.info(f"Loaded tracking data: {len(tracking_data.get('processed_documents', []))} documents already processed")
-
-	with sync_playwright() as p:
-		# Determine headless mode
-		system_os = platform.system()
-		env_headless = os.getenv("HEADLESS")
-		
-		if env_headless is not None:
-			is_headless = env_headless.lower() == "true"
-		else:
-			# Default to headless on Linux, headed on Windows
-			is_headless = system_os == "Linux"
-			
-		logger.info(f"Running on {system_os}, Headless: {is_headless}")
-		
-		browser = p.firefox.launch(
-			headless=is_headless,
-			args=get_firefox_launch_args(),
-			firefox_user_prefs=get_firefox_user_prefs()
-		)
-		
-		context = browser.new_context(
-			viewport={"width": 1920, "height": 1080},
-			user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:135.0) Gecko/20100101 Firefox/135.0",
-			locale="en-US",
-			timezone_id="America/Toronto",
-			permissions=["geolocation"],
-			geolocation={"latitude": 45.4215, "longitude": -75.6972} # Ottawa
-		)
+def launch_browser(p):
+	"""Launch Firefox with the stealth context and return (browser, page)"""
+	# Determine headless mode
+	system_os = platform.system()
+	env_headless = os.getenv("HEADLESS")
+	
+	if env_headless is not None:
+		is_headless = env_headless.lower() == "true"
+	else:
+		# Default to headless on Linux, headed on Windows
+		is_headless = system_os == "Linux"
 		
-		# Inject all stealth scripts
-		for script in get_stealth_scripts():
-			context.add_init_script(script)
+	logger.info(f"Running on {system_os}, Headless: {is_headless}")
+	
+	browser = p.firefox.launch(
+		headless=is_headless,
+		args=get_firefox_launch_args(),
+		firefox_user_prefs=get_firefox_user_prefs()
+	)
+	
+	context = browser.new_context(
+		viewport={"width": 1920, "height": 1080},
+		user_agent=USER_AGENT,
+		locale="en-US",
+		timezone_id="America/Toronto",
+		permissions=["geolocation"],
+		geolocation={"latitude": 45.4215, "longitude": -75.6972} # Ottawa
+	)
+	
+	# Inject all stealth scripts in one call
+	context.add_init_script(get_stealth_script())
+	
+	# Skip assets we never read
+	context.route("**/*", block_unneeded_resources)
 
-		page = context.new_page()
-		
-		# Add random mouse movement
-		page.mouse.move(random.randint(100, 500), random.randint(100, 500))
-		
-		page.goto(START_URL, wait_until="load")
-		
-		# Initial CAPTCHA Check
-		logger.info("\n🔍 Checking for CAPTCHA on initial page...")
-		datadome_detected = is_datadome_captcha(page)
-		canlii_detected = page.locator("#captchaTag").count() > 0
-		logger.info(f"DataDome CAPTCHA: {'DETECTED' if datadome_detected else 'not found'}")
-		logger.info(f"CanLII CAPTCHA: {'DETECTED' if canlii_detected else 'not found'}")
-		
-		if datadome_detected or canlii_detected or is_captcha_page(page):
-			logger.warning("\n⚠️  CAPTCHA detected on initial page!")
-			auto_solved = solve_captcha_automatically(page)
-			if not auto_solved:
-				logger.info("Please solve the CAPTCHA in the browser window...")
-				while is_captcha_page(page):
-					page.wait_for_timeout(5000)
-				logger.info("✅ CAPTCHA solved! Continuing...")
-			page.wait_for_timeout(3000)
-			
-			# Wait briefly to see if page auto-reloads
-			logger.info("Waiting for page to stabilize...")
-			page.wait_for_timeout(5000)
-			
-			# Check if we are already on the page with content
-			if page.locator("h2", has_text=SECTION_TITLE).count() > 0:
-				logger.info("Page content appears loaded, skipping reload.")
-			else:
-				logger.info("Reloading page explicitly...")
-				try:
-					page.goto(START_URL, wait_until="commit", timeout=60000)
-					try:
-						page.wait_for_load_state("domcontentloaded", timeout=60000)
-					except:
-						pass
-				except Exception as e:
-					print(f"Warning: Navigation timeout after CAPTCHA, continuing anyway: {e}")
-				
-			page.wait_for_timeout(WAIT_MS)
+	page = context.new_page()
+	# Any main-frame navigation (goto, reload, redirect) invalidates the memoized CAPTCHA check
+	page.on("framenavigated", lambda frame: reset_captcha_check_cache() if frame == page.main_frame else None)
+	
+	# Add random mouse movement
+	page.mouse.move(random.randint(100, 500), random.randint(100, 500))
+	return browser, page
 
-		# Handle cookie consent with logging
-		logger.info("Checking for cookie banner...")
+
+def open_start_page(page):
+	"""Open the start page, getting past any CAPTCHA and the cookie banner"""
+	page.goto(START_URL, wait_until="load")
+	
+	# Initial CAPTCHA Check
+	logger.info("\n🔍 Checking for CAPTCHA on initial page...")
+	datadome_detected = is_datadome_captcha(page)
+	canlii_detected = page.locator("#captchaTag").count() > 0
+	logger.info(f"DataDome CAPTCHA: {'DETECTED' if datadome_detected else 'not found'}")
+	logger.info(f"CanLII CAPTCHA: {'DETECTED' if canlii_detected else 'not found'}")
+	
+	if datadome_detected or canlii_detected or is_captcha_page(page):
+		logger.warning("\n⚠️  CAPTCHA detected on initial page!")
+		auto_solved = solve_captcha_automatically(page)
+		if not auto_solved:
+			logger.info("Please solve the CAPTCHA in the browser window...")
+			while is_captcha_page(page):
+				page.wait_for_timeout(5000)
+			logger.info("✅ CAPTCHA solved! Continuing...")
+		page.wait_for_timeout(3000)
 		
-		try:
-			if page.locator("#cookieConsentBanner").count() > 0:
-				logger.info("Cookie banner detected")
+		# Wait briefly to see if page auto-reloads
+		logger.info("Waiting for page to stabilize...")
+		page.wait_for_timeout(5000)
+		
+		# Check if we are already on the page with content
+		if page.locator("h2", has_text=SECTION_TITLE).count() > 0:
+			logger.info("Page content appears loaded, skipping reload.")
+		else:
+			logger.info("Reloading page explicitly...")
+			try:
+				page.goto(START_URL, wait_until="commit", timeout=60000)
 				try:
-					page.evaluate("""
-						const btn = document.getElementById('understandCookieConsent');
-						if (btn) btn.click();
-					""")
-					logger.info("Cookie consent clicked successfully")
+					page.wait_for_load_state("domcontentloaded", timeout=60000)
 				except:
 					pass
-				page.wait_for_timeout(1000)
-		except:
-			pass
-		
+			except Exception as e:
+				logger.warning(f"Navigation timeout after CAPTCHA, continuing anyway: {e}")
+			
 		page.wait_for_timeout(WAIT_MS)
+
+	# Handle cookie consent with logging
+	logger.info("Checking for cookie banner...")
+	
+	try:
+		if page.locator("#cookieConsentBanner").count() > 0:
+			logger.info("Cookie banner detected")
+			try:
+				page.evaluate("""
+					const btn = document.getElementById('understandCookieConsent');
+					if (btn) btn.click();
+				""")
+				logger.info("Cookie consent clicked successfully")
+			except:
+				pass
+			page.wait_for_timeout(1000)
+	except:
+		pass
+	
+	page.wait_for_timeout(WAIT_MS)
+
+
+def finish_pending_work(tracking_data):
+	"""Wait for the last downloads/uploads, track them and release shared resources"""
+	collect_finished_uploads(tracking_data, wait=True)
+	_UPLOAD_POOL.shutdown()
+	_DECISION_FETCH_POOL.shutdown()
+	run_async(_close_aiohttp_session())
+	close_tracking_db()
+
+
+def run_shard(worker_id, links):
+	"""Worker process: scrape a share of the tribunals with its own browser, sharing the tracking database"""
+	tracking_data = load_tracking_data(import_legacy=False)
+	load_existing_s3_keys()
+	logger.info(f"[worker {worker_id}] {len(links)} tribunals to process")
+	
+	with sync_playwright() as p:
+		browser, page = launch_browser(p)
+		open_start_page(page)
+		for i, href in enumerate(links, 1):
+			logger.info(f"[worker {worker_id}] Visiting link {i}/{len(links)}: {href}")
+			process_tribunal(page, absolutize(href), tracking_data)
+		finish_pending_work(tracking_data)
+		browser.close()
+
+
+def main():
+	# Load tracking data
+	tracking_data = load_tracking_data()
+	logger.info(f"Loaded tracking data: {len(tracking_data['_url_set'])} documents already processed")
+	load_existing_s3_keys()
+
+	with sync_playwright() as p:
+		browser, page = launch_browser(p)
+		open_start_page(page)
 		
 		# Collect links
 		logger.info(f"\n=== Collecting {SECTION_TITLE} links ===")
@@ -1374,10 +2066,22 @@ def main():
 				links = collect_links(page, SECTION_TITLE)
 				logger.info(f"Found {len(links)} links after retry")
 		
+		workers = min(SCRAPER_WORKERS, len(links))
+		if workers > 1:
+			# Each worker gets every Nth tribunal and its own browser; this one is no longer needed
+			browser.close()
+			logger.info(f"Splitting {len(links)} tribunals across {workers} worker processes")
+			with multiprocessing.get_context("spawn").Pool(workers) as pool:
+				pool.starmap(run_shard, [(worker_id + 1, links[worker_id::workers]) for worker_id in range(workers)])
+			return
+		
 		for i, href in enumerate(links, 1):
 			logger.info(f"Visiting link {i}/{len(links)}: {href}")
-			url = f"{BASE_URL}{href}"
+			url = absolutize(href)
 			process_tribunal(page, url, tracking_data)
+		
+		# Let the last uploads finish so they get tracked
+		finish_pending_work(tracking_data)
 			
 		browser.close()
 
@@ -5,15 +5,30 @@ import re
 import time
 import random
 import io
+import base64
+import threading
+import queue
+import concurrent.futures
 import boto3
-import requests
-import tempfile
-import whisper
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from pathlib import Path
 from dotenv import load_dotenv
 import platform
-from PIL import Image
 import logging
+import atexit
+from urllib.parse import urljoin
+
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+try:
+	from weasyprint import HTML as WeasyHTML
+except (ImportError, OSError):
+	# Not installed, or its native Pango libraries are missing - PDFs fall back to Chrome
+	WeasyHTML = None
 
 # Load environment variables
 load_dotenv()
@@ -29,77 +44,173 @@ logger = logging.getLogger(__name__)
 BASE_URL = "https://www.canlii.org"
 START_URL = "https://www.canlii.org/ca"
 SECTION_TITLE = "Legislation"
-WAIT_MS = 2000
+MANUAL_CAPTCHA_TIMEOUT_MS = 600000  # One in-browser wait for a manual CAPTCHA solve before re-checking
+MANUAL_CAPTCHA_POLL_MS = 500  # How often the browser re-evaluates the CAPTCHA markers while waiting
+READY_TIMEOUT_MS = 5000  # Longest wait for the element the next step reads (replaces the fixed 2 s sleeps)
+# What each page type reads first; the CAPTCHA markers end the wait early so the CAPTCHA check runs at once
+CAPTCHA_READY_SELECTORS = "#captchaTag, iframe[src*='captcha-delivery.com']"
+START_READY_SELECTOR = f"h2:has-text('{SECTION_TITLE}'), {CAPTCHA_READY_SELECTORS}"
+CATEGORY_READY_SELECTOR = f"#legislationsContainer tr, {CAPTCHA_READY_SELECTORS}"
 OUTPUT_DIR = "legislation_pdfs"
 DOWNLOAD_DELAY_MIN = 1  # Minimum delay in seconds between downloads (increased to avoid CAPTCHAs)
 DOWNLOAD_DELAY_MAX = 2  # Maximum delay in seconds between downloads (increased to avoid CAPTCHAs)
 S3_BUCKET_NAME = "can-bareacts"  # S3 bucket name
-TRACKING_FILE = "download_tracking.json"  # File to track processed documents
-SKIPPED_FILE = "skipped_documents.json"  # File to track repealed/not-in-force documents
+TRACKING_FILE = "download_tracking.jsonl"  # Append-only log, one processed document per line
+LEGACY_TRACKING_FILE = "download_tracking.json"  # Old single-JSON format, migrated on load
+TRACKING_FLUSH_EVERY = 50  # Tracking lines buffered before a flush (a crash only re-processes these)
+SKIPPED_FILE = "skipped_documents.jsonl"  # Append-only log of repealed/not-in-force documents
+LEGACY_SKIPPED_FILE = "skipped_documents.json"  # Old single-JSON format, still read on load
+DOCUMENT_WORKERS = int(os.getenv("DOCUMENT_WORKERS", "1"))  # Browsers processing a category's documents in parallel (one thread each)
+UPLOAD_WORKERS = 8  # Background threads uploading generated PDFs to S3
+MAX_PENDING_UPLOADS = 64  # Queued PDFs before the browser waits for uploads to catch up
+STORAGE_STATE_FILE = "canlii_state.json"  # Cookies/localStorage (incl. the DataDome cookie) kept between runs
+STORAGE_STATE_MAX_AGE_HOURS = 6  # Older saved state is ignored and the run starts cold
 
 # Bedrock CAPTCHA solver configuration
 BEDROCK_MODEL_ID = "qwen.qwen3-vl-235b-a22b"  # Qwen model for vision tasks
 BEDROCK_REGION = os.getenv("AWS_REGION", "us-east-1")
 MAX_CAPTCHA_ATTEMPTS = 50  # Maximum attempts to solve CAPTCHA
+BEDROCK_LATENCY_OPTIMIZED = os.getenv("BEDROCK_LATENCY_OPTIMIZED", "").lower() in ("1", "true", "yes")  # Only for models that support it
+CAPTCHA_BATCH_SIZE = 4  # CAPTCHA images from parallel document workers solved in one converse call
+CAPTCHA_BATCH_WINDOW = 0.1  # Seconds the batcher waits for more images after the first one
+CAPTCHA_BATCH_TIMEOUT = 60  # Seconds a browser waits on the batcher before solving its image directly
+
 
 # Access restriction cooldown settings
 ACCESS_RESTRICTED_WAIT_MIN = 10  # Minimum wait time in minutes
 ACCESS_RESTRICTED_WAIT_MAX = 20  # Maximum wait time in minutes
 
+# Access restriction phrases, matched in the browser against the page's lowercased visible text
+ACCESS_RESTRICTED_PHRASES = [
+	"access denied",
+	"access restricted",
+	"temporarily blocked",
+	"temporarily restricted",
+	"too many requests",
+	"rate limit",
+	"blocked due to",
+	"ip has been blocked",
+	"ip address has been",
+	"automated access",
+	"unusual activity",
+	"suspicious activity",
+	"please try again later",
+	"come back later",
+]
+
+# CAPTCHA indicators, checked in the browser with one evaluate call (per frame for DataDome)
+CANLII_CAPTCHA_SELECTORS = ["#captchaForm", "#captchaTag", "#captchaTest"]
+CANLII_CAPTCHA_TEXTS = ["dear user", "please proceed with our captcha test", "happy searching!"]
+DATADOME_SELECTORS = [
+	"#captcha-container",
+	"#ddv1-captcha-container",
+	"#captcha__frame",
+	"#captcha__audio__button",
+	".captcha__human",
+	".captcha__human__title",
+	"[data-dd-captcha-container]",
+	".sliderContainer",
+]
+
+# Navigation responses that point at a CAPTCHA wall (DataDome answers 403 from captcha-delivery.com)
+CAPTCHA_RESPONSE_STATUSES = {403, 429}
+CAPTCHA_URL_MARKERS = ("captcha", "datadome")
+MIN_DOCUMENT_CONTENT_CHARS = 200  # Less extracted HTML than this after a skipped CAPTCHA check triggers the full check
+
+# True once none of the given CAPTCHA selectors or phrases is on the page (evaluated in the browser while waiting)
+_CAPTCHA_GONE_JS = """([selectors, texts]) => {
+	if (selectors.some(s => document.querySelector(s))) return false;
+	const body = ((document.body && document.body.innerText) || '').toLowerCase();
+	return !texts.some(t => body.includes(t));
+}"""
+
+# Initial-page CAPTCHA status in one round trip: DataDome (widget or its iframe), CanLII, and access restriction
+_CAPTCHA_STATUS_JS = """([ddSelectors, canliiSelectors, canliiTexts, restrictedTexts]) => {
+	const any = selectors => selectors.some(s => document.querySelector(s));
+	const body = ((document.body && document.body.innerText) || '').toLowerCase();
+	return {
+		dd: any(ddSelectors) || !!document.querySelector("iframe[src*='captcha-delivery.com']"),
+		canlii: any(canliiSelectors) || canliiTexts.some(t => body.includes(t)),
+		restricted: restrictedTexts.some(t => body.includes(t)),
+	};
+}"""
+
+# Returns the first matching selector / "text=..." indicator, or null if none match
+_INDICATOR_PROBE_JS = """([selectors, texts]) => {
+	const hit = selectors.find(s => document.querySelector(s));
+	if (hit) return hit;
+	const body = ((document.body && document.body.innerText) || '').toLowerCase();
+	const text = texts.find(t => body.includes(t));
+	return text ? 'text=' + text : null;
+}"""
+
+# DataDome text indicators: the slider prompt, or "Verification Required" inside a CAPTCHA-like container
+_DATADOME_TEXT_PROBE_JS = """() => {
+	const body = ((document.body && document.body.innerText) || '').toLowerCase();
+	if (body.includes('slide right to secure your access')) return 'text=Slide right to secure your access';
+	if (!body.includes('verification required')) return null;
+	const keywords = ['captcha', 'datadome', 'challenge', 'modal', 'overlay'];
+	for (const el of document.querySelectorAll('body *')) {
+		if (el.children.length || !(el.textContent || '').toLowerCase().includes('verification required')) continue;
+		const html = ((el.closest('div') || {}).outerHTML || '').toLowerCase();
+		if (keywords.some(k => html.includes(k))) return 'text=Verification Required (in CAPTCHA context)';
+	}
+	return null;
+}"""
+
+# Resources the scraper never reads, aborted at the route layer
+# (stylesheets stay: "Show more results" and the CAPTCHA image are checked for visibility)
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+BLOCKED_URL_PARTS = ("google-analytics", "googletagmanager", "doubleclick", "hotjar")
+# CAPTCHA assets must always load (the CanLII image is sent to Bedrock, DataDome renders its own widget)
+ALLOWED_URL_PARTS = ("captcha", "datadome")
+
+# AWS clients are built once and shared for the whole run
+S3_MAX_POOL_CONNECTIONS = 32  # Shared S3 client connection pool size
+S3_SINGLE_PUT_MAX_BYTES = 8 * 1024 * 1024  # Files below this go up in one conditional PUT (multipart above)
+_S3_CLIENT = None
+_BEDROCK_CLIENT = None
+
+# Shared between the main thread and document worker threads
+_TRACKING_LOCK = threading.RLock()  # Guards tracking/skipped data and their files
+_ITEM_QUEUE = queue.Queue()  # (index, total, item, results) rows waiting for any browser
+
+# hrefs already in the skipped file, loaded on first use
+_SKIPPED_HREFS = None
+
+# Open handle on the tracking log, appended to as documents finish
+_TRACKING_LOG = None
+_UNFLUSHED_TRACKING_LINES = 0
+
+# CAPTCHA images waiting for the Bedrock batcher: (image_bytes, done event, result slot)
+_CAPTCHA_QUEUE = queue.Queue()
+_CAPTCHA_BATCHER = None
+
+# Per-page flag: True once the page loaded a CAPTCHA document (main frame or iframe) since its last navigation check
+_CAPTCHA_RESPONSE_PAGES = {}
+_CAPTCHA_FLAG_LOCK = threading.Lock()  # Response listeners and worker threads both touch the flags
+
+# Uploads run in the background while the browser moves on to the next document
+_UPLOAD_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=UPLOAD_WORKERS)
+_PENDING_UPLOADS = []  # (doc_info, future) of uploads not yet collected
+_UPLOAD_RESULTS = {"uploaded": 0, "failed": 0}  # Outcomes of collected uploads
+
+# Whisper model is loaded lazily on the first audio CAPTCHA and reused afterwards
+WHISPER_MODEL_SIZE = os.getenv("WHISPER_MODEL_SIZE", "tiny.en")  # English-only tiny is plenty for six spoken digits; "base.en" if accuracy drops
+_WHISPER_MODEL = None
+_MODEL_LOCK = threading.Lock()  # Guards the lazy Whisper load against concurrent first use
+_CAPTCHA_LOCK = threading.RLock()  # One CAPTCHA solve at a time across all browsers (re-entrant: solves retry themselves)
+
 
 
 def is_access_restricted_page(page):
 	"""Check if the page shows an access restricted/IP blocked message"""
 	try:
-		access_restricted_indicators = [
-			"text=Access Denied",
-			"text=access denied",
-			"text=Access Restricted",
-			"text=access restricted",
-			"text=temporarily blocked",
-			"text=temporarily restricted",
-			"text=Too many requests",
-			"text=too many requests",
-			"text=rate limit",
-			"text=Rate Limit",
-			"text=blocked due to",
-			"text=IP has been blocked",
-			"text=IP address has been",
-			"text=automated access",
-			"text=unusual activity",
-			"text=suspicious activity",
-			"text=Please try again later",
-			"text=come back later",
-		]
-		
-		for indicator in access_restricted_indicators:
-			try:
-				if page.locator(indicator).count() > 0:
-					logger.warning(f"🚫 Access restriction detected via: {indicator}")
-					return True
-			except:
-				continue
-		
-		# Also check page content for common blocking messages
-		try:
-			body_text = page.locator("body").inner_text().lower()
-			blocking_phrases = [
-				"access denied",
-				"access restricted",
-				"temporarily blocked",
-				"too many requests",
-				"rate limit exceeded",
-				"ip has been blocked",
-				"ip address has been blocked",
-				"automated access detected",
-				"unusual activity detected",
-			]
-			for phrase in blocking_phrases:
-				if phrase in body_text:
-					logger.warning(f"🚫 Access restriction detected in body: '{phrase}'")
-					return True
-		except:
-			pass
+		# Scan the body text in the browser so only the matching phrase comes back
+		indicator = page.evaluate(_INDICATOR_PROBE_JS, [[], ACCESS_RESTRICTED_PHRASES])
+		if indicator:
+			logger.warning(f"🚫 Access restriction detected via: {indicator}")
+			return True
 		
 		return False
 	except:
@@ -146,6 +257,20 @@ def get_firefox_launch_args():
 	return []
 
 
+def get_pdf_browser_args():
+	"""Get Chromium arguments for the PDF renderer (no UI, updater or background networking)"""
+	return [
+		"--disable-features=Translate,BackForwardCache,AcceptCHFrame,MediaRouter,OptimizationHints",
+		"--disable-component-update",
+		"--disable-background-networking",
+		"--disable-extensions",
+		"--disable-sync",
+		"--no-default-browser-check",
+		"--no-first-run",
+		"--mute-audio",
+	]
+
+
 def get_firefox_user_prefs():
 	"""Get Firefox user preferences for stealth"""
 	return {
@@ -164,6 +289,18 @@ def get_firefox_user_prefs():
 	}
 
 
+def block_unneeded_resources(route):
+	"""Abort images, fonts, media and trackers, letting CAPTCHA assets through"""
+	request = route.request
+	url = request.url.lower()
+	if any(part in url for part in ALLOWED_URL_PARTS):
+		route.continue_()
+	elif request.resource_type in BLOCKED_RESOURCE_TYPES or any(part in url for part in BLOCKED_URL_PARTS):
+		route.abort()
+	else:
+		route.continue_()
+
+
 def get_stealth_scripts():
 	"""Get list of JavaScripts to inject for evasion"""
 	return [
@@ -203,6 +340,28 @@ def get_stealth_scripts():
 	]
 
 
+# Browser context fingerprint shared by every scraper browser
+_CONTEXT_KWARGS = {
+	"viewport": {"width": 1920, "height": 1080},
+	"user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:135.0) Gecko/20100101 Firefox/135.0",
+	"locale": "en-US",
+	"timezone_id": "America/Toronto",
+	"permissions": ["geolocation"],
+	"geolocation": {"latitude": 45.4215, "longitude": -75.6972},  # Ottawa
+}
+
+
+# All stealth snippets in one init script, each isolated so one failure can't stop the rest
+_STEALTH_BUNDLE = "\n".join(
+	f"(() => {{ try {{ {script} }} catch (e) {{}} }})();" for script in get_stealth_scripts()
+)
+
+
+def get_stealth_script():
+	"""Get the bundled stealth JavaScript, injected with a single add_init_script call"""
+	return _STEALTH_BUNDLE
+
+
 def sanitize_filename(filename):
 	"""Remove invalid characters from filename"""
 	return re.sub(r'[<>:"/\\|?*]', '_', filename)
@@ -216,91 +375,220 @@ def delay_between_downloads():
 	# time.sleep(delay)
 
 
-def file_exists_in_s3(s3_key):
-	"""Check if a file already exists in S3 bucket"""
-	try:
-		s3_client = boto3.client(
+def get_s3_client():
+	"""Get the shared S3 client, creating it on first use"""
+	global _S3_CLIENT
+	if _S3_CLIENT is None:
+		_S3_CLIENT = boto3.client(
 			's3',
 			aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
 			aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-			region_name=os.getenv('AWS_REGION', 'us-east-1')
+			region_name=os.getenv('AWS_REGION', 'us-east-1'),
+			config=Config(
+				max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+				retries={'max_attempts': 5, 'mode': 'adaptive'},
+				tcp_keepalive=True
+			)
 		)
-		
+	return _S3_CLIENT
+
+
+def file_exists_in_s3(s3_key):
+	"""Check if a file already exists in S3 bucket"""
+	try:
 		# Check if object exists
-		s3_client.head_object(Bucket=S3_BUCKET_NAME, Key=s3_key)
+		get_s3_client().head_object(Bucket=S3_BUCKET_NAME, Key=s3_key)
 		return True
 	except Exception:
 		return False
 
 
 def upload_to_s3(local_file_path, s3_key):
-	"""Upload a file to S3 bucket"""
+	"""Upload a file to S3 bucket, never overwriting an existing object"""
 	try:
-		# Check if file already exists in S3
-		if file_exists_in_s3(s3_key):
-			print(f"  ⏭️  Already in S3: s3://{S3_BUCKET_NAME}/{s3_key}")
-			return True  # Return True so local file gets deleted
-		
-		s3_client = boto3.client(
-			's3',
-			aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-			aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-			region_name=os.getenv('AWS_REGION', 'us-east-1')
-		)
-		
-		# Upload the file
-		s3_client.upload_file(local_file_path, S3_BUCKET_NAME, s3_key)
+		if os.path.getsize(local_file_path) < S3_SINGLE_PUT_MAX_BYTES:
+			# Single conditional PUT: S3 itself rejects the write if the key already exists
+			with open(local_file_path, 'rb') as f:
+				get_s3_client().put_object(Bucket=S3_BUCKET_NAME, Key=s3_key, Body=f, IfNoneMatch="*")
+		else:
+			if file_exists_in_s3(s3_key):
+				print(f"  ⏭️  Already in S3: s3://{S3_BUCKET_NAME}/{s3_key}")
+				return True  # Return True so local file gets deleted
+			get_s3_client().upload_file(local_file_path, S3_BUCKET_NAME, s3_key)
 		print(f"  ✓ Uploaded to S3: s3://{S3_BUCKET_NAME}/{s3_key}")
 		return True
+	except ClientError as e:
+		if e.response.get("Error", {}).get("Code") == "PreconditionFailed":
+			print(f"  ⏭️  Already in S3: s3://{S3_BUCKET_NAME}/{s3_key}")
+			return True  # Return True so local file gets deleted
+		print(f"  ✗ S3 upload failed: {e}")
+		return False
 	except Exception as e:
 		print(f"  ✗ S3 upload failed: {e}")
 		return False
 
 
+def to_json_line(doc):
+	"""Serialize one record as a JSONL line (orjson when installed)"""
+	if orjson is not None:
+		return orjson.dumps(doc).decode("utf-8") + "\n"
+	return json.dumps(doc, ensure_ascii=False) + "\n"
+
+
+def read_jsonl(path):
+	"""Read every record of a JSONL file, skipping blank or partially written lines"""
+	records = []
+	with open(path, 'r', encoding='utf-8') as f:
+		for line in f:
+			line = line.strip()
+			if not line:
+				continue
+			try:
+				records.append(orjson.loads(line) if orjson is not None else json.loads(line))
+			except ValueError:
+				continue  # Partially written line from an interrupted run
+	return records
+
+
 def load_tracking_data():
-	"""Load tracking data from JSON file"""
-	if os.path.exists(TRACKING_FILE):
+	"""Load tracking data from the JSONL log (and legacy JSON file), compacting it on startup"""
+	documents = {}
+	
+	if os.path.exists(LEGACY_TRACKING_FILE):
 		try:
-			with open(TRACKING_FILE, 'r', encoding='utf-8') as f:
+			with open(LEGACY_TRACKING_FILE, 'r', encoding='utf-8') as f:
 				data = json.load(f)
-				# Handle migration from old format (list of strings) to new format (list of objects)
-				if data.get("processed_documents") and isinstance(data["processed_documents"][0], str):
-					# Old format - convert to new format
-					data["processed_keys"] = data["processed_documents"]
-					data["processed_documents"] = []
-				return data
+			# Very old files hold plain key strings instead of document objects
+			for doc in data.get("processed_keys", []) + data.get("processed_documents", []):
+				doc = {"key": doc} if isinstance(doc, str) else doc
+				documents.setdefault(doc.get("key"), doc)
+		except Exception as e:
+			print(f"Warning: Could not load legacy tracking file: {e}")
+	
+	if os.path.exists(TRACKING_FILE):
+		try:
+			for doc in read_jsonl(TRACKING_FILE):
+				documents.setdefault(doc.get("key"), doc)
 		except Exception as e:
 			print(f"Warning: Could not load tracking file: {e}")
-			return {"processed_documents": [], "processed_keys": []}
-	return {"processed_documents": [], "processed_keys": []}
+	
+	data = {"processed_documents": list(documents.values())}
+	# In-memory index of processed keys for O(1) lookups (never written to disk)
+	data["_key_set"] = set(documents)
+	compact_tracking_file(data)
+	return data
 
 
-def save_tracking_data(tracking_data):
-	"""Save tracking data to JSON file"""
+def compact_tracking_file(tracking_data):
+	"""Rewrite the JSONL log with exactly one line per processed document"""
+	# Write a temp file and swap it in, so a crash mid-write never loses the existing log
+	tmp_file = TRACKING_FILE + ".tmp"
 	try:
-		with open(TRACKING_FILE, 'w', encoding='utf-8') as f:
-			json.dump(tracking_data, f, indent=2, ensure_ascii=False)
+		with open(tmp_file, 'w', encoding='utf-8') as f:
+			for doc in tracking_data.get("processed_documents", []):
+				f.write(to_json_line(doc))
+			f.flush()
+			os.fsync(f.fileno())
+		os.replace(tmp_file, TRACKING_FILE)
+	except Exception as e:
+		logger.warning(f"Could not compact tracking file: {e}")
+
+
+def save_tracking_data(doc_info):
+	"""Append a single processed document to the JSONL tracking log, flushing every few entries"""
+	global _TRACKING_LOG, _UNFLUSHED_TRACKING_LINES
+	try:
+		if _TRACKING_LOG is None:
+			_TRACKING_LOG = open(TRACKING_FILE, 'a', encoding='utf-8')
+			atexit.register(close_tracking_log)
+		_TRACKING_LOG.write(to_json_line(doc_info))
+		_UNFLUSHED_TRACKING_LINES += 1
+		if _UNFLUSHED_TRACKING_LINES >= TRACKING_FLUSH_EVERY:
+			_TRACKING_LOG.flush()
+			_UNFLUSHED_TRACKING_LINES = 0
 	except Exception as e:
 		print(f"Warning: Could not save tracking file: {e}")
 
 
+def close_tracking_log():
+	"""Flush and close the tracking log (also registered with atexit, so Ctrl+C keeps buffered entries)"""
+	global _TRACKING_LOG, _UNFLUSHED_TRACKING_LINES
+	with _TRACKING_LOCK:
+		if _TRACKING_LOG is not None:
+			try:
+				_TRACKING_LOG.close()
+			except Exception as e:
+				print(f"Warning: Could not close tracking file: {e}")
+			_TRACKING_LOG = None
+			_UNFLUSHED_TRACKING_LINES = 0
+
+
 def is_already_processed(tracking_data, document_key):
 	"""Check if a document has already been processed"""
-	# Check both old format (processed_keys) and new format (processed_documents)
-	if document_key in tracking_data.get("processed_keys", []):
-		return True
-	existing_keys = [d.get("key") for d in tracking_data.get("processed_documents", []) if isinstance(d, dict)]
-	return document_key in existing_keys
+	return document_key in tracking_data["_key_set"]
 
 
 def mark_as_processed(tracking_data, doc_info):
 	"""Mark a document as processed with detailed info and save"""
 	doc_key = doc_info.get("key", "")
-	if not is_already_processed(tracking_data, doc_key):
-		if "processed_documents" not in tracking_data:
-			tracking_data["processed_documents"] = []
-		tracking_data["processed_documents"].append(doc_info)
-		save_tracking_data(tracking_data)
+	with _TRACKING_LOCK:
+		if not is_already_processed(tracking_data, doc_key):
+			tracking_data["processed_documents"].append(doc_info)
+			tracking_data["_key_set"].add(doc_key)
+			save_tracking_data(doc_info)
+
+
+def upload_and_cleanup(pdf_path, s3_key, tracking_data, doc_info):
+	"""Upload a generated PDF, delete the local copy and mark it as processed (runs on the upload pool)"""
+	if upload_to_s3(pdf_path, s3_key):
+		delete_local_file(pdf_path)
+		mark_as_processed(tracking_data, doc_info)
+		return True
+	return False
+
+
+def queue_upload(doc_info, job, *args):
+	"""Hand an upload job to the upload pool, waiting first if too many are already pending"""
+	collect_finished_uploads()
+	future = _UPLOAD_POOL.submit(job, *args)
+	with _TRACKING_LOCK:
+		_PENDING_UPLOADS.append((doc_info, future))
+
+
+def collect_finished_uploads(wait=False):
+	"""Count and report finished background uploads; block first when asked to (or when too many are queued)"""
+	global _PENDING_UPLOADS
+	with _TRACKING_LOCK:
+		futures = [future for _, future in _PENDING_UPLOADS]
+	if wait:
+		concurrent.futures.wait(futures)
+	elif len(futures) >= MAX_PENDING_UPLOADS:
+		concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+	
+	with _TRACKING_LOCK:
+		still_pending = []
+		for doc_info, future in _PENDING_UPLOADS:
+			if not future.done():
+				still_pending.append((doc_info, future))
+				continue
+			try:
+				uploaded = future.result()
+			except Exception as e:
+				logger.error(f"✗ Upload job crashed for {doc_info.get('s3_key')}: {e}")
+				uploaded = False
+			if uploaded:
+				_UPLOAD_RESULTS["uploaded"] += 1
+			else:
+				_UPLOAD_RESULTS["failed"] += 1
+				logger.warning(f"✗ Upload failed, will be retried next run: {doc_info.get('s3_key')}")
+		_PENDING_UPLOADS = still_pending
+
+
+def wait_for_pending_uploads():
+	"""Block until every queued upload has finished and been counted"""
+	if _PENDING_UPLOADS:
+		print(f"  ⏳ Waiting for {len(_PENDING_UPLOADS)} uploads to finish...")
+	collect_finished_uploads(wait=True)
 
 
 def delete_local_file(file_path):
@@ -315,6 +603,40 @@ def delete_local_file(file_path):
 		return False
 
 
+def start_navigation(page, url):
+	"""Navigate only until the response arrives (the page keeps loading in the background); returns the Response or None"""
+	try:
+		return page.goto(url, wait_until="commit")
+	except Exception as e:
+		print(f"  Could not start background navigation: {e}")
+		return None
+
+
+def wait_ready(page, selector, timeout=READY_TIMEOUT_MS):
+	"""Wait until the selector is attached, falling through on timeout like the old fixed sleep did"""
+	try:
+		page.locator(selector).first.wait_for(state="attached", timeout=timeout)
+		return True
+	except:
+		return False
+
+
+def wait_for_condition(page, condition, timeout=10000, interval=500, max_interval=4000):
+	"""Poll condition() with doubling back-off until it holds; always checks once more at the deadline"""
+	deadline = time.time() + timeout / 1000
+	while True:
+		try:
+			if condition():
+				return True
+		except:
+			pass
+		remaining_ms = (deadline - time.time()) * 1000
+		if remaining_ms <= 0:
+			return False
+		page.wait_for_timeout(min(interval, remaining_ms))
+		interval = min(interval * 2, max_interval)
+
+
 def collect_category_links(page, section_title):
 	"""Collect main legislation category links from the homepage"""
 	section = page.locator("section", has=page.locator("h2", has_text=section_title))
@@ -326,27 +648,34 @@ def collect_category_links(page, section_title):
 
 
 def load_skipped_data():
-	"""Load skipped documents data from JSON file"""
+	"""Load skipped documents from the JSONL log (and legacy JSON file)"""
+	skipped = []
+	if os.path.exists(LEGACY_SKIPPED_FILE):
+		try:
+			with open(LEGACY_SKIPPED_FILE, 'r', encoding='utf-8') as f:
+				skipped.extend(json.load(f).get("skipped_documents", []))
+		except Exception as e:
+			print(f"Warning: Could not load legacy skipped file: {e}")
 	if os.path.exists(SKIPPED_FILE):
 		try:
-			with open(SKIPPED_FILE, 'r', encoding='utf-8') as f:
-				return json.load(f)
+			skipped.extend(read_jsonl(SKIPPED_FILE))
 		except Exception as e:
 			print(f"Warning: Could not load skipped file: {e}")
-			return {"skipped_documents": []}
-	return {"skipped_documents": []}
+	return {"skipped_documents": skipped}
 
 
 def save_skipped_document(doc_info):
 	"""Save a skipped document to the tracking file"""
+	global _SKIPPED_HREFS
 	try:
-		skipped_data = load_skipped_data()
-		# Check if already in list (by href)
-		existing_hrefs = [d.get("href") for d in skipped_data.get("skipped_documents", [])]
-		if doc_info.get("href") not in existing_hrefs:
-			skipped_data["skipped_documents"].append(doc_info)
-			with open(SKIPPED_FILE, 'w', encoding='utf-8') as f:
-				json.dump(skipped_data, f, indent=2, ensure_ascii=False)
+		with _TRACKING_LOCK:
+			if _SKIPPED_HREFS is None:
+				_SKIPPED_HREFS = {d.get("href") for d in load_skipped_data().get("skipped_documents", [])}
+			# Check if already in list (by href) without re-reading the file
+			if doc_info.get("href") not in _SKIPPED_HREFS:
+				_SKIPPED_HREFS.add(doc_info.get("href"))
+				with open(SKIPPED_FILE, 'a', encoding='utf-8') as f:
+					f.write(to_json_line(doc_info))
 	except Exception as e:
 		print(f"Warning: Could not save skipped document: {e}")
 
@@ -377,14 +706,14 @@ def is_document_in_force(page, href="", title=""):
 		return True  # Assume in force if check fails to be safe
 
 
-def extract_document_content(page, href="", title=""):
+def extract_document_content(page, href="", title="", check_captcha=True):
 	"""Extract title and structured content from a legislation document page"""
 	try:
 		# Remove cookie modal first to prevent interference
 		force_remove_cookie_modal(page)
 		
-		# Check for CAPTCHA first
-		if is_captcha_page(page):
+		# Check for CAPTCHA first (skipped when the navigation response was already clean)
+		if check_captcha and is_captcha_page(page):
 			logger.warning("\n⚠️  CAPTCHA DETECTED during content extraction!")
 			
 			if handle_captcha_interruption(page):
@@ -393,7 +722,6 @@ def extract_document_content(page, href="", title=""):
 				try:
 					doc_url = f"{BASE_URL}{href}"
 					page.goto(doc_url, wait_until="load")
-					page.wait_for_load_state("domcontentloaded")
 					force_remove_cookie_modal(page)
 				except Exception as nav_e:
 					logger.error(f"   ❌ Failed to reload document after recovery: {nav_e}")
@@ -463,6 +791,33 @@ def extract_document_content(page, href="", title=""):
 		return None, None
 
 
+def is_captcha_response(response):
+	"""Check a navigation response for the CAPTCHA wall signature (status code or CAPTCHA URL)"""
+	url = response.url.lower()
+	return response.status in CAPTCHA_RESPONSE_STATUSES or any(marker in url for marker in CAPTCHA_URL_MARKERS)
+
+
+def flag_captcha_responses(page):
+	"""Flag the page as soon as it loads a CAPTCHA document, without polling the DOM"""
+	def on_response(response):
+		try:
+			if response.request.resource_type == "document" and is_captcha_response(response):
+				with _CAPTCHA_FLAG_LOCK:
+					_CAPTCHA_RESPONSE_PAGES[page] = True
+		except:
+			pass
+	page.on("response", on_response)
+
+
+def needs_captcha_check(page, response):
+	"""Return False only when the navigation was a clean 200 and no CAPTCHA document was loaded"""
+	with _CAPTCHA_FLAG_LOCK:
+		flagged = _CAPTCHA_RESPONSE_PAGES.pop(page, False)
+	if flagged or response is None:
+		return True
+	return response.status != 200 or is_captcha_response(response)
+
+
 def is_captcha_page(page):
 	"""Check if the current page is a CAPTCHA page (CanLII or DataDome) or access restricted"""
 	try:
@@ -470,19 +825,9 @@ def is_captcha_page(page):
 		if is_access_restricted_page(page):
 			return True
 		
-		# Check for CanLII CAPTCHA elements
-		captcha_indicators = [
-			"text=Dear User",
-			"text=please proceed with our captcha test",
-			"#captchaForm",
-			"#captchaTag",
-			"text=Happy Searching!",
-			"#captchaTest"
-		]
-		
-		for indicator in captcha_indicators:
-			if page.locator(indicator).count() > 0:
-				return True
+		# Check for CanLII CAPTCHA elements and text in a single round trip
+		if page.evaluate(_INDICATOR_PROBE_JS, [CANLII_CAPTCHA_SELECTORS, CANLII_CAPTCHA_TEXTS]):
+			return True
 		
 		# Check for DataDome CAPTCHA
 		if is_datadome_captcha(page):
@@ -496,61 +841,60 @@ def is_captcha_page(page):
 def is_datadome_captcha(page, silent=False):
 	"""Check if the current page has a DataDome CAPTCHA, checking all frames"""
 	try:
-		# Primary CAPTCHA-specific indicators (these are definitive)
-		primary_indicators = [
-			"#captcha-container",
-			"#ddv1-captcha-container",
-			"#captcha__frame",
-			"#captcha__audio__button",
-			".captcha__human",
-			".captcha__human__title",
-			"[data-dd-captcha-container]",
-			".sliderContainer",
-		]
-		
-		# Check main page and all frames for primary indicators
+		# Primary CAPTCHA-specific indicators (these are definitive), one round trip per frame
 		for frame in page.frames:
-			for indicator in primary_indicators:
-				try:
-					if frame.locator(indicator).count() > 0:
-						if not silent:
-							logger.info(f"🔴 DataDome detected via: {indicator}")
-						return frame
-				except:
-					continue
+			try:
+				indicator = frame.evaluate(_INDICATOR_PROBE_JS, [DATADOME_SELECTORS, []])
+				if indicator:
+					if not silent:
+						logger.info(f"🔴 DataDome detected via: {indicator}")
+					return frame
+			except:
+				continue
 		
-		# Secondary check: Only look for text indicators if they appear with CAPTCHA context
-		# Check for "Verification Required" only if it's in a modal/overlay/captcha-like container
-		try:
-			for frame in page.frames:
-				# Check if "Verification Required" exists
-				if frame.locator("text=Verification Required").count() > 0:
-					# Verify it's in a CAPTCHA context by checking for captcha-related parent elements
-					verification_elements = frame.locator("text=Verification Required").all()
-					for elem in verification_elements:
-						try:
-							# Check if this element is inside a captcha-related container
-							parent_html = elem.evaluate("el => el.closest('div')?.outerHTML || ''")
-							if any(keyword in parent_html.lower() for keyword in ['captcha', 'datadome', 'challenge', 'modal', 'overlay']):
-								if not silent:
-									logger.info(f"🔴 DataDome detected via: text=Verification Required (in CAPTCHA context)")
-								return frame
-						except:
-							pass
-				
-				# Check for slider challenge text (this is more specific)
-				if frame.locator("text=Slide right to secure your access").count() > 0:
+		# Secondary check: text indicators, only counted when they appear with CAPTCHA context
+		for frame in page.frames:
+			try:
+				indicator = frame.evaluate(_DATADOME_TEXT_PROBE_JS)
+				if indicator:
 					if not silent:
-						logger.info(f"🔴 DataDome detected via: text=Slide right to secure your access")
+						logger.info(f"🔴 DataDome detected via: {indicator}")
 					return frame
-		except:
-			pass
+			except:
+				continue
 		
 		return None
 	except:
 		return None
 
 
+def reload_after_captcha(page, url, timeout=30000):
+	"""Reload the page a CAPTCHA interrupted; the solve's cookies stay in this context, so a reload is enough"""
+	has_datadome_cookie = any(cookie["name"] == "datadome" for cookie in page.context.cookies())
+	logger.info(f"DataDome cookie after solve: {'present' if has_datadome_cookie else 'missing'}")
+	if page.url.split("#")[0].rstrip("/") == url.rstrip("/"):
+		page.reload(wait_until="domcontentloaded", timeout=timeout)
+	else:
+		# The CAPTCHA moved us elsewhere (e.g. a recovery went via the homepage), so navigate back
+		page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+
+
+def wait_for_manual_captcha_solve(page):
+	"""Block until the CAPTCHA is solved by hand, polling inside the browser instead of every 5 seconds"""
+	selectors = CANLII_CAPTCHA_SELECTORS + DATADOME_SELECTORS + ["iframe[src*='captcha-delivery.com']"]
+	texts = CANLII_CAPTCHA_TEXTS + ACCESS_RESTRICTED_PHRASES + ["slide right to secure your access"]
+	while True:
+		try:
+			page.wait_for_function(_CAPTCHA_GONE_JS, arg=[selectors, texts], timeout=MANUAL_CAPTCHA_TIMEOUT_MS, polling=MANUAL_CAPTCHA_POLL_MS)
+		except:
+			pass  # Navigation during the solve or timeout; the full check below decides
+		# Confirm with the full check (also covers indicators inside frames)
+		if not is_captcha_page(page):
+			return
+		# Still blocked on something the predicate can't see: back off to the old polling rate
+		page.wait_for_timeout(5000)
+
+
 def is_datadome_access_restricted(page):
 	"""
 	Check if the DataDome CAPTCHA is showing 'Access is temporarily restricted' message.
@@ -659,12 +1003,13 @@ def solve_datadome_audio_captcha(page):
 		
 		# Download the audio file
 		try:
-			response = requests.get(audio_url, timeout=30)
-			if response.status_code != 200:
-				logger.error(f"⚠️  Failed to download audio: {response.status_code}")
+			# Fetch through the browser context so DataDome cookies and pooled connections are reused
+			response = page.context.request.get(audio_url, timeout=30000)
+			if not response.ok:
+				logger.error(f"⚠️  Failed to download audio: {response.status}")
 				return False
 			
-			audio_data = response.content
+			audio_data = response.body()
 		except Exception as e:
 			logger.error(f"⚠️  Error downloading audio: {e}")
 			return False
@@ -839,24 +1184,17 @@ def solve_canlii_audio_captcha(page):
 			logger.warning("⚠️  Audio source not found")
 			return False
 			
-		full_audio_url = BASE_URL + audio_src if audio_src.startswith("/") else audio_src
+		full_audio_url = urljoin(BASE_URL, audio_src)
 		logger.info(f"📥 Downloading audio from: {full_audio_url[:50]}...")
 		
-		# Download audio with headers to avoid 403
-		cookies = get_cookies_dict(page)
-		user_agent = page.evaluate("navigator.userAgent")
-		headers = {
-			"User-Agent": user_agent,
-			"Referer": page.url
-		}
-		
-		response = requests.get(full_audio_url, headers=headers, cookies=cookies, timeout=30)
+		# Download audio through the browser context (shares its cookies and user agent) to avoid 403
+		response = page.context.request.get(full_audio_url, headers={"Referer": page.url}, timeout=30000)
 		
-		if response.status_code != 200:
-			logger.error(f"⚠️  Failed to download audio: {response.status_code}")
+		if not response.ok:
+			logger.error(f"⚠️  Failed to download audio: {response.status}")
 			return False
 			
-		audio_data = response.content
+		audio_data = response.body()
 		
 		# Transcribe
 		numbers = transcribe_audio_captcha(audio_data)
@@ -902,48 +1240,56 @@ def solve_canlii_audio_captcha(page):
 		return False
 
 
+def get_whisper_model():
+	"""Get the shared Whisper model, loading it on first use"""
+	global _WHISPER_MODEL
+	if _WHISPER_MODEL is None:
+		with _MODEL_LOCK:
+			if _WHISPER_MODEL is None:
+				import ctranslate2
+				from faster_whisper import WhisperModel
+				
+				# Run on the GPU in float16 when CUDA is available, otherwise int8 on CPU
+				if ctranslate2.get_cuda_device_count() > 0:
+					device, compute_type = "cuda", "float16"
+				else:
+					device, compute_type = "cpu", "int8"
+				
+				logger.info(f"⏳ Loading Whisper model ({WHISPER_MODEL_SIZE}, {device}/{compute_type})...")
+				# This will download the model on first run - approx 75MB
+				_WHISPER_MODEL = WhisperModel(WHISPER_MODEL_SIZE, device=device, compute_type=compute_type)
+	return _WHISPER_MODEL
+
+
 def transcribe_audio_captcha(audio_data):
 	"""Transcribe audio CAPTCHA using local Whisper model"""
-	temp_path = None
 	try:
-		# Save audio to temp file
-		with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-			f.write(audio_data)
-			temp_path = f.name
-		
-		print("    ⏳ Loading Whisper model (base)...")
-		# Load the model (this will download it on first run - approx 140MB)
-		model = whisper.load_model("base")
-		
-		# Suppress FP16 warning on CPU
-		import warnings
-		warnings.filterwarnings("ignore", message="FP16 is not supported on CPU")
+		model = get_whisper_model()
 		
 		logger.info("Transcribing audio...")
-		result = model.transcribe(temp_path)
-		transcript = result["text"]
+		# faster-whisper decodes the in-memory file itself (PyAV, 16kHz mono) - no temp file or ffmpeg process
+		segments, _ = model.transcribe(
+			io.BytesIO(audio_data),
+			language="en",
+			beam_size=1,
+			vad_filter=False,
+			without_timestamps=True,
+		)
+		transcript = "".join(seg.text for seg in segments)
 		
 		# Extract only digits
-		numbers = re.sub(r'[^0-9]', '', transcript)
-		
-		# Clean up
-		if temp_path and os.path.exists(temp_path):
-			os.unlink(temp_path)
-			
-		return numbers
+		return re.sub(r'[^0-9]', '', transcript)
 			
 	except Exception as e:
 		logger.error(f"⚠️  Transcription error: {e}")
-		if temp_path and os.path.exists(temp_path):
-			try:
-				os.unlink(temp_path)
-			except:
-				pass
 		return None
 
 
 def initialize_bedrock_client():
-	"""Initialize AWS Bedrock client for CAPTCHA solving"""
+	"""Get the shared AWS Bedrock client for CAPTCHA solving, creating it on first use"""
+	global _BEDROCK_CLIENT
+	if _BEDROCK_CLIENT is not None:
+		return _BEDROCK_CLIENT
 	try:
 		aws_key = os.getenv("AWS_ACCESS_KEY_ID")
 		aws_secret = os.getenv("AWS_SECRET_ACCESS_KEY")
@@ -952,51 +1298,79 @@ def initialize_bedrock_client():
 			print("    ⚠️  AWS credentials not found for Bedrock")
 			return None
 		
-		bedrock_client = boto3.client(
+		_BEDROCK_CLIENT = boto3.client(
 			"bedrock-runtime",
 			region_name=BEDROCK_REGION,
 			aws_access_key_id=aws_key,
 			aws_secret_access_key=aws_secret,
 		)
-		return bedrock_client
+		return _BEDROCK_CLIENT
 	except Exception as e:
 		print(f"    ⚠️  Failed to initialize Bedrock client: {e}")
 		return None
 
 
-def solve_captcha_with_bedrock(image_bytes):
-	"""Solve CAPTCHA using AWS Bedrock vision model"""
+def get_captcha_image_bytes(page, captcha_img):
+	"""Get the CAPTCHA image's original bytes from its src (data URI or browser-context request), screenshotting only as a fallback"""
+	try:
+		src = captcha_img.get_attribute("src") or ""
+		if src.startswith("data:image"):
+			return base64.b64decode(src.split(",", 1)[1])
+		if src:
+			# The context's request client shares the browser cookies, so the CAPTCHA session is kept
+			response = page.context.request.get(urljoin(BASE_URL, src))
+			if response.ok:
+				return response.body()
+	except Exception as e:
+		logger.warning(f"⚠️  Could not read CAPTCHA image source ({e}), taking a screenshot instead")
+	return captcha_img.screenshot()
+
+
+def detect_image_format(image_bytes):
+	"""Identify a CAPTCHA image format from its leading bytes"""
+	if image_bytes.startswith(b"\x89PNG\r\n\x1a\n"):
+		return "png"
+	if image_bytes.startswith(b"\xff\xd8\xff"):
+		return "jpeg"
+	if image_bytes.startswith(b"GIF8"):
+		return "gif"
+	if image_bytes[:4] == b"RIFF" and image_bytes[8:12] == b"WEBP":
+		return "webp"
+	return "png"
+
+
+def solve_captcha_batch_with_bedrock(images):
+	"""Solve one or more CAPTCHA images with a single AWS Bedrock vision call; returns one text per image"""
 	bedrock_client = initialize_bedrock_client()
 	if not bedrock_client:
-		return ""
+		return [""] * len(images)
 	
 	try:
-		# Determine image format
-		image = Image.open(io.BytesIO(image_bytes))
-		image_format = (image.format or "PNG").lower()
-		if image_format == "jpg":
-			image_format = "jpeg"
-		
-		messages = [
-			{
-				"role": "user",
-				"content": [
-					{"image": {"format": image_format, "source": {"bytes": image_bytes}}},
-					{
-						"text": (
-							"Read the captcha text in this image. Only output the exact characters you see, "
-							"nothing else. The captcha contains alphanumeric characters. Do not include any spaces or special characters."
-						)
-					},
-				],
-			}
-		]
-		
-		response = bedrock_client.converse(
-			modelId=BEDROCK_MODEL_ID,
-			messages=messages,
-			inferenceConfig={"maxTokens": 50, "temperature": 0},
-		)
+		content = []
+		for image_bytes in images:
+			content.append({"image": {"format": detect_image_format(image_bytes), "source": {"bytes": image_bytes}}})
+		
+		if len(images) == 1:
+			prompt = (
+				"Read the captcha text in this image. Only output the exact characters you see, "
+				"nothing else. The captcha contains alphanumeric characters. Do not include any spaces or special characters."
+			)
+		else:
+			prompt = (
+				f"Read the captcha text in each of these {len(images)} images. Output exactly {len(images)} lines, "
+				"line N holding only the characters of image N, nothing else. The captchas contain alphanumeric characters. "
+				"Do not include any spaces or special characters."
+			)
+		content.append({"text": prompt})
+		
+		request = {
+			"modelId": BEDROCK_MODEL_ID,
+			"messages": [{"role": "user", "content": content}],
+			"inferenceConfig": {"maxTokens": 50 * len(images), "temperature": 0},
+		}
+		if BEDROCK_LATENCY_OPTIMIZED:
+			request["performanceConfig"] = {"latency": "optimized"}
+		response = bedrock_client.converse(**request)
 		
 		# Extract response text
 		out = ""
@@ -1008,16 +1382,72 @@ def solve_captcha_with_bedrock(image_bytes):
 			except Exception:
 				out = ""
 		
-		# Clean the response - keep only alphanumeric characters
-		captcha_text = re.sub(r"[^A-Za-z0-9]", "", str(out))
-		return captcha_text.strip()
+		# Clean the response - keep only alphanumeric characters (per line when batched)
+		if len(images) == 1:
+			return [re.sub(r"[^A-Za-z0-9]", "", str(out))]
+		lines = [re.sub(r"[^A-Za-z0-9]", "", line) for line in str(out).splitlines()]
+		lines = [line for line in lines if line]
+		if len(lines) != len(images):
+			logger.warning(f"⚠️  Bedrock returned {len(lines)} answers for {len(images)} CAPTCHAs")
+			return [""] * len(images)
+		return lines
 	except Exception as e:
-		print(f"    ⚠️  Bedrock CAPTCHA solving failed: {e}")
-		return ""
+		logger.error(f"⚠️  Bedrock CAPTCHA solving failed: {e}")
+		return [""] * len(images)
+
+
+def captcha_batcher():
+	"""Background thread: collect CAPTCHA images for a short window and solve them together"""
+	while True:
+		batch = [_CAPTCHA_QUEUE.get()]
+		deadline = time.monotonic() + CAPTCHA_BATCH_WINDOW
+		while len(batch) < CAPTCHA_BATCH_SIZE:
+			remaining = deadline - time.monotonic()
+			if remaining <= 0:
+				break
+			try:
+				batch.append(_CAPTCHA_QUEUE.get(timeout=remaining))
+			except queue.Empty:
+				break
+		try:
+			results = solve_captcha_batch_with_bedrock([image_bytes for image_bytes, _, _ in batch])
+			for (_, _, slot), result in zip(batch, results):
+				slot.append(result)
+		except Exception as e:
+			logger.error(f"⚠️  CAPTCHA batcher failed: {e}")
+		finally:
+			# Always release the waiting browsers (an empty slot means "not solved")
+			for _, done, _ in batch:
+				done.set()
+
+
+def solve_captcha_with_bedrock(image_bytes):
+	"""Solve CAPTCHA using AWS Bedrock vision model (batched with other browsers' CAPTCHAs when running in parallel)"""
+	global _CAPTCHA_BATCHER
+	if DOCUMENT_WORKERS <= 1:
+		return solve_captcha_batch_with_bedrock([image_bytes])[0]
+	
+	with _TRACKING_LOCK:
+		if _CAPTCHA_BATCHER is None:
+			_CAPTCHA_BATCHER = threading.Thread(target=captcha_batcher, daemon=True)
+			_CAPTCHA_BATCHER.start()
+	done, slot = threading.Event(), []
+	_CAPTCHA_QUEUE.put((image_bytes, done, slot))
+	if done.wait(timeout=CAPTCHA_BATCH_TIMEOUT) and slot:
+		return slot[0]
+	logger.warning("⚠️  CAPTCHA batcher did not answer, solving this image directly")
+	return solve_captcha_batch_with_bedrock([image_bytes])[0]
 
 
 def solve_captcha_automatically(page):
-	"""Attempt to automatically solve the CAPTCHA on the page"""
+	"""Attempt to automatically solve the CAPTCHA on the page, one browser at a time"""
+	# Parallel browsers solving at once would hammer Bedrock/Whisper and trip DataDome's rate limit together
+	with _CAPTCHA_LOCK:
+		return _solve_captcha_automatically(page)
+
+
+def _solve_captcha_automatically(page):
+	"""Try the DataDome and CanLII solvers in turn"""
 	logger.info("\n🤖 Attempting automatic CAPTCHA solving...")
 
 	# Remove cookie consent blocker if present
@@ -1118,8 +1548,8 @@ def solve_captcha_automatically(page):
 				logger.warning("⚠️  CAPTCHA image not found or not visible")
 				continue
 			
-			# Take screenshot of the CAPTCHA image
-			image_bytes = captcha_img.screenshot()
+			# Read the CAPTCHA image's own bytes (no screenshot re-encode)
+			image_bytes = get_captcha_image_bytes(page, captcha_img)
 			
 			if not image_bytes:
 				logger.warning("⚠️  Failed to capture CAPTCHA image")
@@ -1213,8 +1643,7 @@ def handle_captcha_interruption(page):
 					return True
 				else:
 					print("   ⚠️  Auto-solve failed. Waiting for manual input...")
-					while is_captcha_page(page):
-						page.wait_for_timeout(5000)
+					wait_for_manual_captcha_solve(page)
 					print("   ✅ Manual solve detected!")
 					return True
 			else:
@@ -1247,8 +1676,7 @@ def handle_captcha_interruption(page):
 					return True
 				else:
 					print("   ⚠️  Auto-solve failed. Waiting for manual input...")
-					while is_captcha_page(page):
-						page.wait_for_timeout(5000)
+					wait_for_manual_captcha_solve(page)
 					print("   ✅ Manual solve detected!")
 					return True
 			else:
@@ -1276,9 +1704,7 @@ def handle_captcha_interruption(page):
 				return True
 			else:
 				print("   ⚠️  Auto-solve failed during recovery. Waiting for manual input...")
-				# Wait manually
-				while is_captcha_page(page):
-					page.wait_for_timeout(5000)
+				wait_for_manual_captcha_solve(page)
 				print("   ✅ Manual solve detected!")
 				return True
 		else:
@@ -1291,185 +1717,195 @@ def handle_captcha_interruption(page):
 
 
 
+def build_pdf_html(title, content_html):
+	"""Wrap extracted document content in the styled HTML page used for the PDF"""
+	return f"""
+	<!DOCTYPE html>
+	<html>
+	<head>
+		<meta charset="UTF-8">
+		<title>{title}</title>
+		<style>
+			@page {{
+				size: A4;
+				margin: 2cm;
+			}}
+			body {{
+				font-family: Arial, sans-serif;
+				line-height: 1.6;
+				color: #333;
+				max-width: 210mm;
+				margin: 0 auto;
+				padding: 20px;
+			}}
+			h1, h2.Title-of-Act {{
+				color: #1a1a1a;
+				border-bottom: 2px solid #333;
+				padding-bottom: 10px;
+				margin-bottom: 20px;
+				font-size: 1.8em;
+			}}
+			h2.Part, h3.Subheading, h4.Subheading {{
+				color: #2a2a2a;
+				margin-top: 25px;
+				margin-bottom: 15px;
+				font-weight: bold;
+			}}
+			h2.Part {{
+				font-size: 1.5em;
+				border-bottom: 1px solid #666;
+			}}
+			h3.Subheading {{
+				font-size: 1.3em;
+			}}
+			h4.Subheading {{
+				font-size: 1.1em;
+			}}
+			.MarginalNote {{
+				font-style: italic;
+				color: #666;
+				margin: 10px 0 5px 0;
+				font-size: 0.9em;
+			}}
+			.Section, .Subsection {{
+				margin: 12px 0;
+				line-height: 1.8;
+			}}
+			.Section strong, .Subsection strong {{
+				margin-right: 8px;
+			}}
+			.sectionLabel {{
+				font-weight: bold;
+				color: #000;
+			}}
+			p.centered {{
+				text-align: center;
+				margin: 15px 0;
+			}}
+			p.right-align {{
+				text-align: right;
+				margin: 10px 0;
+			}}
+			p.indent-0-0, p.indent-1-0 {{
+				margin: 8px 0;
+			}}
+			p.indent-1-0 {{
+				margin-left: 20px;
+			}}
+			ul.ProvisionList {{
+				list-style-type: none;
+				padding-left: 0;
+				margin: 15px 0;
+			}}
+			/* Schedule heading styles */
+			.Schedule header {{
+				margin: 30px 0 20px 0;
+			}}
+			h2.scheduleLabel {{
+				font-size: 1.5em;
+				font-weight: bold;
+				color: #1a1a1a;
+				margin: 0;
+				padding: 0;
+				border: none;
+			}}
+			.scheduleLabel {{
+				display: block;
+				font-weight: bold;
+				margin-bottom: 5px;
+			}}
+			.scheduleTitleText {{
+				display: block;
+				font-weight: normal;
+				font-size: 0.85em;
+				margin-top: 5px;
+			}}
+			/* Other document elements */
+			.ChapterNumber, .EnablingAct, .LongTitle {{
+				margin: 8px 0;
+				font-weight: normal;
+			}}
+			.ChapterNumber {{
+				font-style: italic;
+			}}
+			.EnablingAct {{
+				font-weight: bold;
+				text-transform: uppercase;
+			}}
+			.FlushLeft {{
+				margin: 5px 0;
+			}}
+			ul.ProvisionList > li {{
+				margin: 12px 0;
+			}}
+			.listItemBlock1, .listItemBlock3 {{
+				display: flex;
+				margin: 10px 0;
+			}}
+			.listItemLabel {{
+				font-weight: bold;
+				min-width: 40px;
+				flex-shrink: 0;
+			}}
+			.listItemText1, .listItemText2 {{
+				flex: 1;
+			}}
+			.Smallcaps {{
+				font-variant: small-caps;
+			}}
+			.Repealed {{
+				color: #999;
+				font-style: italic;
+			}}
+			.order {{
+				margin: 20px 0;
+			}}
+			.intro {{
+				margin-bottom: 25px;
+			}}
+			section {{
+				margin: 20px 0;
+			}}
+			/* Hide interactive elements */
+			.bootstrap, .viibes-marker-toolbox, .viibes-marker {{
+				display: none !important;
+			}}
+			/* Clean up links */
+			a {{
+				color: #0066cc;
+				text-decoration: none;
+			}}
+			sup {{
+				font-size: 0.7em;
+			}}
+			table {{
+				border-collapse: collapse;
+				width: 100%;
+				margin: 15px 0;
+			}}
+			table td, table th {{
+				padding: 8px;
+				border: 1px solid #ddd;
+			}}
+		</style>
+	</head>
+	<body>
+		<h1>{title}</h1>
+		{content_html}
+	</body>
+	</html>
+	"""
+
+
 def create_pdf_from_html(chrome_page, title, content_html, output_path):
-	"""Generate a PDF from HTML content using Chrome/Playwright"""
+	"""Generate a PDF from HTML content, in-process with WeasyPrint when available, otherwise with Chrome/Playwright"""
 	try:
-		html_document = f"""
-		<!DOCTYPE html>
-		<html>
-		<head>
-			<meta charset="UTF-8">
-			<title>{title}</title>
-			<style>
-				@page {{
-					size: A4;
-					margin: 2cm;
-				}}
-				body {{
-					font-family: Arial, sans-serif;
-					line-height: 1.6;
-					color: #333;
-					max-width: 210mm;
-					margin: 0 auto;
-					padding: 20px;
-				}}
-				h1, h2.Title-of-Act {{
-					color: #1a1a1a;
-					border-bottom: 2px solid #333;
-					padding-bottom: 10px;
-					margin-bottom: 20px;
-					font-size: 1.8em;
-				}}
-				h2.Part, h3.Subheading, h4.Subheading {{
-					color: #2a2a2a;
-					margin-top: 25px;
-					margin-bottom: 15px;
-					font-weight: bold;
-				}}
-				h2.Part {{
-					font-size: 1.5em;
-					border-bottom: 1px solid #666;
-				}}
-				h3.Subheading {{
-					font-size: 1.3em;
-				}}
-				h4.Subheading {{
-					font-size: 1.1em;
-				}}
-				.MarginalNote {{
-					font-style: italic;
-					color: #666;
-					margin: 10px 0 5px 0;
-					font-size: 0.9em;
-				}}
-				.Section, .Subsection {{
-					margin: 12px 0;
-					line-height: 1.8;
-				}}
-				.Section strong, .Subsection strong {{
-					margin-right: 8px;
-				}}
-				.sectionLabel {{
-					font-weight: bold;
-					color: #000;
-				}}
-				p.centered {{
-					text-align: center;
-					margin: 15px 0;
-				}}
-				p.right-align {{
-					text-align: right;
-					margin: 10px 0;
-				}}
-				p.indent-0-0, p.indent-1-0 {{
-					margin: 8px 0;
-				}}
-				p.indent-1-0 {{
-					margin-left: 20px;
-				}}
-				ul.ProvisionList {{
-					list-style-type: none;
-					padding-left: 0;
-					margin: 15px 0;
-				}}
-				/* Schedule heading styles */
-				.Schedule header {{
-					margin: 30px 0 20px 0;
-				}}
-				h2.scheduleLabel {{
-					font-size: 1.5em;
-					font-weight: bold;
-					color: #1a1a1a;
-					margin: 0;
-					padding: 0;
-					border: none;
-				}}
-				.scheduleLabel {{
-					display: block;
-					font-weight: bold;
-					margin-bottom: 5px;
-				}}
-				.scheduleTitleText {{
-					display: block;
-					font-weight: normal;
-					font-size: 0.85em;
-					margin-top: 5px;
-				}}
-				/* Other document elements */
-				.ChapterNumber, .EnablingAct, .LongTitle {{
-					margin: 8px 0;
-					font-weight: normal;
-				}}
-				.ChapterNumber {{
-					font-style: italic;
-				}}
-				.EnablingAct {{
-					font-weight: bold;
-					text-transform: uppercase;
-				}}
-				.FlushLeft {{
-					margin: 5px 0;
-				}}
-				ul.ProvisionList > li {{
-					margin: 12px 0;
-				}}
-				.listItemBlock1, .listItemBlock3 {{
-					display: flex;
-					margin: 10px 0;
-				}}
-				.listItemLabel {{
-					font-weight: bold;
-					min-width: 40px;
-					flex-shrink: 0;
-				}}
-				.listItemText1, .listItemText2 {{
-					flex: 1;
-				}}
-				.Smallcaps {{
-					font-variant: small-caps;
-				}}
-				.Repealed {{
-					color: #999;
-					font-style: italic;
-				}}
-				.order {{
-					margin: 20px 0;
-				}}
-				.intro {{
-					margin-bottom: 25px;
-				}}
-				section {{
-					margin: 20px 0;
-				}}
-				/* Hide interactive elements */
-				.bootstrap, .viibes-marker-toolbox, .viibes-marker {{
-					display: none !important;
-				}}
-				/* Clean up links */
-				a {{
-					color: #0066cc;
-					text-decoration: none;
-				}}
-				sup {{
-					font-size: 0.7em;
-				}}
-				table {{
-					border-collapse: collapse;
-					width: 100%;
-					margin: 15px 0;
-				}}
-				table td, table th {{
-					padding: 8px;
-					border: 1px solid #ddd;
-				}}
-			</style>
-		</head>
-		<body>
-			<h1>{title}</h1>
-			{content_html}
-		</body>
-		</html>
-		"""
+		html_document = build_pdf_html(title, content_html)
+		
+		if WeasyHTML is not None:
+			WeasyHTML(string=html_document).write_pdf(output_path)
+			print(f"  ✓ PDF created: {os.path.basename(output_path)}")
+			return True
 		
 		temp_html_path = output_path.replace('.pdf', '_temp.html')
 		with open(temp_html_path, 'w', encoding='utf-8') as f:
@@ -1484,7 +1920,7 @@ def create_pdf_from_html(chrome_page, title, content_html, output_path):
 		return True
 		
 	except Exception as e:
-		print(f"  ✗ Error creating PDF: {e}")
+		logger.error(f"✗ Error creating PDF {os.path.basename(output_path)}: {e}")
 		return False
 
 
@@ -1557,303 +1993,557 @@ def process_legislation_document(page, chrome_page, href, title, citation, prefi
 	# Go to document page
 	doc_url = f"{BASE_URL}{href}"
 	try:
+		response = None
 		try:
-			page.goto(doc_url, wait_until="load", timeout=30000)
+			response = page.goto(doc_url, wait_until="load", timeout=30000)
 		except Exception as e:
 			print(f"    ⚠️  Navigation error: {e}")
 			
+		# No fixed sleep: extract_document_content waits for the content element itself
 		page.wait_for_load_state("domcontentloaded")
-		page.wait_for_timeout(WAIT_MS)
 		
 		# Remove cookie modal immediately after page load
 		force_remove_cookie_modal(page)
 		
+		# Fast path: a clean 200 response skips the DOM-based CAPTCHA probes entirely
+		check_captcha = needs_captcha_check(page, response)
+		
 		# Check for CAPTCHA interruption
-		if is_captcha_page(page):
+		if check_captcha and is_captcha_page(page):
 			print("    ⚠️  CAPTCHA detected on document page!")
 			if handle_captcha_interruption(page):
 				print("    🔄 Resuming document processing after recovery...")
 				# Retry navigation
 				page.goto(doc_url, wait_until="load")
-				page.wait_for_load_state("domcontentloaded")
 				force_remove_cookie_modal(page)  # Remove again after recovery
 			else:
 				print("    ❌ Could not recover from CAPTCHA. Skipping this doc.")
 				return False
 
 		# Extract content (checks for in-force status inside)
-		doc_title, content_html = extract_document_content(page, href, title)
+		doc_title, content_html = extract_document_content(page, href, title, check_captcha=check_captcha)
+		
+		# A CAPTCHA served with 200 at the document URL passes the response check; verify before trusting it
+		if not check_captcha and len(content_html or "") < MIN_DOCUMENT_CONTENT_CHARS and is_captcha_page(page):
+			print("    ⚠️  CAPTCHA detected behind a clean response, retrying with the full check...")
+			doc_title, content_html = extract_document_content(page, href, title)
 		
 		if doc_title and content_html:
 			pdf_path = os.path.join(OUTPUT_DIR, s3_key)
+			doc_info = {
+				"key": doc_key,
+				"title": title,
+				"citation": citation,
+				"href": href,
+				"url": f"{BASE_URL}{href}",
+				"s3_key": s3_key
+			}
 			
-			# Generate PDF using Chrome
+			# Render here (WeasyPrint in-process, or Chrome), then upload to S3 in the background;
+			# the document is tracked once its upload succeeds
 			if create_pdf_from_html(chrome_page, doc_title, content_html, pdf_path):
-				# Upload to S3
-				if upload_to_s3(pdf_path, s3_key):
-					delete_local_file(pdf_path)
-					mark_as_processed(tracking_data, {
-						"key": doc_key,
-						"title": title,
-						"citation": citation,
-						"href": href,
-						"url": f"{BASE_URL}{href}",
-						"s3_key": s3_key
-					})
-					delay_between_downloads()
-					return True
+				queue_upload(doc_info, upload_and_cleanup, pdf_path, s3_key, tracking_data, doc_info)
+				delay_between_downloads()
+				return True
 	except Exception as e:
 		print(f"    Error processing document {title}: {e}")
 	
 	return False
 
 
-def extract_row_data(row):
-	"""Extract main item and all sub-items (regulations, amendments, enabling statutes) from a table row"""
-	try:
-		return row.evaluate("""
-			(row) => {
-				const result = { main: null, sub_items: [] };
-
-				// --- Extract main item ---
-				const canliiLink = row.querySelector('a.canlii');
-				if (!canliiLink) return result;
-
-				const mainHref = canliiLink.getAttribute('href');
-				const mainTitle = canliiLink.textContent.trim();
-
-				// Get citation
-				let citation = '';
-				const decisionDateTd = row.querySelector('td.decisionDate');
-				if (decisionDateTd) {
-					citation = decisionDateTd.textContent.trim();
-				} else {
-					const nowrap = row.querySelector('td:first-child span.nowrap');
-					if (nowrap) citation = nowrap.textContent.trim();
-				}
+# Main item and all sub-items (regulations, amendments, enabling statutes) of one category table row
+_ROW_DATA_JS = """
+	(row) => {
+		const result = { main: null, sub_items: [] };
 
-				// Check if main item is repealed (Category 4 pattern: direct span with [Repealed...] in same td)
-				let mainRepealed = false;
-				const canliiTd = canliiLink.closest('td');
-				if (canliiTd) {
-					for (const child of canliiTd.childNodes) {
-						if (child.nodeType === 1 && child.tagName === 'SPAN'
-							&& !child.classList.contains('nowrap')
-							&& !child.classList.contains('d-flex')
-							&& !child.classList.contains('text-end')) {
-							const txt = child.textContent.toLowerCase();
-							if (txt.includes('repealed') || txt.includes('not in force') || txt.includes('spent')) {
-								mainRepealed = true;
-							}
-						}
+		// --- Extract main item ---
+		const canliiLink = row.querySelector('a.canlii');
+		if (!canliiLink) return result;
+
+		const mainHref = canliiLink.getAttribute('href');
+		const mainTitle = canliiLink.textContent.trim();
+
+		// Get citation
+		let citation = '';
+		const decisionDateTd = row.querySelector('td.decisionDate');
+		if (decisionDateTd) {
+			citation = decisionDateTd.textContent.trim();
+		} else {
+			const nowrap = row.querySelector('td:first-child span.nowrap');
+			if (nowrap) citation = nowrap.textContent.trim();
+		}
+
+		// Check if main item is repealed (Category 4 pattern: direct span with [Repealed...] in same td)
+		let mainRepealed = false;
+		const canliiTd = canliiLink.closest('td');
+		if (canliiTd) {
+			for (const child of canliiTd.childNodes) {
+				if (child.nodeType === 1 && child.tagName === 'SPAN'
+					&& !child.classList.contains('nowrap')
+					&& !child.classList.contains('d-flex')
+					&& !child.classList.contains('text-end')) {
+					const txt = child.textContent.toLowerCase();
+					if (txt.includes('repealed') || txt.includes('not in force') || txt.includes('spent')) {
+						mainRepealed = true;
 					}
 				}
+			}
+		}
 
-				result.main = {
-					href: mainHref,
-					title: mainTitle,
-					citation: citation,
-					is_repealed: mainRepealed
-				};
-
-				// --- Extract sub-items from dropdowns (regulations, amendments) ---
-				// Handles: div[id^='regulation_'] (Categories 1,2) and div[id^='legislation_'] (Category 3)
-				const dropdowns = row.querySelectorAll("div[id^='regulation_'], div[id^='legislation_']");
-				for (const dropdown of dropdowns) {
-					let currentSection = 'in_force';
-
-					for (const child of dropdown.children) {
-						if (child.tagName === 'DIV') {
-							const text = child.textContent.toLowerCase().trim();
-							if (text.includes('repealed') || text.includes('spent') || text.includes('not in force')) {
-								currentSection = 'repealed';
-							} else {
-								currentSection = 'in_force';
-							}
-						} else if (child.tagName === 'UL' && currentSection === 'in_force') {
-							const items = child.querySelectorAll('li');
-							for (const item of items) {
-								const link = item.querySelector('a[href]');
-								if (link) {
-									const nw = item.querySelector('span.nowrap');
-									result.sub_items.push({
-										href: link.getAttribute('href'),
-										title: link.textContent.trim(),
-										citation: nw ? nw.textContent.trim() : '',
-										type: 'sub_item'
-									});
-								}
-							}
+		result.main = {
+			href: mainHref,
+			title: mainTitle,
+			citation: citation,
+			is_repealed: mainRepealed
+		};
+
+		// --- Extract sub-items from dropdowns (regulations, amendments) ---
+		// Handles: div[id^='regulation_'] (Categories 1,2) and div[id^='legislation_'] (Category 3)
+		const dropdowns = row.querySelectorAll("div[id^='regulation_'], div[id^='legislation_']");
+		for (const dropdown of dropdowns) {
+			let currentSection = 'in_force';
+
+			for (const child of dropdown.children) {
+				if (child.tagName === 'DIV') {
+					const text = child.textContent.toLowerCase().trim();
+					if (text.includes('repealed') || text.includes('spent') || text.includes('not in force')) {
+						currentSection = 'repealed';
+					} else {
+						currentSection = 'in_force';
+					}
+				} else if (child.tagName === 'UL' && currentSection === 'in_force') {
+					const items = child.querySelectorAll('li');
+					for (const item of items) {
+						const link = item.querySelector('a[href]');
+						if (link) {
+							const nw = item.querySelector('span.nowrap');
+							result.sub_items.push({
+								href: link.getAttribute('href'),
+								title: link.textContent.trim(),
+								citation: nw ? nw.textContent.trim() : '',
+								type: 'sub_item'
+							});
 						}
 					}
 				}
+			}
+		}
 
-				// --- Extract enabling statute from second column (Category 4) ---
-				const tds = row.querySelectorAll('td');
-				if (tds.length >= 2) {
-					const secondTd = tds[1];
-					// Category 4: second td has direct <a> links (not a.canlii, not inside dropdown)
-					const hasCanliiInSecond = secondTd.querySelector('a.canlii');
-					const hasDropdown = secondTd.querySelector("div[id^='regulation_'], div[id^='legislation_']");
-
-					if (!hasCanliiInSecond && !hasDropdown) {
-						const links = secondTd.querySelectorAll('a[href]');
-						for (const link of links) {
-							const href = link.getAttribute('href');
-							if (href && href.includes('/laws/')) {
-								const nw = secondTd.querySelector('span.nowrap');
-								result.sub_items.push({
-									href: href,
-									title: link.textContent.trim(),
-									citation: nw ? nw.textContent.trim() : '',
-									type: 'enabling_statute'
-								});
-							}
-						}
+		// --- Extract enabling statute from second column (Category 4) ---
+		const tds = row.querySelectorAll('td');
+		if (tds.length >= 2) {
+			const secondTd = tds[1];
+			// Category 4: second td has direct <a> links (not a.canlii, not inside dropdown)
+			const hasCanliiInSecond = secondTd.querySelector('a.canlii');
+			const hasDropdown = secondTd.querySelector("div[id^='regulation_'], div[id^='legislation_']");
+
+			if (!hasCanliiInSecond && !hasDropdown) {
+				const links = secondTd.querySelectorAll('a[href]');
+				for (const link of links) {
+					const href = link.getAttribute('href');
+					if (href && href.includes('/laws/')) {
+						const nw = secondTd.querySelector('span.nowrap');
+						result.sub_items.push({
+							href: href,
+							title: link.textContent.trim(),
+							citation: nw ? nw.textContent.trim() : '',
+							type: 'enabling_statute'
+						});
 					}
 				}
-
-				return result;
 			}
-		""")
+		}
+
+		return result;
+	}
+"""
+
+
+def extract_all_row_data(page):
+	"""Extract every category table row (main item + sub-items) in a single round trip"""
+	try:
+		return page.locator("#legislationsContainer tr").evaluate_all(f"rows => rows.map({_ROW_DATA_JS})")
 	except Exception as e:
-		print(f"  Error in extract_row_data: {e}")
-		return {"main": None, "sub_items": []}
+		print(f"  Error in extract_all_row_data: {e}")
+		return []
+
+
+# Same row extraction, run on a category page's HTML parsed off-screen (no navigation, layout or subresources)
+_PARSE_CATEGORY_ROWS_JS = f"""html => {{
+	const doc = new DOMParser().parseFromString(html, 'text/html');
+	return Array.from(doc.querySelectorAll('#legislationsContainer tr')).map({_ROW_DATA_JS});
+}}"""
 
 
-def process_category_page(page, chrome_page, tracking_data, category_url):
-	"""Process all items in a category page in real-time"""
+def fetch_category_rows_fast(page, category_url):
+	"""Fetch a category listing through the context's HTTP client; None when the browser path is needed"""
 	try:
-		# Remove cookie modal first
-		force_remove_cookie_modal(page)
-		
-		# Wait for the table to be populated
-		page.wait_for_selector("#legislationsContainer tr", timeout=10000)
-		
-		# Click "Show more results" until all items are loaded
-		print("  Checking for 'Show more results' button...")
-		while True:
-			try:
-				show_more_button = page.locator("span.showMoreResults")
-				if show_more_button.count() > 0 and show_more_button.is_visible():
-					print("  Clicking 'Show more results'...")
-					show_more_button.click()
-					page.wait_for_timeout(2000)
-					
-					# Quick check for CAPTCHA during pagination
-					if is_captcha_page(page):
-						print("⚠️ CAPTCHA detected during pagination!")
-						if handle_captcha_interruption(page):
-							print("    🔄 Resuming pagination after recovery...")
-							page.goto(category_url, wait_until="load")
-							page.wait_for_timeout(2000)
-						else:
-							print("    Waiting for manual CAPTCHA solve...")
-							while is_captcha_page(page):
-								page.wait_for_timeout(5000)
-						page.wait_for_timeout(2000)
-				else:
+		response = page.context.request.get(category_url, timeout=30000)
+		if not response.ok or is_captcha_response(response):
+			return None
+		html = response.text()
+		# CAPTCHA walls and paginated listings ("Show more results") need the real page
+		lowered = html.lower()
+		if "showmoreresults" in lowered or any(marker in lowered for marker in ("captchatag", "captcha-delivery.com")):
+			return None
+		rows = page.evaluate(_PARSE_CATEGORY_ROWS_JS, html)
+		return rows if rows else None
+	except Exception as e:
+		print(f"  Fast category fetch failed, using the browser: {e}")
+		return None
+
+
+def process_item(page, chrome_page, tracking_data, i, total, item):
+	"""Process one category row: its main document and all of its sub-items. Returns the number processed"""
+	processed_count = 0
+	main = item["main"]
+	sub_items = item.get("sub_items", [])
+	
+	# Skip repealed main items (Category 4 pattern: marked in the list itself)
+	if main.get("is_repealed"):
+		print(f"\n  ⏭️  Skipping item {i}/{total} (repealed in list): {main['title']}")
+		save_skipped_document({
+			"title": main["title"],
+			"href": main["href"],
+			"url": f"{BASE_URL}{main['href']}",
+			"reason": "Repealed, spent or not in force (marked in category list)"
+		})
+		return 0
+	
+	# Check if already processed to resume directly
+	main_key = f"main_{main['href']}"
+	main_processed = is_already_processed(tracking_data, main_key)
+	
+	# Check if all sub-items are processed
+	all_subs_processed = True
+	for sub in sub_items:
+		sub_type = sub.get("type", "sub_item")
+		sub_key = f"{sub_type}_{sub['href']}"
+		if not is_already_processed(tracking_data, sub_key):
+			all_subs_processed = False
+			break
+	
+	if main_processed and all_subs_processed:
+		return 0
+	
+	print(f"\n  Processing item {i}/{total}: {main['title']}")
+	if sub_items:
+		print(f"    ({len(sub_items)} sub-items: regulations/amendments/enabling statutes)")
+	
+	# Process Main Document
+	if process_legislation_document(page, chrome_page, main["href"], main["title"], main["citation"], "main", tracking_data):
+		processed_count += 1
+	
+	# Process sub-items (regulations, amendments, enabling statutes)
+	for j, sub in enumerate(sub_items, 1):
+		sub_type = sub.get("type", "sub_item")
+		print(f"    Sub-item {j}/{len(sub_items)} [{sub_type}]: {sub['title']}")
+		if process_legislation_document(page, chrome_page, sub["href"], sub["title"], sub["citation"], sub_type, tracking_data):
+			processed_count += 1
+	
+	return processed_count
+
+
+def document_worker(worker_id, tracking_data, ready):
+	"""Worker thread: its own Playwright, browser and PDF page, taking category rows from the shared queue"""
+	try:
+		# Playwright objects belong to the thread that created them, so each worker starts its own
+		with sync_playwright() as p:
+			browser, page = launch_browser(p)
+			chrome_browser, chrome_page = launch_pdf_browser(p)
+			open_start_page(page)
+			logger.info(f"[worker {worker_id}] Ready for documents")
+			ready.set()
+			while True:
+				job = _ITEM_QUEUE.get()
+				if job is None:
+					_ITEM_QUEUE.task_done()
 					break
-			except Exception:
+				i, total, item, results = job
+				try:
+					results.append(process_item(page, chrome_page, tracking_data, i, total, item))
+				except Exception as e:
+					print(f"  [worker {worker_id}] Error processing item {i}: {e}")
+				finally:
+					_ITEM_QUEUE.task_done()
+			if chrome_browser:
+				chrome_browser.close()
+			browser.close()
+	except Exception as e:
+		logger.error(f"[worker {worker_id}] Stopped: {e}")
+		ready.set()
+
+
+def start_document_workers(tracking_data):
+	"""Start DOCUMENT_WORKERS - 1 extra browsers (the main browser is the first worker)"""
+	threads = []
+	for worker_id in range(1, DOCUMENT_WORKERS):
+		ready = threading.Event()
+		thread = threading.Thread(target=document_worker, args=(worker_id, tracking_data, ready), daemon=True)
+		thread.start()
+		# Bring browsers up one at a time so their start-page CAPTCHAs don't all fire at once
+		ready.wait()
+		threads.append(thread)
+	return threads
+
+
+def stop_document_workers(threads):
+	"""Tell every document worker to close its browser, then wait for them"""
+	for _ in threads:
+		_ITEM_QUEUE.put(None)
+	for thread in threads:
+		thread.join()
+
+
+def load_category_rows(page, category_url):
+	"""Expand a category page in the browser ("Show more results") and extract all of its rows"""
+	# Remove cookie modal first
+	force_remove_cookie_modal(page)
+	
+	# Wait for the table to be populated
+	page.wait_for_selector("#legislationsContainer tr", timeout=10000)
+	
+	# Click "Show more results" until all items are loaded
+	print("  Checking for 'Show more results' button...")
+	while True:
+		try:
+			show_more_button = page.locator("span.showMoreResults")
+			if show_more_button.count() > 0 and show_more_button.is_visible():
+				print("  Clicking 'Show more results'...")
+				row_count = page.locator("#legislationsContainer tr").count()
+				show_more_button.click()
+				# Continue as soon as the new rows render (a CAPTCHA page stops them, so don't fail on timeout)
+				try:
+					page.wait_for_function(
+						"prevRowCount => document.querySelectorAll('#legislationsContainer tr').length > prevRowCount",
+						arg=row_count,
+						timeout=5000
+					)
+				except:
+					pass
+				
+				# Quick check for CAPTCHA during pagination
+				if is_captcha_page(page):
+					print("⚠️ CAPTCHA detected during pagination!")
+					if handle_captcha_interruption(page):
+						print("    🔄 Resuming pagination after recovery...")
+						page.goto(category_url, wait_until="load")
+						wait_ready(page, CATEGORY_READY_SELECTOR)
+					else:
+						print("    Waiting for manual CAPTCHA solve...")
+						wait_for_manual_captcha_solve(page)
+					page.wait_for_timeout(2000)
+			else:
 				break
-		
-		print("  All records loaded, starting extraction...")
-		
-		# IMPORTANT: Collect ALL item data FIRST before navigating away
-		# This prevents stale element references when we navigate to document pages
-		# Uses JavaScript evaluation to also extract sub-items (regulations, amendments, enabling statutes)
-		items_to_process = []
-		rows = page.locator("#legislationsContainer tr").all()
-		total_rows = len(rows)
-		print(f"Found {total_rows} legislation rows to scan")
-		
-		for row in rows:
-			try:
-				row_data = extract_row_data(row)
-				if row_data and row_data.get("main"):
-					items_to_process.append(row_data)
-			except Exception as e:
-				print(f"  Error extracting row data: {e}")
-				continue
+		except Exception:
+			break
+	
+	print("  All records loaded, starting extraction...")
+	
+	# IMPORTANT: Collect ALL item data FIRST before navigating away
+	# This prevents stale element references when we navigate to document pages
+	# Uses JavaScript evaluation to also extract sub-items (regulations, amendments, enabling statutes)
+	return extract_all_row_data(page)
+
+
+def process_category_page(page, chrome_page, tracking_data, category_url, results, rows=None):
+	"""Queue all items of a category page and work through them; returns the number of rows queued"""
+	try:
+		# Rows already fetched over HTTP skip the browser listing entirely
+		if rows is None:
+			rows = load_category_rows(page, category_url)
+		print(f"Found {len(rows)} legislation rows to scan")
+		items_to_process = [row_data for row_data in rows if row_data and row_data.get("main")]
 		
 		# Count total documents (main + sub-items)
 		total_main = len(items_to_process)
 		total_subs = sum(len(item.get("sub_items", [])) for item in items_to_process)
 		print(f"  Collected {total_main} main items + {total_subs} sub-items = {total_main + total_subs} total documents")
 		
-		processed_count = 0
-		
-		# Now process each item - we have all the data we need stored
+		# Queue every row; this browser and any document workers take rows until the queue is empty
 		for i, item in enumerate(items_to_process, 1):
+			_ITEM_QUEUE.put((i, len(items_to_process), item, results))
+		
+		while True:
 			try:
-				main = item["main"]
-				sub_items = item.get("sub_items", [])
-				
-				# Skip repealed main items (Category 4 pattern: marked in the list itself)
-				if main.get("is_repealed"):
-					print(f"\n  ⏭️  Skipping item {i}/{len(items_to_process)} (repealed in list): {main['title']}")
-					save_skipped_document({
-						"title": main["title"],
-						"href": main["href"],
-						"url": f"{BASE_URL}{main['href']}",
-						"reason": "Repealed, spent or not in force (marked in category list)"
-					})
-					continue
-				
-				# Check if already processed to resume directly
-				main_key = f"main_{main['href']}"
-				main_processed = is_already_processed(tracking_data, main_key)
-				
-				# Check if all sub-items are processed
-				all_subs_processed = True
-				for sub in sub_items:
-					sub_type = sub.get("type", "sub_item")
-					sub_key = f"{sub_type}_{sub['href']}"
-					if not is_already_processed(tracking_data, sub_key):
-						all_subs_processed = False
-						break
-				
-				if main_processed and all_subs_processed:
-					continue
-				
-				print(f"\n  Processing item {i}/{len(items_to_process)}: {main['title']}")
-				if sub_items:
-					print(f"    ({len(sub_items)} sub-items: regulations/amendments/enabling statutes)")
-				
-				# Process Main Document
-				if process_legislation_document(page, chrome_page, main["href"], main["title"], main["citation"], "main", tracking_data):
-					processed_count += 1
-				
-				# Process sub-items (regulations, amendments, enabling statutes)
-				for j, sub in enumerate(sub_items, 1):
-					sub_type = sub.get("type", "sub_item")
-					print(f"    Sub-item {j}/{len(sub_items)} [{sub_type}]: {sub['title']}")
-					if process_legislation_document(page, chrome_page, sub["href"], sub["title"], sub["citation"], sub_type, tracking_data):
-						processed_count += 1
-				
-				# After processing all items for this row, navigate back to category page
-				page.goto(category_url, wait_until="load")
-				page.wait_for_load_state("networkidle")
-				page.wait_for_timeout(1000)
-				
+				i, total, item, item_results = _ITEM_QUEUE.get_nowait()
+			except queue.Empty:
+				break
+			try:
+				# Row data was collected up front, so go straight on to the next row's documents
+				item_results.append(process_item(page, chrome_page, tracking_data, i, total, item))
 			except Exception as e:
 				print(f"  Error processing item {i}: {e}")
 				# Try to recover by navigating back to category page
 				try:
 					page.goto(category_url, wait_until="load")
 					page.wait_for_load_state("networkidle")
-					page.wait_for_timeout(1000)
 				except:
 					pass
-				continue
+			finally:
+				_ITEM_QUEUE.task_done()
 		
-		return processed_count
+		# Rows still in progress on document workers finish while this browser loads the next category
+		return len(items_to_process)
 
 	except Exception as e:
 		print(f"Error processing category page: {e}")
 		return 0
 
 
+def get_saved_storage_state():
+	"""Path of the saved storage state if it is recent enough to reuse, otherwise None"""
+	try:
+		age_hours = (time.time() - os.path.getmtime(STORAGE_STATE_FILE)) / 3600
+	except OSError:
+		return None
+	if age_hours > STORAGE_STATE_MAX_AGE_HOURS:
+		logger.info(f"Saved browser state is {age_hours:.1f}h old, starting cold")
+		return None
+	logger.info(f"Reusing saved browser state ({age_hours:.1f}h old)")
+	return STORAGE_STATE_FILE
+
+
+def save_storage_state(context):
+	"""Save the context's cookies and localStorage so the next run can skip the initial CAPTCHA"""
+	try:
+		context.storage_state(path=STORAGE_STATE_FILE)
+	except Exception as e:
+		logger.warning(f"Could not save browser state: {e}")
+
+
+def make_context(browser):
+	"""Create a scraper context: fingerprint settings, bundled stealth script and resource blocking"""
+	logger.info("Creating browser context...")
+	context = browser.new_context(**_CONTEXT_KWARGS, storage_state=get_saved_storage_state())
+	
+	# Inject all stealth scripts once per context (applies to every page and frame)
+	logger.info("Injecting stealth scripts...")
+	context.add_init_script(get_stealth_script())
+	
+	# Only the document HTML is needed, so skip downloading everything else
+	context.route("**/*", block_unneeded_resources)
+	return context
+
+
+def launch_browser(p):
+	"""Launch stealth Firefox and return (browser, page)"""
+	# Determine headless mode:
+	# - Default to HEADLESS=False on Windows (for debug)
+	# - Default to HEADLESS=True on Linux (for server)
+	# - Allow override via env var
+	system_os = platform.system()
+	env_headless = os.getenv("HEADLESS")
+	
+	if env_headless is not None:
+		is_headless = env_headless.lower() == "true"
+	else:
+		is_headless = system_os == "Linux"
+		
+	logger.info(f"Running on {system_os}, Headless: {is_headless}")
+
+	logger.info("Launching Firefox browser...")
+	browser = p.firefox.launch(
+		headless=is_headless,
+		args=get_firefox_launch_args(),
+		firefox_user_prefs=get_firefox_user_prefs()
+	)
+	
+	context = make_context(browser)
+
+	logger.info("Creating new page...")
+	page = context.new_page()
+	flag_captcha_responses(page)
+	return browser, page
+
+
+def launch_pdf_browser(p):
+	"""Launch the Chrome browser used for PDF generation and return (browser, page); (None, None) when WeasyPrint renders PDFs"""
+	if WeasyHTML is not None:
+		logger.info("Using WeasyPrint for PDF generation")
+		return None, None
+	logger.info("Launching Chrome browser for PDF generation...")
+	chrome_browser = p.chromium.launch(headless=True, args=get_pdf_browser_args())
+	chrome_context = chrome_browser.new_context()
+	chrome_page = chrome_context.new_page()
+	return chrome_browser, chrome_page
+
+
+def human_mouse_move(page, steps=8):
+	"""Move the mouse along a random cubic Bezier curve with real (trusted) input events"""
+	points = [(random.randint(100, 900), random.randint(100, 600)) for _ in range(4)]
+	for i in range(1, steps + 1):
+		t = i / steps
+		u = 1 - t
+		x, y = (u**3 * points[0][k] + 3 * u**2 * t * points[1][k] + 3 * u * t**2 * points[2][k] + t**3 * points[3][k] for k in (0, 1))
+		page.mouse.move(x, y)
+
+
+def open_start_page(page):
+	"""Open START_URL, get past any CAPTCHA and the cookie banner"""
+	# Move the mouse along a curve to simulate human behavior
+	human_mouse_move(page)
+	
+	logger.info(f"Navigating to {START_URL}...")
+	try:
+		page.goto(START_URL, wait_until="domcontentloaded", timeout=60000)
+		logger.info("Navigation completed successfully")
+	except Exception as e:
+		logger.warning(f"Navigation completed with warning: {e}")
+		# Continue anyway - page might still be usable
+	wait_ready(page, START_READY_SELECTOR)
+	
+	# Remove cookie modal immediately after initial navigation
+	force_remove_cookie_modal(page)
+	
+	# Check for CAPTCHA FIRST (DataDome appears before cookie consent)
+	logger.info("\n🔍 Checking for CAPTCHA on initial page...")
+	try:
+		status = page.evaluate(_CAPTCHA_STATUS_JS, [DATADOME_SELECTORS, CANLII_CAPTCHA_SELECTORS, CANLII_CAPTCHA_TEXTS, ACCESS_RESTRICTED_PHRASES])
+		logger.info(f"DataDome CAPTCHA: {'DETECTED' if status['dd'] else 'not found'}")
+		logger.info(f"CanLII CAPTCHA: {'DETECTED' if status['canlii'] else 'not found'}")
+	except Exception as e:
+		logger.error(f"Error during CAPTCHA check: {e}")
+		# Fall back to the full multi-frame check
+		status = {"dd": False, "canlii": is_captcha_page(page), "restricted": False}
+	
+	if status["dd"] or status["canlii"] or status["restricted"]:
+		logger.warning("\n⚠️  CAPTCHA detected on initial page!")
+		auto_solved = solve_captcha_automatically(page)
+		if not auto_solved:
+			logger.info("Please solve the CAPTCHA in the browser window...")
+			wait_for_manual_captcha_solve(page)
+			logger.info("✅ CAPTCHA solved! Continuing...")
+		
+		# Give the page a chance to auto-reload, stopping as soon as the content shows up
+		logger.info("Waiting for page to stabilize...")
+		content_loaded = wait_for_condition(page, lambda: page.locator("h2", has_text=SECTION_TITLE).count() > 0, timeout=8000)
+		
+		# Check if we are already on the page with content
+		if content_loaded:
+			logger.info("Page content appears loaded, skipping reload.")
+		else:
+			logger.info("Reloading page explicitly...")
+			try:
+				reload_after_captcha(page, START_URL, timeout=60000)
+			except Exception as e:
+				logger.warning(f"Navigation timeout after CAPTCHA, continuing anyway: {e}")
+			wait_ready(page, START_READY_SELECTOR)
+		
+		# Remove cookie modal again after CAPTCHA solving
+		force_remove_cookie_modal(page)
+	
+	# Handle cookie consent (only after CAPTCHA is solved)
+	logger.info("Checking for cookie banner...")
+	handle_cookie_consent(page)
+	
+	try:
+		page.wait_for_load_state("load", timeout=10000)
+	except:
+		pass
+	wait_ready(page, START_READY_SELECTOR)
+
+
 def main():
 	# Create output directory
 	os.makedirs(OUTPUT_DIR, exist_ok=True)
@@ -1863,120 +2553,14 @@ def main():
 	print(f"Loaded tracking data: {len(tracking_data.get('processed_documents', []))} documents already processed")
 	
 	with sync_playwright() as p:
-		# Determine headless mode:
-		# - Default to HEADLESS=False on Windows (for debug)
-		# - Default to HEADLESS=True on Linux (for server)
-		# - Allow override via env var
-		system_os = platform.system()
-		env_headless = os.getenv("HEADLESS")
-		
-		if env_headless is not None:
-			is_headless = env_headless.lower() == "true"
-		else:
-			is_headless = system_os == "Linux"
-			
-		logger.info(f"Running on {system_os}, Headless: {is_headless}")
-
-		logger.info("Launching Firefox browser...")
-		browser = p.firefox.launch(
-			headless=is_headless,
-			args=get_firefox_launch_args(),
-			firefox_user_prefs=get_firefox_user_prefs()
-		)
+		browser, page = launch_browser(p)
+		chrome_browser, chrome_page = launch_pdf_browser(p)
+		open_start_page(page)
+		# Save right away so even an interrupted run leaves a usable state behind
+		save_storage_state(page.context)
 		
-		logger.info("Creating browser context...")
-		context = browser.new_context(
-			viewport={"width": 1920, "height": 1080},
-			user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:135.0) Gecko/20100101 Firefox/135.0",
-			locale="en-US",
-			timezone_id="America/Toronto",
-			permissions=["geolocation"],
-			geolocation={"latitude": 45.4215, "longitude": -75.6972} # Ottawa
-		)
-		
-		# Inject all stealth scripts
-		logger.info("Injecting stealth scripts...")
-		for script in get_stealth_scripts():
-			context.add_init_script(script)
-
-		logger.info("Creating new page...")
-		page = context.new_page()
-		
-		# Create Chrome browser for PDF generation
-		logger.info("Launching Chrome browser for PDF generation...")
-		chrome_browser = p.chromium.launch(headless=True)
-		chrome_context = chrome_browser.new_context()
-		chrome_page = chrome_context.new_page()
-		
-		# Add random mouse movement to simulate human behavior
-		page.mouse.move(random.randint(100, 500), random.randint(100, 500))
-		
-		logger.info(f"Navigating to {START_URL}...")
-		try:
-			page.goto(START_URL, wait_until="domcontentloaded", timeout=60000)
-			logger.info("Navigation completed successfully")
-		except Exception as e:
-			logger.warning(f"Navigation completed with warning: {e}")
-			# Continue anyway - page might still be usable
-		page.wait_for_timeout(WAIT_MS)
-		
-		# Remove cookie modal immediately after initial navigation
-		force_remove_cookie_modal(page)
-		
-		# Check for CAPTCHA FIRST (DataDome appears before cookie consent)
-		logger.info("\n🔍 Checking for CAPTCHA on initial page...")
-		try:
-			datadome_detected = is_datadome_captcha(page, silent=True)  # Silent to avoid spam
-			canlii_detected = page.locator("#captchaTag").count() > 0
-			logger.info(f"DataDome CAPTCHA: {'DETECTED' if datadome_detected else 'not found'}")
-			logger.info(f"CanLII CAPTCHA: {'DETECTED' if canlii_detected else 'not found'}")
-		except Exception as e:
-			logger.error(f"Error during CAPTCHA check: {e}")
-			datadome_detected = None
-			canlii_detected = False
-		
-		if datadome_detected or canlii_detected or is_captcha_page(page):
-			logger.warning("\n⚠️  CAPTCHA detected on initial page!")
-			auto_solved = solve_captcha_automatically(page)
-			if not auto_solved:
-				logger.info("Please solve the CAPTCHA in the browser window...")
-				while is_captcha_page(page):
-					page.wait_for_timeout(5000)
-				logger.info("✅ CAPTCHA solved! Continuing...")
-			page.wait_for_timeout(3000)
-			
-			# Wait briefly to see if page auto-reloads
-			logger.info("Waiting for page to stabilize...")
-			page.wait_for_timeout(5000)
-			
-			# Check if we are already on the page with content
-			if page.locator("h2", has_text=SECTION_TITLE).count() > 0:
-				logger.info("Page content appears loaded, skipping reload.")
-			else:
-				logger.info("Reloading page explicitly...")
-				try:
-					page.goto(START_URL, wait_until="commit", timeout=60000)
-					try:
-						page.wait_for_load_state("domcontentloaded", timeout=60000)
-					except:
-						pass
-				except Exception as e:
-					logger.warning(f"Navigation timeout after CAPTCHA, continuing anyway: {e}")
-				
-			page.wait_for_timeout(WAIT_MS)
-			
-			# Remove cookie modal again after CAPTCHA solving
-			force_remove_cookie_modal(page)
-		
-		# Handle cookie consent (only after CAPTCHA is solved)
-		logger.info("Checking for cookie banner...")
-		handle_cookie_consent(page)
-		
-		try:
-			page.wait_for_load_state("load", timeout=10000)
-		except:
-			pass
-		page.wait_for_timeout(WAIT_MS)
+		# Extra browsers for documents, each on its own thread
+		worker_threads = start_document_workers(tracking_data) if DOCUMENT_WORKERS > 1 else []
 		
 		# Step 1: Collect category links
 		print("\n=== Collecting legislation category links ===")
@@ -1990,33 +2574,45 @@ def main():
 				auto_solved = solve_captcha_automatically(page)
 				if not auto_solved:
 					print("    Please solve the CAPTCHA in the browser window...")
-					while is_captcha_page(page):
-						page.wait_for_timeout(5000)
+					wait_for_manual_captcha_solve(page)
 					print("✅ CAPTCHA solved! Continuing...")
-				page.wait_for_timeout(2000)
+				wait_for_condition(page, lambda: not is_captcha_page(page), timeout=2000)
 				# Reload and try again
-				page.goto(START_URL, wait_until="load")
-				try:
-					page.wait_for_load_state("load", timeout=30000)
-				except:
-					pass
-				page.wait_for_timeout(WAIT_MS)
+				reload_after_captcha(page, START_URL)
+				wait_ready(page, START_READY_SELECTOR)
 				category_links = collect_category_links(page, SECTION_TITLE)
 				print(f"Found {len(category_links)} category links after CAPTCHA")
 		
-		total_processed = 0
+		# Per-row processed counts, shared by all categories and browsers
+		results = []
+		fast_listing = True  # Category listings fetched over HTTP instead of rendered
+		prefetch_page = None  # Second page loading the next category in the background
+		prefetched_url = None
+		prefetch_response = None
 		
 		# Step 2: Live Processing per category
 		for i, category_href in enumerate(category_links, 1):
 			print(f"\n=== Processing category {i}/{len(category_links)}: {category_href} ===")
 			
 			category_url = f"{BASE_URL}{category_href}"
-			page.goto(category_url, wait_until="load")
-			try:
-				page.wait_for_load_state("load", timeout=30000)
-			except:
-				pass
-			page.wait_for_timeout(WAIT_MS)
+			
+			# Plain HTTP fetch first; the first category decides whether the fast path works for this site
+			rows = fetch_category_rows_fast(page, category_url) if fast_listing else None
+			if rows is not None:
+				print(f"  Fetched {len(rows)} rows over HTTP")
+				queued = process_category_page(page, chrome_page, tracking_data, category_url, results, rows)
+				print(f"  Queued {queued} rows from category {i}/{len(category_links)}")
+				continue
+			if i == 1:
+				fast_listing = False
+			
+			if prefetched_url == category_url and prefetch_response is not None and prefetch_response.ok:
+				# Already loading in the second page while the previous category was processed
+				page, prefetch_page = prefetch_page, page
+			else:
+				# The page is usable once the table rows are attached; no need to wait for every subresource
+				page.goto(category_url, wait_until="domcontentloaded")
+			wait_ready(page, CATEGORY_READY_SELECTOR)
 			
 			# Remove cookie modal after category navigation
 			force_remove_cookie_modal(page)
@@ -2027,26 +2623,47 @@ def main():
 				auto_solved = solve_captcha_automatically(page)
 				if not auto_solved:
 					print("    Please solve the CAPTCHA in the browser window...")
-					while is_captcha_page(page):
-						page.wait_for_timeout(5000)
+					wait_for_manual_captcha_solve(page)
 					print("✅ CAPTCHA solved! Continuing...")
-				page.wait_for_timeout(2000)
+				wait_for_condition(page, lambda: not is_captcha_page(page), timeout=2000)
 				# Reload the category page
-				page.goto(category_url, wait_until="load")
-				page.wait_for_load_state("networkidle")
-				page.wait_for_timeout(WAIT_MS)
+				reload_after_captcha(page, category_url)
+				wait_ready(page, CATEGORY_READY_SELECTOR)
 				# Remove cookie modal after reload
 				force_remove_cookie_modal(page)
 			
+			# Start loading the next category in the second page while this one is processed
+			# (only when listings go through the browser; the HTTP fast path would never use the page)
+			prefetched_url = None
+			if not fast_listing and i < len(category_links):
+				if prefetch_page is None:
+					prefetch_page = page.context.new_page()
+					flag_captcha_responses(prefetch_page)
+				prefetched_url = f"{BASE_URL}{category_links[i]}"
+				prefetch_response = start_navigation(prefetch_page, prefetched_url)
+			
 			# Process all items in this category immediately
-			count = process_category_page(page, chrome_page, tracking_data, category_url)
-			total_processed += count
+			queued = process_category_page(page, chrome_page, tracking_data, category_url, results)
+			print(f"  Queued {queued} rows from category {i}/{len(category_links)}")
+		
+		# Wait for rows still being processed by document workers
+		_ITEM_QUEUE.join()
+		total_queued = sum(results)
+		
+		stop_document_workers(worker_threads)
+		# Let the last uploads finish so they get tracked and counted
+		wait_for_pending_uploads()
 		
 		print(f"\n=== Scraping Complete ===")
-		print(f"Total documents downloaded: {total_processed}")
+		print(f"Documents rendered and queued: {total_queued}")
+		print(f"Total documents uploaded: {_UPLOAD_RESULTS['uploaded']} ({_UPLOAD_RESULTS['failed']} failed)")
 		print(f"PDFs saved in S3: s3://{S3_BUCKET_NAME}/")
 		
-		chrome_browser.close()
+		_UPLOAD_POOL.shutdown()
+		close_tracking_log()
+		save_storage_state(page.context)
+		if chrome_browser:
+			chrome_browser.close()
 		browser.close()
 
 
@@ -6,8 +6,6 @@ import random
 import io
 import boto3
 import requests
-import tempfile
-import whisper
 from dotenv import load_dotenv
 import platform
 from PIL import Image
@@ -41,6 +39,9 @@ TRACKING_FILE = "court_tracking.json"
 ACCESS_RESTRICTED_WAIT_MIN = 10  # Minimum wait time in minutes
 ACCESS_RESTRICTED_WAIT_MAX = 20  # Maximum wait time in minutes
 
+# Whisper model is loaded lazily on the first audio CAPTCHA and reused afterwards
+_WHISPER_MODEL = None
+
 
 def is_access_restricted_page(page):
 	"""Check if the page shows an access restricted/IP blocked message"""
@@ -557,43 +558,40 @@ def solve_canlii_audio_captcha(page):
 		return False
 
 
+def get_whisper_model():
+	"""Get the shared Whisper model, loading it on first use"""
+	global _WHISPER_MODEL
+	if _WHISPER_MODEL is None:
+		import ctranslate2
+		from faster_whisper import WhisperModel
+		
+		# Run on the GPU in float16 when CUDA is available, otherwise int8 on CPU
+		if ctranslate2.get_cuda_device_count() > 0:
+			device, compute_type = "cuda", "float16"
+		else:
+			device, compute_type = "cpu", "int8"
+		
+		logger.info(f"⏳ Loading Whisper model (base, {device}/{compute_type})...")
+		# This will download the model on first run
+		_WHISPER_MODEL = WhisperModel("base", device=device, compute_type=compute_type)
+	return _WHISPER_MODEL
+
+
 def transcribe_audio_captcha(audio_data):
 	"""Transcribe audio CAPTCHA using local Whisper model"""
-	temp_path = None
 	try:
-		# Save audio to temp file
-		with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-			f.write(audio_data)
-			temp_path = f.name
-		
-		print("    ⏳ Loading Whisper model (base)...")
-		# Load the model (this will download it on first run - approx 140MB)
-		model = whisper.load_model("base")
-		
-		# Suppress FP16 warning on CPU
-		import warnings
-		warnings.filterwarnings("ignore", message="FP16 is not supported on CPU")
+		model = get_whisper_model()
 		
 		logger.info("Transcribing audio...")
-		result = model.transcribe(temp_path)
-		transcript = result["text"]
+		# faster-whisper decodes the in-memory file itself - no temp file needed
+		segments, _ = model.transcribe(io.BytesIO(audio_data), language="en")
+		transcript = "".join(segment.text for segment in segments)
 		
 		# Extract only digits
-		numbers = re.sub(r'[^0-9]', '', transcript)
-		
-		# Clean up
-		if temp_path and os.path.exists(temp_path):
-			os.unlink(temp_path)
-			
-		return numbers
+		return re.sub(r'[^0-9]', '', transcript)
 			
 	except Exception as e:
 		logger.error(f"⚠️  Transcription error: {e}")
-		if temp_path and os.path.exists(temp_path):
-			try:
-				os.unlink(temp_path)
-			except:
-				pass
 		return None
 
 
@@ -0,0 +1,109 @@
+import pytest
+
+boards = pytest.importorskip("boards_tribunals_links")
+
+
+def parse_listing(html):
+	parser = boards.DecisionListingParser()
+	parser.feed(html)
+	parser.close()
+	return parser
+
+
+def test_listing_parser_collects_canlii_links_inside_listing():
+	parser = parse_listing("""
+		<a class="canlii" href="/outside">Outside</a>
+		<table id="decisionsListing">
+			<tr><td><a class="canlii" href="/en/on/onlat/doc/2024/1.html">
+				Smith v. Jones </a></td></tr>
+			<tr><td><a class="other" href="/not-a-decision">Other</a></td></tr>
+			<tr><td><a class="canlii" href="/en/on/onlat/doc/2024/2.html">Doe v. Roe</a></td></tr>
+		</table>
+		<a class="canlii" href="/after">After</a>
+	""")
+	assert parser.found_listing
+	assert parser.rows == [
+		{"href": "/en/on/onlat/doc/2024/1.html", "text": "Smith v. Jones"},
+		{"href": "/en/on/onlat/doc/2024/2.html", "text": "Doe v. Roe"},
+	]
+
+
+def test_listing_parser_tracks_nested_tags_of_the_listing_type():
+	parser = parse_listing("""
+		<div id="decisionsListing">
+			<div><a class="canlii" href="/a">A</a></div>
+			<div><a class="canlii" href="/b">B</a></div>
+		</div>
+		<div><a class="canlii" href="/c">C</a></div>
+	""")
+	assert [row["href"] for row in parser.rows] == ["/a", "/b"]
+
+
+def test_listing_parser_reports_missing_listing():
+	parser = parse_listing('<a class="canlii" href="/a">A</a>')
+	assert not parser.found_listing
+	assert parser.rows == []
+
+
+def parse_decision(html):
+	parser = boards.DecisionPageParser()
+	parser.feed(html)
+	parser.close()
+	return parser
+
+
+def test_decision_parser_reads_title_and_pdf_link():
+	parser = parse_decision("""
+		<h1 class="page-title main-title">
+			Smith v. Jones,
+			2024 ONLAT 12
+		</h1>
+		<a id="pdf-link" href="/en/on/onlat/doc/2024/12.pdf">PDF</a>
+	""")
+	assert parser.title == "Smith v. Jones, 2024 ONLAT 12"
+	assert parser.pdf_href == "/en/on/onlat/doc/2024/12.pdf"
+
+
+def test_decision_parser_keeps_first_title_and_link():
+	parser = parse_decision("""
+		<h1 class="other">Site header</h1>
+		<h1 class="main-title">First</h1>
+		<h1 class="main-title">Second</h1>
+		<a id="pdf-link" href="/first.pdf"></a>
+		<a id="pdf-link" href="/second.pdf"></a>
+	""")
+	assert parser.title == "First"
+	assert parser.pdf_href == "/first.pdf"
+
+
+def test_decision_parser_without_title_or_pdf():
+	parser = parse_decision('<h1 class="main-title">   </h1><p>No PDF</p>')
+	assert parser.title is None
+	assert parser.pdf_href is None
+
+
+@pytest.mark.parametrize("transcript, digits", [
+	("four 2 nine", "429"),
+	("Four, two... NINE!", "429"),
+	("uh five six [unk] seven", "567"),
+	("12 three", "123"),
+	("", ""),
+])
+def test_digits_from_transcript(transcript, digits):
+	assert boards._digits_from_transcript(transcript) == digits
+
+
+def test_make_s3_key_prefixes_legacy_key_with_url_hash():
+	url = "https://www.canlii.org/en/on/onlat/doc/2024/2024onlat12/2024onlat12.html"
+	key = boards.make_s3_key(url, 'Smith v. Jones: 2024/12 "final"')
+	prefix, name = key.split("/", 1)
+	assert len(prefix) == 2 and int(prefix, 16) >= 0
+	assert name == boards.legacy_s3_key('Smith v. Jones: 2024/12 "final"')
+	assert name == "Smith v. Jones_ 2024_12 _final_.pdf"
+	assert boards.make_s3_key(url, "Other title").startswith(prefix + "/")
+
+
+def test_s3_keys_truncate_long_titles():
+	title = "x" * 300
+	assert boards.legacy_s3_key(title) == "x" * 200 + ".pdf"
+	assert boards.make_s3_key("https://example.com/a", title).endswith("/" + "x" * 200 + ".pdf")
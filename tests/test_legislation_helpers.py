@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+scrapper = pytest.importorskip("canada_law_scrapper")
+
+
+@pytest.mark.parametrize("image_bytes, image_format", [
+	(b"\x89PNG\r\n\x1a\n" + b"\x00" * 16, "png"),
+	(b"\xff\xd8\xff\xe0" + b"\x00" * 16, "jpeg"),
+	(b"GIF89a" + b"\x00" * 16, "gif"),
+	(b"RIFF\x24\x00\x00\x00WEBPVP8 " + b"\x00" * 16, "webp"),
+	(b"RIFF\x24\x00\x00\x00WAVEfmt " + b"\x00" * 16, "png"),
+	(b"", "png"),
+])
+def test_detect_image_format(image_bytes, image_format):
+	assert scrapper.detect_image_format(image_bytes) == image_format
+
+
+def read_lines(path):
+	return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+@pytest.fixture
+def tracking_dir(tmp_path, monkeypatch):
+	monkeypatch.chdir(tmp_path)
+	return tmp_path
+
+
+def test_load_tracking_data_migrates_legacy_json_and_compacts_log(tracking_dir):
+	(tracking_dir / scrapper.LEGACY_TRACKING_FILE).write_text(json.dumps({
+		"processed_keys": ["a"],
+		"processed_documents": [{"key": "b", "s3_key": "b.pdf"}],
+	}), encoding="utf-8")
+	(tracking_dir / scrapper.TRACKING_FILE).write_text(
+		'{"key": "b", "s3_key": "b.pdf"}\n'
+		'\n'
+		'{"key": "c", "s3_key": "c.pdf"}\n'
+		'{"key": "d", "s3_ke',  # Partially written line from a crash
+		encoding="utf-8",
+	)
+	
+	data = scrapper.load_tracking_data()
+	
+	assert data["_key_set"] == {"a", "b", "c"}
+	assert [doc["key"] for doc in data["processed_documents"]] == ["a", "b", "c"]
+	assert read_lines(tracking_dir / scrapper.TRACKING_FILE) == [
+		{"key": "a"},
+		{"key": "b", "s3_key": "b.pdf"},
+		{"key": "c", "s3_key": "c.pdf"},
+	]
+	assert not (tracking_dir / (scrapper.TRACKING_FILE + ".tmp")).exists()
+
+
+def test_load_tracking_data_is_stable_across_restarts(tracking_dir):
+	(tracking_dir / scrapper.TRACKING_FILE).write_text('{"key": "a"}\n{"key": "a"}\n', encoding="utf-8")
+	
+	first = scrapper.load_tracking_data()
+	log = (tracking_dir / scrapper.TRACKING_FILE).read_text(encoding="utf-8")
+	second = scrapper.load_tracking_data()
+	
+	assert first["_key_set"] == second["_key_set"] == {"a"}
+	assert (tracking_dir / scrapper.TRACKING_FILE).read_text(encoding="utf-8") == log
+	assert read_lines(tracking_dir / scrapper.TRACKING_FILE) == [{"key": "a"}]
+
+
+def test_load_tracking_data_without_files(tracking_dir):
+	data = scrapper.load_tracking_data()
+	
+	assert data["processed_documents"] == []
+	assert data["_key_set"] == set()
+	assert (tracking_dir / scrapper.TRACKING_FILE).read_text(encoding="utf-8") == ""
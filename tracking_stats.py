@@ -1,5 +1,6 @@
 import json
 import os
+import sqlite3
 from datetime import datetime
 from collections import defaultdict
 
@@ -17,6 +18,47 @@ def load_tracking_file(filepath):
         return None
 
 
+def load_tracking_jsonl(filepath):
+    """Load an append-only JSONL tracking log (one document per line)"""
+    if not os.path.exists(filepath):
+        print(f"⚠️  File not found: {filepath}")
+        return None
+    
+    try:
+        documents = []
+        with open(filepath, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        documents.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+        return {"processed_documents": documents}
+    except Exception as e:
+        print(f"❌ Error loading {filepath}: {e}")
+        return None
+
+
+def load_tracking_db(filepath):
+    """Load a SQLite tracking database"""
+    if not os.path.exists(filepath):
+        print(f"⚠️  File not found: {filepath}")
+        return None
+    
+    try:
+        conn = sqlite3.connect(filepath, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            rows = conn.execute("SELECT url, title, pdf_url, s3_key, downloaded_at FROM processed").fetchall()
+        finally:
+            conn.close()
+        return {"processed_documents": [dict(row) for row in rows]}
+    except Exception as e:
+        print(f"❌ Error loading {filepath}: {e}")
+        return None
+
+
 def analyze_tracking_data(data, name):
     """Analyze tracking data and print statistics"""
     if not data:
@@ -80,8 +122,16 @@ def main():
     
     # Load tracking files
     courts_data = load_tracking_file("court_tracking.json")
-    boards_data = load_tracking_file("boards_tracking.json")
-    legislation_data = load_tracking_file("download_tracking.json")
+    if os.path.exists("boards_tracking.db"):
+        boards_data = load_tracking_db("boards_tracking.db")
+    elif os.path.exists("boards_tracking.jsonl"):
+        boards_data = load_tracking_jsonl("boards_tracking.jsonl")
+    else:
+        boards_data = load_tracking_file("boards_tracking.json")
+    if os.path.exists("download_tracking.jsonl"):
+        legislation_data = load_tracking_jsonl("download_tracking.jsonl")
+    else:
+        legislation_data = load_tracking_file("download_tracking.json")
     
     # Analyze each tracking file
     courts_total = analyze_tracking_data(courts_data, "Courts")